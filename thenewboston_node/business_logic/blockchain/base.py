@@ -1,34 +1,93 @@
-import copy
 import logging
+import os
+import threading
+import time
 import warnings
-from itertools import chain, dropwhile, islice
-from typing import Generator, Iterable, Optional, Type, TypeVar, cast
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from itertools import chain, dropwhile, islice, repeat
+from typing import Generator, Iterable, Optional, Type, TypeVar
 
 from django.conf import settings
 
 from more_itertools import always_reversible, ilen
 
 from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.indexes.account_balance_index import AccountBalanceIndex
+from thenewboston_node.business_logic.indexes.account_postings import AccountPostings
+from thenewboston_node.business_logic.indexes.validation_checkpoint import ValidationCheckpoint
 from thenewboston_node.business_logic.models.account_balance import AccountBalance, BlockAccountBalance
-from thenewboston_node.business_logic.models.account_root_file import AccountRootFile
+from thenewboston_node.business_logic.models.account_root_file import (
+    AccountRootFile, AccountRootFileView, AnyAccountRootFile
+)
 from thenewboston_node.business_logic.models.transfer_request import TransferRequest
 from thenewboston_node.core.logging import timeit, timeit_method, validates
+from thenewboston_node.core.utils.concurrency import iter_in_background
 from thenewboston_node.core.utils.importing import import_from_string
 
 from ..models.block import Block
+from .pending_blocks import PendingBlocks
+from .signatures import iter_signature_validated_blocks
 
 T = TypeVar('T', bound='BlockchainBase')
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_VALIDATION_CHECKPOINT_PERIOD_IN_BLOCKS = 1000
+
+# Number of decoded blocks waiting for validation in the validation pipeline
+VALIDATION_PIPELINE_QUEUE_SIZE = 1000
+
+
+def log_validation_progress(validated_count, last_block_number, start_time):
+    duration = time.perf_counter() - start_time
+    logger.info(
+        'Validated %s blocks up to block number %s in %.3f seconds (%.1f blocks/s)', validated_count,
+        last_block_number, duration, validated_count / duration if duration else 0
+    )
+
 
 class BlockchainBase:
 
     _instance = None
 
-    def __init__(self, arf_creation_period_in_blocks=None):
+    def __init__(
+        self,
+        arf_creation_period_in_blocks=None,
+        use_balance_index=True,
+        use_account_postings=True,
+        make_account_root_file_in_background=False,
+        signature_validation_workers: Optional[int] = None,
+        use_validation_pipeline=False,
+    ):
         self.arf_creation_period_in_blocks = arf_creation_period_in_blocks
 
+        # Signatures of persisted blocks can be validated in a thread pool (see validate_blocks())
+        self.signature_validation_workers = signature_validation_workers
+
+        # Persisted blocks can be read and decoded in background threads while they are being validated
+        # (see _iter_blocks_to_validate()), signatures are validated in a thread pool then
+        self.use_validation_pipeline = use_validation_pipeline
+
+        # Periodic account root files can be made in background thread (see schedule_account_root_file())
+        self.make_account_root_file_in_background = make_account_root_file_in_background
+        self.account_root_file_future: Optional[Future] = None
+        self._account_root_file_executor: Optional[ThreadPoolExecutor] = None
+        self._published_account_root_files: deque[AccountRootFile] = deque()
+        # Account root files storage and caches are not thread-safe, so persisting account root file in background
+        # thread and accessing persisted account root files are serialized
+        self._account_root_files_lock = threading.RLock()
+
+        # Head state balances are served from in-memory index (if enabled) which is maintained by add_block()
+        self.use_balance_index = use_balance_index
+        self.balance_index: Optional[AccountBalanceIndex] = None
+
+        # Historical balances are served by looking up the last block that updated the account balance
+        self.use_account_postings = use_account_postings
+        self.account_postings: Optional[AccountPostings] = None
+
+        self._validation_checkpoint: Optional[ValidationCheckpoint] = None
+
     @classmethod
     def get_instance(cls: Type[T]) -> T:
         instance = cls._instance
@@ -76,12 +135,24 @@ class BlockchainBase:
         yield from always_reversible(self.iter_account_root_files())
 
     # ** Blocks related override recommended methods
+    def persist_blocks(self, blocks: list[Block]):
+        # Override this method if a particular blockchain implementation can persist several blocks faster
+        for block in blocks:
+            self.persist_block(block)
+
     def get_block_count(self) -> int:
         # Highly recommended to override this method in the particular implementation of the blockchain for
         # performance reasons
         warnings.warn('Using low performance implementation of get_block_count() method (override it)')
         return ilen(self.iter_blocks())
 
+    def get_validation_checkpoint(self) -> Optional[ValidationCheckpoint]:
+        # Override this method (and set_validation_checkpoint()) to make validation checkpoint durable
+        return self._validation_checkpoint
+
+    def set_validation_checkpoint(self, checkpoint: Optional[ValidationCheckpoint]):
+        self._validation_checkpoint = checkpoint
+
     def iter_blocks_from(self, block_number: int) -> Generator[Block, None, None]:
         # TODO(dmu) HIGH: Implement higher performance iter_blocks_from() in child classes
         warnings.warn(
@@ -114,15 +185,16 @@ class BlockchainBase:
     def add_account_root_file(self, account_root_file: AccountRootFile):
         account_root_file.validate(is_initial=account_root_file.is_initial())
         self.persist_account_root_file(account_root_file)
+        self._rebase_balance_index(account_root_file)
 
-    def get_first_account_root_file(self) -> Optional[AccountRootFile]:
+    def get_first_account_root_file(self) -> Optional[AnyAccountRootFile]:
         # Override this method if a particular blockchain implementation can provide a high performance
         try:
             return next(self.iter_account_root_files())
         except StopIteration:
             return None
 
-    def get_last_account_root_file(self) -> Optional[AccountRootFile]:
+    def get_last_account_root_file(self) -> Optional[AnyAccountRootFile]:
         # Override this method if a particular blockchain implementation can provide a high performance
         try:
             return next(self.iter_account_root_files_reversed())
@@ -142,10 +214,86 @@ class BlockchainBase:
         # TODO(dmu) HIGH: Validate block_identifier
 
         self.persist_block(block)
+        self._update_balance_index(block)
+        self._update_account_postings(block)
 
         period = self.arf_creation_period_in_blocks
         if period is not None and (block_number + 1) % period == 0:
-            self.make_account_root_file()
+            if self.make_account_root_file_in_background:
+                self.schedule_account_root_file()
+            else:
+                self.make_account_root_file()
+
+    def add_blocks(self, blocks: Iterable[Block], validate=True, batch_size=1000) -> int:
+        """
+        Add consecutive blocks (for instance, received from a peer while catching up) and return the number of
+        added blocks. Blocks are validated against in-memory state of the preceding blocks and persisted in batches
+        of `batch_size`, periodic account root file is made (at most once) after the last batch. If a block is
+        invalid the blocks before it are added and ValidationError is raised.
+        """
+        start = time.perf_counter()
+        added_count = 0
+        is_account_root_file_due = False
+        pending_blocks: Optional[PendingBlocks] = None
+        try:
+            for block in blocks:
+                if pending_blocks is None:
+                    pending_blocks = PendingBlocks(self)
+
+                if validate:
+                    pending_blocks.validate_block(block)
+
+                pending_blocks.add(block)
+                if len(pending_blocks) >= batch_size:
+                    # Pending blocks are taken out before persisting, so they are never persisted twice
+                    batch_blocks, pending_blocks = pending_blocks.blocks, None
+                    is_account_root_file_due |= self._add_pending_blocks(batch_blocks)
+                    added_count += len(batch_blocks)
+        except ValidationError:
+            # Blocks preceding the invalid block are valid, so they are added before the exception is reraised
+            if pending_blocks:
+                is_account_root_file_due |= self._add_pending_blocks(pending_blocks.blocks)
+                added_count += len(pending_blocks)
+
+            self._on_blocks_added(added_count, is_account_root_file_due, start)
+            raise
+
+        # Other exceptions (for instance, I/O errors) are reraised as is: blocks may have been partially persisted,
+        # so account root file is not made
+        if pending_blocks:
+            is_account_root_file_due |= self._add_pending_blocks(pending_blocks.blocks)
+            added_count += len(pending_blocks)
+
+        self._on_blocks_added(added_count, is_account_root_file_due, start)
+        return added_count
+
+    def _on_blocks_added(self, added_count: int, is_account_root_file_due: bool, start: float):
+        if is_account_root_file_due:
+            if self.make_account_root_file_in_background:
+                self.schedule_account_root_file()
+            else:
+                self.make_account_root_file()
+
+        duration = time.perf_counter() - start
+        logger.info(
+            'Added %s blocks in %.3f seconds (%.1f blocks/s)', added_count, duration,
+            added_count / duration if duration else 0
+        )
+
+    def _add_pending_blocks(self, blocks: list[Block]) -> bool:
+        """
+        Persist blocks and update indexes. Return True if a periodic account root file is due.
+        """
+        self.persist_blocks(blocks)
+        for block in blocks:
+            self._update_balance_index(block)
+            self._update_account_postings(block)
+
+        period = self.arf_creation_period_in_blocks
+        if period is None:
+            return False
+
+        return any((block.message.block_number + 1) % period == 0 for block in blocks)
 
     def get_first_block(self) -> Optional[Block]:
         # Override this method if a particular blockchain implementation can provide a high performance
@@ -199,7 +347,12 @@ class BlockchainBase:
         Return balance value before `before_block_number` is applied. If `before_block_number` is not specified it
         defaults to the next block number.
         """
-        block_number = self.validate_before_block_number(before_block_number) - 1
+        before_block_number = self.validate_before_block_number(before_block_number)
+        balance_index = self._get_balance_index(before_block_number)
+        if balance_index is not None:
+            return balance_index.get_balance_value(account)
+
+        block_number = before_block_number - 1
         balance_value = self._get_balance_value_from_block(account, block_number)
         if balance_value is None:
             balance_value = self._get_balance_value_from_account_root_file(account, block_number)
@@ -212,7 +365,12 @@ class BlockchainBase:
         Return balance lock before `before_block_number` is applied. If `before_block_number` is not specified it
         defaults to the next block number.
         """
-        block_number = self.validate_before_block_number(before_block_number) - 1
+        before_block_number = self.validate_before_block_number(before_block_number)
+        balance_index = self._get_balance_index(before_block_number)
+        if balance_index is not None:
+            return balance_index.get_balance_lock(account)
+
+        block_number = before_block_number - 1
         lock = self._get_balance_lock_from_block(account, block_number)
         if lock:
             return lock
@@ -226,6 +384,139 @@ class BlockchainBase:
             lock=self.get_balance_lock(account),
         )
 
+    def _get_balance_index(self, before_block_number: int) -> Optional[AccountBalanceIndex]:
+        if not self.use_balance_index:
+            return None
+
+        balance_index = self.balance_index
+        if balance_index is not None and balance_index.next_block_number == before_block_number:
+            return balance_index
+
+        if before_block_number != self.get_next_block_number():
+            return None  # the index serves head state only
+
+        if balance_index is not None and balance_index.next_block_number < before_block_number:
+            # Blocks were added bypassing add_block() (for example, by another process)
+            return self._catch_up_balance_index(balance_index, before_block_number)
+
+        return self._make_balance_index()
+
+    def _catch_up_balance_index(self, balance_index: AccountBalanceIndex,
+                                next_block_number: int) -> Optional[AccountBalanceIndex]:
+        for block in self.iter_blocks_from(balance_index.next_block_number):
+            if block.message.block_number >= next_block_number:
+                break
+
+            balance_index.apply_block(block)
+
+        if balance_index.next_block_number != next_block_number:
+            return self._make_balance_index()
+
+        return balance_index
+
+    @timeit_method(level=logging.INFO)
+    def _make_balance_index(self) -> Optional[AccountBalanceIndex]:
+        self.balance_index = None
+
+        account_root_file = self.get_closest_account_root_file()
+        if account_root_file is None:
+            return None
+
+        balance_index = AccountBalanceIndex(account_root_file)
+        for block in self.iter_blocks_from(balance_index.next_block_number):
+            balance_index.apply_block(block)
+
+        if balance_index.next_block_number != self.get_next_block_number():
+            logger.warning('Could not make account balance index: blocks are missing')
+            return None
+
+        self.balance_index = balance_index
+        return balance_index
+
+    def _rebase_balance_index(self, account_root_file: AccountRootFile):
+        balance_index = self.balance_index
+        if balance_index is None:
+            return
+
+        base_next_block_number = balance_index.account_root_file.get_next_block_number()
+        if base_next_block_number < account_root_file.get_next_block_number() <= balance_index.next_block_number:
+            balance_index.rebase(account_root_file)
+
+    def _update_balance_index(self, block: Block):
+        published_account_root_files = self._published_account_root_files
+        while published_account_root_files:
+            self._rebase_balance_index(published_account_root_files.popleft())
+
+        balance_index = self.balance_index
+        if balance_index is None:
+            return
+
+        if balance_index.next_block_number == block.message.block_number:
+            balance_index.apply_block(block)
+        else:
+            logger.debug('Account balance index is outdated (will be remade on demand)')
+            self.balance_index = None
+
+    def _make_account_postings(self) -> AccountPostings:
+        # Override this method to make persistent account postings
+        return AccountPostings()
+
+    def _get_account_postings(self, before_block_number: int) -> Optional[AccountPostings]:
+        """
+        Return account postings that cover blocks before `before_block_number` (catching up if necessary).
+        """
+        if not self.use_account_postings:
+            return None
+
+        account_postings = self.account_postings
+        if account_postings is None:
+            account_postings = self._make_account_postings()
+            next_block_number = account_postings.next_block_number
+            if next_block_number is not None and next_block_number > self.get_next_block_number():
+                logger.warning('Account postings are ahead of the blockchain (resetting them)')
+                account_postings.clear()
+
+            self.account_postings = account_postings
+
+        next_block_number = account_postings.next_block_number
+        if next_block_number is None or next_block_number < before_block_number:
+            self._catch_up_account_postings(account_postings)
+            next_block_number = account_postings.next_block_number
+            if next_block_number is None or next_block_number < before_block_number:
+                return None
+
+        return account_postings
+
+    @timeit_method(level=logging.INFO)
+    def _catch_up_account_postings(self, account_postings: AccountPostings):
+        next_block_number = account_postings.next_block_number
+        blocks = self.iter_blocks() if next_block_number is None else self.iter_blocks_from(next_block_number)
+        for block in blocks:
+            block_number = block.message.block_number
+            next_block_number = account_postings.next_block_number
+            if next_block_number is not None:
+                if block_number < next_block_number:
+                    continue
+                elif block_number > next_block_number:
+                    logger.warning('Could not catch up account postings: blocks are missing')
+                    break
+
+            account_postings.add_block(block)
+
+    def _update_account_postings(self, block: Block):
+        account_postings = self.account_postings
+        if account_postings is None:
+            return
+
+        next_block_number = account_postings.next_block_number
+        block_number = block.message.block_number
+        if next_block_number == block_number or (next_block_number is None and block_number == 0):
+            account_postings.add_block(block)
+        else:
+            logger.debug('Account postings are outdated (will be remade on demand)')
+            account_postings.clear()
+            self.account_postings = None
+
     @timeit_method()
     def _get_balance_lock_from_block(self, account: str, block_number: Optional[int] = None) -> Optional[str]:
         balance = self._get_balance_from_block(account, block_number, must_have_lock=True)
@@ -246,6 +537,25 @@ class BlockchainBase:
                                 account: str,
                                 block_number: Optional[int] = None,
                                 must_have_lock: bool = False) -> Optional[BlockAccountBalance]:
+        if block_number is not None and block_number < 0:
+            return None
+
+        before_block_number = self.get_next_block_number() if block_number is None else block_number + 1
+        account_postings = self._get_account_postings(before_block_number)
+        if account_postings is not None:
+            posting_block_number = account_postings.get_last_block_number(
+                account, before_block_number, must_have_lock=must_have_lock
+            )
+            if posting_block_number is None:
+                return None
+
+            block = self.get_block_by_number(posting_block_number)
+            balance = None if block is None else block.message.get_balance(account)
+            if balance is not None and (balance.lock or not must_have_lock):
+                return balance
+
+            logger.warning('Account postings are inconsistent with blocks (falling back to blocks traversal)')
+
         for block in self.get_blocks_until_account_root_file(block_number):
             balance = block.message.get_balance(account)
             if balance is not None:
@@ -380,16 +690,32 @@ class BlockchainBase:
         assert account_root_file
         return account_root_file.get_next_block_number()
 
-    def get_closest_account_root_file(self, excludes_block_number: Optional[int] = None) -> Optional[AccountRootFile]:
+    def get_closest_account_root_file(self,
+                                      excludes_block_number: Optional[int] = None) -> Optional[AccountRootFileView]:
         """
         Return the latest account root file that does not include `excludes_block_number` (
         head block by default thus the latest account root file, use -1 for getting initial account root file).
         None is returned if `excludes_block_number` block is not included in even in the earliest account
         root file (this may happen for partial blockchains that cut off genesis and no initial root account file)
+
+        The account root file is returned as a read-only view (which is shared, not copied), use
+        `generate_account_root_file()` or `AccountRootFileView.copy()` for getting a mutable account root file.
         """
         if excludes_block_number is not None and excludes_block_number < -1:
             raise ValueError('before_block_number_inclusive must be greater or equal to -1')
 
+        account_root_file = self._get_closest_account_root_file(excludes_block_number)
+        if account_root_file is None:
+            logger.warning('Could not find account root file that excludes block number %s', excludes_block_number)
+            return None
+
+        if isinstance(account_root_file, AccountRootFileView):
+            return account_root_file
+
+        return AccountRootFileView(account_root_file)
+
+    def _get_closest_account_root_file(self, excludes_block_number: Optional[int]) -> Optional[AnyAccountRootFile]:
+        # Override this method if a particular blockchain implementation can provide a high performance
         if excludes_block_number is None:
             logger.debug('excludes_block_number is None: returning the last account root file')
             account_root_file = self.get_last_account_root_file()
@@ -426,11 +752,7 @@ class BlockchainBase:
                 logger.warning('Requested account root file is not found (partial blockchain is unexpectedly short)')
                 account_root_file = None
 
-        if account_root_file is None:
-            logger.warning('Could not find account root file that excludes block number %s', excludes_block_number)
-            return None
-
-        return copy.deepcopy(account_root_file)
+        return account_root_file
 
     def make_account_root_file(self):
         last_block = self.get_last_block()
@@ -450,7 +772,72 @@ class BlockchainBase:
         account_root_file = self.generate_account_root_file()
         self.add_account_root_file(account_root_file)
 
+    def schedule_account_root_file(self) -> Optional[Future]:
+        """
+        Make account root file for the head block in background thread (from a copy of account balance index, so
+        blocks can be added meanwhile). The account root file is published once it is persisted. Override
+        `on_account_root_file_created()` and `on_account_root_file_failed()` to get notified.
+        """
+        balance_index = self._get_balance_index(self.get_next_block_number())
+        if balance_index is None:
+            logger.warning('Account balance index is not available: making account root file synchronously')
+            self.make_account_root_file()
+            return None
+
+        executor = self._account_root_file_executor
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='account-root-file')
+            self._account_root_file_executor = executor
+
+        future = executor.submit(self._make_account_root_file_from_balance_index, balance_index.copy())
+        future.add_done_callback(self._on_account_root_file_future_done)
+        self.account_root_file_future = future
+        return future
+
+    def wait_for_account_root_file(self, timeout=None):
+        """
+        Wait for the account root file being made in background (if any).
+        """
+        future = self.account_root_file_future
+        if future is not None:
+            wait((future,), timeout=timeout)
+
+    def on_account_root_file_created(self, account_root_file: AccountRootFile):
+        # Called from the background thread when the account root file has been published
+        logger.info('Account root file (last_block_number=%s) has been made', account_root_file.last_block_number)
+
+    def on_account_root_file_failed(self, exception: BaseException):
+        # Called from the background thread when making account root file failed
+        logger.error('Could not make account root file', exc_info=exception)
+
+    @timeit_method(level=logging.INFO)
+    def _make_account_root_file_from_balance_index(self, balance_index: AccountBalanceIndex) -> AccountRootFile:
+        account_root_file = balance_index.make_account_root_file()
+        account_root_file.validate()
+        with self._account_root_files_lock:
+            self.persist_account_root_file(account_root_file)
+
+        return account_root_file
+
+    def _on_account_root_file_future_done(self, future: Future):
+        exception = future.exception()
+        if exception is not None:
+            self.on_account_root_file_failed(exception)
+            return
+
+        account_root_file = future.result()
+        # Balance index is not thread-safe, so it is rebased on the next add_block()
+        self._published_account_root_files.append(account_root_file)
+        self.on_account_root_file_created(account_root_file)
+
     def generate_account_root_file(self, last_block_number: Optional[int] = None) -> AccountRootFile:
+        next_block_number = self.get_next_block_number()
+        if last_block_number is None or last_block_number + 1 == next_block_number:
+            balance_index = self._get_balance_index(next_block_number)
+            if balance_index is not None:
+                logger.debug('Generating account root file from account balance index')
+                return balance_index.make_account_root_file()
+
         last_account_root_file = self.get_closest_account_root_file(last_block_number)
         assert last_account_root_file is not None
         logger.debug(
@@ -458,15 +845,17 @@ class BlockchainBase:
             last_account_root_file.last_block_number
         )
 
-        account_root_file = copy.deepcopy(last_account_root_file)
+        account_root_file = last_account_root_file.copy()
         account_root_file_accounts = account_root_file.accounts
 
-        block = None
+        last_block = None
         for block in self.iter_blocks_from(account_root_file.get_next_block_number()):
             if last_block_number is not None and block.message.block_number > last_block_number:
                 logger.debug('Traversed all blocks of interest')
                 break
 
+            last_block = block
+
             logger.debug('Traversing block number %s', block.message.block_number)
             for account_number, account_balance in block.message.updated_balances.items():
                 logger.debug('Found %s account balance: %s', account_number, account_balance)
@@ -482,19 +871,19 @@ class BlockchainBase:
                     if lock:
                         arf_balance.lock = lock
 
-        if block is not None:
-            account_root_file.last_block_number = block.message.block_number
-            account_root_file.last_block_identifier = block.message.block_identifier
-            account_root_file.last_block_timestamp = block.message.timestamp
-            account_root_file.next_block_identifier = block.message_hash
+        if last_block is not None:
+            account_root_file.last_block_number = last_block.message.block_number
+            account_root_file.last_block_identifier = last_block.message.block_identifier
+            account_root_file.last_block_timestamp = last_block.message.timestamp
+            account_root_file.next_block_identifier = last_block.message_hash
 
         return account_root_file
 
     # Validation methods
     @validates('BLOCKCHAIN')
-    def validate(self, is_partial_allowed: bool = True):
+    def validate(self, is_partial_allowed: bool = True, resume: bool = False):
         self.validate_account_root_files(is_partial_allowed=is_partial_allowed)
-        self.validate_blocks()
+        self.validate_blocks(resume=resume)
 
     @validates('account root files', is_plural_target=True)
     def validate_account_root_files(self, is_partial_allowed: bool = True):
@@ -510,17 +899,31 @@ class BlockchainBase:
             raise ValidationError('Blockchain must start with initial account root file')
 
         is_first = True
+        balance_index = None
         for counter, account_root_file in enumerate(chain((first_account_root_file,), account_root_files_iter)):
             with validates(f'account root file number {counter}'):
                 self.validate_account_root_file(
-                    account_root_file=account_root_file, is_initial=is_initial, is_first=is_first
+                    account_root_file=account_root_file,
+                    is_initial=is_initial,
+                    is_first=is_first,
+                    balance_index=balance_index,
                 )
 
             is_initial = False  # only first iteration can be with initial
             is_first = False
 
+            # Balances of the next account root file are validated by rolling validated balances forward
+            balance_index = AccountBalanceIndex(account_root_file)
+
     @validates('account root file (last_block_number={account_root_file.last_block_number})')
-    def validate_account_root_file(self, *, account_root_file, is_initial=False, is_first=False):
+    def validate_account_root_file(
+        self,
+        *,
+        account_root_file,
+        is_initial=False,
+        is_first=False,
+        balance_index: Optional[AccountBalanceIndex] = None
+    ):
         account_root_file.validate(is_initial=is_initial)
         if is_initial:
             return
@@ -529,7 +932,7 @@ class BlockchainBase:
             logger.debug('First account root file is not a subject of further validations')
             return
 
-        self.validate_account_root_file_balances(account_root_file=account_root_file)
+        self.validate_account_root_file_balances(account_root_file=account_root_file, balance_index=balance_index)
 
         first_block = self.get_first_block()
         if not first_block:
@@ -561,10 +964,24 @@ class BlockchainBase:
     @validates(
         'account root file balances (last_block_number={account_root_file.last_block_number})', is_plural_target=True
     )
-    def validate_account_root_file_balances(self, *, account_root_file):
-        generated_account_root_file = self.generate_account_root_file(account_root_file.last_block_number)
-        with validates('number of account root file balances'):
+    def validate_account_root_file_balances(
+        self, *, account_root_file, balance_index: Optional[AccountBalanceIndex] = None
+    ):
+        """
+        Validate account root file balances against `balance_index` (balances of a preceding account root file)
+        rolled forward to the account root file. Generate account root file to validate against if
+        `balance_index` is not provided or blocks it should be rolled forward through are missing.
+        """
+        last_block_number = account_root_file.last_block_number
+        if balance_index is not None and self._roll_balance_index(balance_index, last_block_number):
+            expected_accounts_count = balance_index.get_account_count()
+            expected_balances: Iterable[tuple[str, AccountBalance]] = balance_index.iter_account_balances()
+        else:
+            generated_account_root_file = self.generate_account_root_file(last_block_number)
             expected_accounts_count = len(generated_account_root_file.accounts)
+            expected_balances = generated_account_root_file.accounts.items()
+
+        with validates('number of account root file balances'):
             actual_accounts_count = len(account_root_file.accounts)
             if expected_accounts_count != actual_accounts_count:
                 raise ValidationError(
@@ -573,7 +990,7 @@ class BlockchainBase:
                 )
 
         actual_accounts = account_root_file.accounts
-        for account_number, account_balance in generated_account_root_file.accounts.items():
+        for account_number, account_balance in expected_balances:
             with validates(f'account {account_number} existence'):
                 actual_account_balance = actual_accounts.get(account_number)
                 if actual_account_balance is None:
@@ -597,66 +1014,211 @@ class BlockchainBase:
                         f'lock for account {account_number}'
                     )
 
+    def _roll_balance_index(self, balance_index: AccountBalanceIndex, last_block_number: int) -> bool:
+        """
+        Apply blocks up to `last_block_number` to `balance_index`. Return False if blocks are missing.
+        """
+        if balance_index.next_block_number <= last_block_number:
+            for block in self.iter_blocks_from(balance_index.next_block_number):
+                if block.message.block_number != balance_index.next_block_number:
+                    break
+
+                balance_index.apply_block(block)
+                if block.message.block_number == last_block_number:
+                    break
+
+        return balance_index.next_block_number == last_block_number + 1
+
     @validates('blockchain blocks (offset={offset}, limit={limit})', is_plural_target=True, use_format_map=True)
-    def validate_blocks(self, *, offset: int = 0, limit: Optional[int] = None):
+    def validate_blocks(
+        self,
+        *,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        resume: bool = False,
+        checkpoint_period_in_blocks: int = DEFAULT_VALIDATION_CHECKPOINT_PERIOD_IN_BLOCKS,
+    ):
         """
         Validate blocks persisted in the blockchain. Some blockchain level validations may overlap with
         block level validations. We consider it OK since it is better to double check something rather
         than miss something. We may reconsider this overlap in favor of validation performance.
+
+        Validation checkpoint (the last block validated along with all preceding blocks) is saved every
+        `checkpoint_period_in_blocks` blocks. If `resume` is True blocks up to the checkpoint are not validated.
         """
         assert offset >= 0
 
-        blocks_iter = cast(Iterable[Block], self.iter_blocks())
-        if offset > 0 or limit is not None:
-            # TODO(dmu) HIGH: Consider performance improvements when slicing
-            if limit is None:
-                blocks_iter = islice(blocks_iter, offset)
-            else:
-                blocks_iter = islice(blocks_iter, offset, offset + limit)
+        first_account_root_file = self.get_first_account_root_file()
+        if first_account_root_file is None:
+            if next(self.iter_blocks(), None) is None:
+                return
+
+            raise ValidationError('Account root file prior to first block is not found')
 
+        base_block_number = first_account_root_file.get_next_block_number()
+        start_block_number = base_block_number + offset
+        end_block_number = None if limit is None else start_block_number + limit  # exclusive
+
+        # Checkpoint can be saved only if all blocks preceding validated blocks are validated
+        is_checkpointing = offset == 0
+        expected_block_identifier = None
+        checkpoint = self._get_validation_resume_checkpoint(start_block_number) if resume else None
+        if checkpoint is not None:
+            logger.info('Resuming blocks validation after block number %s', checkpoint.block_number)
+            start_block_number = checkpoint.block_number + 1
+            expected_block_identifier = checkpoint.message_hash
+            is_checkpointing = True
+
+        if end_block_number is not None and start_block_number >= end_block_number:
+            return
+
+        source_blocks_iter = self._iter_blocks_to_validate(
+            None if start_block_number == base_block_number else start_block_number
+        )
         try:
-            first_block = next(blocks_iter)  # type: ignore
-        except StopIteration:
+            self._validate_blocks(
+                source_blocks_iter,
+                first_account_root_file=first_account_root_file,
+                start_block_number=start_block_number,
+                end_block_number=end_block_number,
+                expected_block_identifier=expected_block_identifier,
+                is_checkpointing=is_checkpointing,
+                checkpoint_period_in_blocks=checkpoint_period_in_blocks,
+            )
+        finally:
+            # Stop background threads of the validation pipeline (if any) early
+            close = getattr(source_blocks_iter, 'close', None)
+            if close is not None:
+                close()
+
+    def _validate_blocks(
+        self,
+        blocks_iter: Iterable[Block],
+        *,
+        first_account_root_file: AnyAccountRootFile,
+        start_block_number: int,
+        end_block_number: Optional[int],
+        expected_block_identifier: Optional[str],
+        is_checkpointing: bool,
+        checkpoint_period_in_blocks: int,
+    ):
+        if end_block_number is not None:
+            blocks_iter = islice(blocks_iter, end_block_number - start_block_number)
+
+        blocks_iter = iter(blocks_iter)
+        first_block = next(blocks_iter, None)
+        if first_block is None:
             return
 
-        first_account_root_file = self.get_first_account_root_file()
-        if first_account_root_file is None:
-            raise ValidationError('Account root file prior to first block is not found')
+        if expected_block_identifier is None:  # not resuming from a checkpoint
+            expected_block_identifier = self._get_first_block_expected_identifier(
+                first_block, first_account_root_file, start_block_number
+            )
 
-        first_block_number = first_block.message.block_number
-        if offset == 0:
-            with validates('basing on an account root file'):
+        start_time = time.perf_counter()
+        validated_count = 0
+        for block, are_signatures_valid in self._iter_signature_validated_blocks(chain((first_block,), blocks_iter)):
+            # Invalid signatures are validated again, so errors are reported in the order of serial validation
+            block.validate(self, validate_signatures=not are_signatures_valid)
+            self.validate_block(
+                block=block,
+                expected_block_number=start_block_number + validated_count,
+                expected_block_identifier=expected_block_identifier
+            )
+            self._cache_validated_block(block)
 
-                if first_account_root_file.get_next_block_number() != first_block_number:
-                    raise ValidationError('First block number does not match base account root file last block number')
+            message_hash = block.message_hash
+            assert message_hash is not None  # message hash has been validated
+            expected_block_identifier = message_hash
+            validated_count += 1
+            if validated_count % checkpoint_period_in_blocks == 0:
+                self._on_blocks_validated(block, validated_count, start_time, is_checkpointing)
 
-                if first_account_root_file.get_next_block_identifier() != first_block.message.block_identifier:
-                    raise ValidationError(
-                        'First block identifier does not match base account root file last block identifier'
-                    )
+        self._on_blocks_validated(block, validated_count, start_time, is_checkpointing)
 
-            expected_block_identifier = first_account_root_file.get_next_block_identifier()
-        else:
-            prev_block = self.get_block_by_number(first_block_number - 1)
+    def _get_validation_resume_checkpoint(self, start_block_number: int) -> Optional[ValidationCheckpoint]:
+        """
+        Return validation checkpoint to resume validation of blocks starting from `start_block_number` from
+        (or None if there is no matching checkpoint).
+        """
+        checkpoint = self.get_validation_checkpoint()
+        if checkpoint is None or start_block_number > checkpoint.block_number + 1:
+            return None
+
+        if not self._is_validation_checkpoint_valid(checkpoint):
+            logger.warning('Ignoring validation checkpoint %s that does not match blocks', checkpoint)
+            return None
+
+        return checkpoint
+
+    def _get_first_block_expected_identifier(
+        self, first_block: Block, first_account_root_file: AnyAccountRootFile, start_block_number: int
+    ) -> str:
+        base_block_number = first_account_root_file.get_next_block_number()
+        if start_block_number != base_block_number:
+            prev_block = self.get_block_by_number(start_block_number - 1)
             if prev_block is None:
-                raise ValidationError(f'Previous block for block number {first_block_number} is not found')
+                raise ValidationError(f'Previous block for block number {start_block_number} is not found')
 
             assert prev_block.message_hash
-            expected_block_identifier = prev_block.message_hash
+            return prev_block.message_hash
 
-        expected_block_number = first_account_root_file.get_next_block_number() + offset
-        for block in chain((first_block,), blocks_iter):
-            block.validate(self)
+        expected_block_identifier = first_account_root_file.get_next_block_identifier()
+        with validates('basing on an account root file'):
+            if base_block_number != first_block.message.block_number:
+                raise ValidationError('First block number does not match base account root file last block number')
+
+            if expected_block_identifier != first_block.message.block_identifier:
+                raise ValidationError(
+                    'First block identifier does not match base account root file last block identifier'
+                )
 
-            assert block.message
+        return expected_block_identifier
 
-            self.validate_block(
-                block=block,
-                expected_block_number=expected_block_number,
-                expected_block_identifier=expected_block_identifier
-            )
-            expected_block_number += 1
-            expected_block_identifier = block.message_hash
+    def _iter_signature_validated_blocks(self, blocks_iter: Iterable[Block]) -> Iterable[tuple[Block, bool]]:
+        """
+        Return iterator over (block, are signatures valid) pairs. Signatures are validated in advance only if
+        signature validation workers are configured (or the validation pipeline is used).
+        """
+        workers = self.signature_validation_workers
+        if workers is None and self.use_validation_pipeline:
+            workers = os.cpu_count() or 1
+
+        if workers:
+            # Signatures do not depend on blockchain state, so they are validated ahead in parallel
+            return iter_signature_validated_blocks(blocks_iter, workers)
+
+        return zip(blocks_iter, repeat(False))
+
+    def _on_blocks_validated(self, last_block: Block, validated_count: int, start_time: float, is_checkpointing: bool):
+        last_block_number = last_block.message.block_number
+        if is_checkpointing:
+            message_hash = last_block.message_hash
+            assert message_hash is not None  # message hash has been validated
+            self.set_validation_checkpoint(ValidationCheckpoint(last_block_number, message_hash))
+
+        log_validation_progress(validated_count, last_block_number, start_time)
+
+    def _iter_blocks_to_validate(self, block_number: Optional[int]) -> Iterable[Block]:
+        """
+        Return iterator over blocks to be validated starting from `block_number` (or from the first block if
+        `block_number` is None). If the validation pipeline is used blocks are read and decoded in a background
+        thread (child classes may split reading and decoding into separate stages).
+        """
+        blocks_iter = self.iter_blocks() if block_number is None else self.iter_blocks_from(block_number)
+        if self.use_validation_pipeline:
+            return iter_in_background(blocks_iter, VALIDATION_PIPELINE_QUEUE_SIZE, 'block-reading')
+
+        return blocks_iter
+
+    def _cache_validated_block(self, block: Block):
+        # Child classes may cache blocks once they are validated (caching blocks read ahead for validation would
+        # evict the blocks looked up for balances while validating)
+        pass
+
+    def _is_validation_checkpoint_valid(self, checkpoint: ValidationCheckpoint) -> bool:
+        block = self.get_block_by_number(checkpoint.block_number)
+        return block is not None and block.message_hash == checkpoint.message_hash
 
     @validates(
         'block number {block.message.block_number} (identifier: block.message.block_identifier) '
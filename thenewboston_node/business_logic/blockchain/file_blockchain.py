@@ -1,18 +1,35 @@
 import logging
 import os.path
 import re
-from typing import Generator, Optional
+from array import array
+from functools import partial
+from itertools import count, groupby
+from typing import Generator, Iterable, Optional
 
 import msgpack
 from cachetools import LRUCache
 from more_itertools import always_reversible, ilen
 
-from thenewboston_node.business_logic.models.account_root_file import AccountRootFile
+from thenewboston_node.business_logic.indexes.account_directory import AccountDirectory, write_account_directory
+from thenewboston_node.business_logic.indexes.account_postings import AccountPostings
+from thenewboston_node.business_logic.indexes.account_root_file_index import AccountRootFileIndex
+from thenewboston_node.business_logic.indexes.block_chunk_index import BlockChunk, BlockChunkIndex
+from thenewboston_node.business_logic.indexes.block_chunk_offsets import (
+    BlockChunkOffsets, get_block_span, make_block_chunk_offsets
+)
+from thenewboston_node.business_logic.indexes.head_block import HeadBlockMetadata
+from thenewboston_node.business_logic.indexes.validation_checkpoint import (
+    ValidationCheckpoint, ValidationCheckpointFile
+)
+from thenewboston_node.business_logic.models.account_root_file import (
+    AccountRootFile, AccountRootFileView, AnyAccountRootFile
+)
 from thenewboston_node.business_logic.models.block import Block
 from thenewboston_node.business_logic.storages.path_optimized_file_system import PathOptimizedFileSystemStorage
 from thenewboston_node.core.logging import timeit
+from thenewboston_node.core.utils.concurrency import iter_in_background
 
-from .base import BlockchainBase
+from .base import VALIDATION_PIPELINE_QUEUE_SIZE, BlockchainBase
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +38,39 @@ ORDER_OF_ACCOUNT_ROOT_FILE = 10
 ORDER_OF_BLOCK = 20
 
 ACCOUNT_ROOT_FILE_FILENAME_TEMPLATE = '{last_block_number}-arf.msgpack'
+ACCOUNT_ROOT_FILE_FILENAME_RE = re.compile(
+    ACCOUNT_ROOT_FILE_FILENAME_TEMPLATE.format(last_block_number=r'(?P<last_block_number>\d*\.|\d+)')
+)
 BLOCK_CHUNK_FILENAME_TEMPLATE = '{start}-{end}-block-chunk.msgpack'
 BLOCK_CHUNK_FILENAME_RE = re.compile(
     BLOCK_CHUNK_FILENAME_TEMPLATE.format(start=r'(?P<start>\d+)', end=r'(?P<end>\d+)')
 )
+BLOCK_CHUNK_INDEX_FILENAME = 'block-chunk-index.msgpack'
+BLOCK_CHUNK_OFFSETS_SUBDIR = 'block-chunk-offsets'
+ACCOUNT_POSTINGS_FILENAME = 'account-postings.msgpack'
+HEAD_BLOCK_METADATA_FILENAME = 'head-block.msgpack'
+VALIDATION_CHECKPOINT_FILENAME = 'validation-checkpoint.msgpack'
+ACCOUNT_DIRECTORIES_SUBDIR = 'account-directories'
+ACCOUNT_DIRECTORY_FILENAME_SUFFIX = '-account-directory.bin'
+
+# Number of read (and decompressed) block chunks waiting for decoding in the validation pipeline
+BLOCK_CHUNK_DATA_QUEUE_SIZE = 2
+
+
+def get_last_block_number(file_path):
+    filename = os.path.basename(file_path)
+    match = ACCOUNT_ROOT_FILE_FILENAME_RE.match(filename)
+    if not match:
+        raise ValueError(f'Unexpected account root file filename: {filename}')
+
+    last_block_number = match.group('last_block_number')
+    return None if last_block_number.endswith('.') else int(last_block_number)
+
+
+def make_block_chunk_filename(start, end):
+    return BLOCK_CHUNK_FILENAME_TEMPLATE.format(
+        start=str(start).zfill(ORDER_OF_BLOCK), end=str(end).zfill(ORDER_OF_BLOCK)
+    )
 
 
 def get_start_end(file_path):
@@ -39,6 +85,29 @@ def get_start_end(file_path):
     return None, None
 
 
+def iter_blocks_from_block_chunk_data(data: bytes, chunk_start: int, start=None) -> Generator[Block, None, None]:
+    """
+    Decode blocks from uncompressed block chunk `data` starting from `start` block number (blocks are not cached,
+    so it is safe to decode in a background thread).
+    """
+    first_index = 0 if start is None else max(start - chunk_start, 0)
+    unpacker = msgpack.Unpacker()
+    unpacker.feed(data)
+    for index in count():
+        try:
+            if index < first_index:
+                unpacker.skip()
+                continue
+
+            block_compact_dict = unpacker.unpack()
+        except msgpack.OutOfData:
+            return
+
+        block = Block.from_compact_dict(block_compact_dict)
+        assert block.message.block_number == chunk_start + index
+        yield block
+
+
 class FileBlockchain(BlockchainBase):
 
     def __init__(
@@ -56,6 +125,9 @@ class FileBlockchain(BlockchainBase):
         block_chunk_size=100,
         blocks_cache_size=None,
         blocks_storage_kwargs=None,
+
+        # Indexes
+        indexes_subdir='indexes',
         **kwargs
     ):
         if not os.path.isabs(base_directory):
@@ -68,6 +140,7 @@ class FileBlockchain(BlockchainBase):
 
         account_root_files_directory = os.path.join(base_directory, account_root_files_subdir)
         block_directory = os.path.join(base_directory, blocks_subdir)
+        indexes_directory = os.path.join(base_directory, indexes_subdir)
 
         self.block_storage = PathOptimizedFileSystemStorage(base_path=block_directory, **(blocks_storage_kwargs or {}))
         self.account_root_files_storage = PathOptimizedFileSystemStorage(
@@ -75,11 +148,24 @@ class FileBlockchain(BlockchainBase):
         )
 
         self.account_root_files_cache = LRUCache(account_root_files_cache_size)
+        self.account_root_file_views_cache = LRUCache(account_root_files_cache_size)
+        self.account_directories_path = os.path.join(indexes_directory, ACCOUNT_DIRECTORIES_SUBDIR)
+        # Account root files that could not be written as account directories (they are not retried)
+        self._account_directory_failed_file_paths: set[str] = set()
+        self.account_root_file_index = AccountRootFileIndex()
         self.blocks_cache = LRUCache(
             # We do not really need to cache more than `arf_creation_period_in_blocks` blocks since
             # we use use account root file as a base
             arf_creation_period_in_blocks * 2 if blocks_cache_size is None else blocks_cache_size
         )
+        self.block_chunk_index = BlockChunkIndex(os.path.join(indexes_directory, BLOCK_CHUNK_INDEX_FILENAME))
+        self._block_chunk_index_listing_version: Optional[tuple] = None  # block directory listing it was built from
+        self.block_chunk_offsets = BlockChunkOffsets(os.path.join(indexes_directory, BLOCK_CHUNK_OFFSETS_SUBDIR))
+        self.account_postings_path = os.path.join(indexes_directory, ACCOUNT_POSTINGS_FILENAME)
+        self.head_block_metadata = HeadBlockMetadata(os.path.join(indexes_directory, HEAD_BLOCK_METADATA_FILENAME))
+        self.validation_checkpoint_file = ValidationCheckpointFile(
+            os.path.join(indexes_directory, VALIDATION_CHECKPOINT_FILENAME)
+        )
 
     # Account root files methods
     def persist_account_root_file(self, account_root_file: AccountRootFile):
@@ -88,24 +174,140 @@ class FileBlockchain(BlockchainBase):
 
         prefix = ('.' if last_block_number is None else str(last_block_number)).zfill(ORDER_OF_ACCOUNT_ROOT_FILE)
         file_path = ACCOUNT_ROOT_FILE_FILENAME_TEMPLATE.format(last_block_number=prefix)
-        storage.save(file_path, account_root_file.to_messagepack(), is_final=True)
+        with self._account_root_files_lock:
+            storage.save(file_path, account_root_file.to_messagepack(), is_final=True)
+            self._write_account_directory(file_path, account_root_file)
+            self.account_root_file_views_cache.pop(file_path, None)
+
+            account_root_file_index = self.account_root_file_index
+            if account_root_file_index.is_loaded:
+                account_root_file_index.add(last_block_number, file_path)
+
+    def get_first_account_root_file(self) -> Optional[AnyAccountRootFile]:
+        with self._account_root_files_lock:
+            file_path = self._get_account_root_file_index().get_first_file_path()
+            return None if file_path is None else self._get_account_root_file_view(file_path)
+
+    def get_last_account_root_file(self) -> Optional[AnyAccountRootFile]:
+        with self._account_root_files_lock:
+            file_path = self._get_account_root_file_index().get_last_file_path()
+            return None if file_path is None else self._get_account_root_file_view(file_path)
+
+    def _get_closest_account_root_file(self, excludes_block_number: Optional[int]) -> Optional[AnyAccountRootFile]:
+        with self._account_root_files_lock:
+            file_path = self._get_account_root_file_index().get_closest_file_path(excludes_block_number)
+            return None if file_path is None else self._get_account_root_file_view(file_path)
+
+    def _get_account_root_file_index(self) -> AccountRootFileIndex:
+        account_root_file_index = self.account_root_file_index
+        if not account_root_file_index.is_loaded:
+            account_root_file_index.rebuild((get_last_block_number(file_path), file_path)
+                                            for file_path in self.account_root_files_storage.list_directory())
+
+        return account_root_file_index
+
+    def _get_account_root_file_view(self, file_path) -> AccountRootFileView:
+        cache = self.account_root_file_views_cache
+        view = cache.get(file_path)
+        if view is None:
+            account_directory = self._get_account_directory(file_path)
+            if account_directory is None:
+                view = AccountRootFileView(self._load_account_root_file(file_path))
+            else:
+                view = AccountRootFileView.make_lazy(
+                    account_directory.get_attributes(), account_directory,
+                    partial(self._load_account_root_file, file_path)
+                )
+
+            cache[file_path] = view
+
+        return view
+
+    def _get_account_directory(self, file_path) -> Optional[AccountDirectory]:
+        """
+        Return account directory made from account root file at `file_path` or None if it is not available (then
+        the account directory is written from the account root file for the next time).
+        """
+        if file_path in self._account_directory_failed_file_paths:
+            return None
 
-    def _load_account_root_file(self, file_path):
-        cache = self.account_root_files_cache
-        account_root_file = cache.get(file_path)
-        if account_root_file is None:
-            storage = self.account_root_files_storage
-            assert storage.is_finalized(file_path)
-            account_root_file = AccountRootFile.from_messagepack(storage.load(file_path))
-            cache[file_path] = account_root_file
+        account_directory_path = self._get_account_directory_path(file_path)
+        try:
+            account_directory = AccountDirectory(account_directory_path)
+        except Exception:
+            logger.debug('Could not open account directory %s', account_directory_path, exc_info=True)
+        else:
+            if not self._is_account_directory_outdated(file_path, account_directory):
+                return account_directory
+
+            logger.warning('Account directory %s is outdated', account_directory_path)
+
+        self._write_account_directory(file_path, self._load_account_root_file(file_path))
+        return None
+
+    def _is_account_directory_outdated(self, file_path, account_directory: AccountDirectory) -> bool:
+        # Account directory is identified by account root file last block number and next block identifier, the
+        # latter is checked against the blocks, so the account root file is not read for that
+        last_block_number = get_last_block_number(file_path)
+        if account_directory.last_block_number != last_block_number:
+            return True
+
+        next_block_identifier = self._get_account_root_file_next_block_identifier(last_block_number)
+        if next_block_identifier is None or account_directory.next_block_identifier == next_block_identifier:
+            return False
+
+        # Account root file itself may be inconsistent with the blocks
+        account_root_file = self._load_account_root_file(file_path)
+        return account_directory.next_block_identifier != account_root_file.next_block_identifier
 
-        return account_root_file
+    def _get_account_root_file_next_block_identifier(self, last_block_number: Optional[int]) -> Optional[str]:
+        next_block = self.get_block_by_number(0 if last_block_number is None else last_block_number + 1)
+        if next_block is not None:
+            return next_block.message.block_identifier
+
+        last_block = None if last_block_number is None else self.get_block_by_number(last_block_number)
+        return None if last_block is None else last_block.message_hash
+
+    def _write_account_directory(self, file_path, account_root_file: AccountRootFile):
+        failed_file_paths = self._account_directory_failed_file_paths
+        account_directory_path = self._get_account_directory_path(file_path)
+        try:
+            is_written = write_account_directory(account_directory_path, account_root_file)
+        except Exception:
+            logger.warning('Could not write account directory %s', account_directory_path, exc_info=True)
+            is_written = False
+
+        if is_written:
+            failed_file_paths.discard(file_path)
+        else:
+            failed_file_paths.add(file_path)
+
+    def _get_account_directory_path(self, file_path):
+        filename, _ = os.path.splitext(os.path.basename(file_path))
+        return os.path.join(self.account_directories_path, filename + ACCOUNT_DIRECTORY_FILENAME_SUFFIX)
+
+    def _load_account_root_file(self, file_path):
+        # Also called by lazy account root file views on first access to all accounts
+        with self._account_root_files_lock:
+            cache = self.account_root_files_cache
+            account_root_file = cache.get(file_path)
+            if account_root_file is None:
+                storage = self.account_root_files_storage
+                assert storage.is_finalized(file_path)
+                account_root_file = AccountRootFile.from_messagepack(storage.load(file_path))
+                cache[file_path] = account_root_file
+
+            return account_root_file
 
     def _iter_account_root_files(self, direction) -> Generator[AccountRootFile, None, None]:
         assert direction in (1, -1)
 
         storage = self.account_root_files_storage
-        for file_path in storage.list_directory(sort_direction=direction):
+        with self._account_root_files_lock:
+            # Lock must not be held while yielding, so the listing is read in advance
+            file_paths = list(storage.list_directory(sort_direction=direction))
+
+        for file_path in file_paths:
             yield self._load_account_root_file(file_path)
 
     def iter_account_root_files(self) -> Generator[AccountRootFile, None, None]:
@@ -116,63 +318,179 @@ class FileBlockchain(BlockchainBase):
 
     def get_account_root_file_count(self) -> int:
         storage = self.account_root_files_storage
-        return ilen(storage.list_directory())
+        with self._account_root_files_lock:
+            return ilen(storage.list_directory())
 
     # Blocks methods
     def persist_block(self, block: Block):
+        self.persist_blocks([block])
+
+    def persist_blocks(self, blocks: list[Block]):
+        if not blocks:
+            return
+
+        head_block_metadata = self._get_head_block_metadata()
+
+        # Blocks are grouped by block chunk, so every block chunk is appended to once
+        block_chunk_size = self.block_chunk_size
+        for _, chunk_blocks in groupby(blocks, key=lambda block: block.message.block_number // block_chunk_size):
+            self._persist_block_chunk_blocks(list(chunk_blocks))
+
+        first_block_number = blocks[0].message.block_number
+        last_block = blocks[-1]
+        last_block_number = last_block.message.block_number
+        if (
+            head_block_metadata is not None and head_block_metadata.block_number == first_block_number - 1 and
+            last_block_number - first_block_number + 1 == len(blocks)
+        ):
+            block_count = head_block_metadata.block_count + len(blocks)
+        else:
+            block_count = self._count_blocks()
+
+        # The file is rewritten once per batch of blocks or per block chunk (rather than on every added block), since
+        # the blocks appended to the last block chunk after that are caught up with the block chunk index
+        self.head_block_metadata.update(
+            last_block_number,
+            last_block.message_hash,
+            block_count,
+            persist=len(blocks) > 1 or (last_block_number + 1) % block_chunk_size == 0,
+        )
+
+    def iter_blocks(self) -> Generator[Block, None, None]:
+        yield from self._iter_blocks(1)
+
+    def _persist_block_chunk_blocks(self, blocks: list[Block]):
         storage = self.block_storage
         block_chunk_size = self.block_chunk_size
 
-        block_number = block.message.block_number
-        chunk_number, offset = divmod(block_number, block_chunk_size)
+        first_block_number = blocks[0].message.block_number
+        last_block_number = blocks[-1].message.block_number
+        chunk_number, offset = divmod(first_block_number, block_chunk_size)
 
         chunk_block_number_start = chunk_number * block_chunk_size
-        start_str = str(chunk_block_number_start).zfill(ORDER_OF_BLOCK)
-        end_str = str(block_number).zfill(ORDER_OF_BLOCK)
-
-        if chunk_block_number_start == block_number:
-            append_end_str = str(block_number).zfill(ORDER_OF_BLOCK)
+        filename = make_block_chunk_filename(chunk_block_number_start, last_block_number)
+        if offset:
+            append_filename = make_block_chunk_filename(chunk_block_number_start, first_block_number - 1)
         else:
-            assert chunk_block_number_start < block_number
-            append_end_str = str(block_number - 1).zfill(ORDER_OF_BLOCK)
+            append_filename = filename
 
-        append_filename = BLOCK_CHUNK_FILENAME_TEMPLATE.format(start=start_str, end=append_end_str)
-        filename = BLOCK_CHUNK_FILENAME_TEMPLATE.format(start=start_str, end=end_str)
+        chunk_end_offset = self._get_block_chunk_end_offset(append_filename, chunk_block_number_start, offset)
+        chunk_end_offsets = []
+        binary_data_parts = []
+        for block in blocks:
+            binary_data = block.to_messagepack()
+            chunk_end_offset += len(binary_data)
+            chunk_end_offsets.append(chunk_end_offset)
+            binary_data_parts.append(binary_data)
 
-        storage.append(append_filename, block.to_messagepack())
+        storage.append(append_filename, b''.join(binary_data_parts))
+        self.block_chunk_offsets.extend(chunk_block_number_start, chunk_end_offsets)
 
         if append_filename != filename:
+            # Block chunk is named after its current last block, so readers find it out from the name
+            # (the file is kept open for appending by the storage)
             storage.move(append_filename, filename)
 
-        if offset == block_chunk_size - 1:
+        if last_block_number - chunk_block_number_start == block_chunk_size - 1:
             storage.finalize(filename)
 
-    def iter_blocks(self) -> Generator[Block, None, None]:
-        yield from self._iter_blocks(1)
+        self._get_block_chunk_index().update(BlockChunk(chunk_block_number_start, last_block_number, filename))
 
     @timeit(verbose_args=True, is_method=True)
     def iter_blocks_reversed(self) -> Generator[Block, None, None]:
         yield from self._iter_blocks(-1)
 
     def iter_blocks_from(self, block_number: int) -> Generator[Block, None, None]:
-        for file_path in self._list_block_directory():
-            start, end = get_start_end(file_path)
-            if end < block_number:
-                continue
+        for chunk in self._iter_block_chunks_from(block_number):
+            yield from self._iter_blocks_from_file_cached(
+                chunk.file_path, direction=1, start=max(chunk.start, block_number)
+            )
+
+    def _iter_blocks_to_validate(self, block_number: Optional[int]) -> Iterable[Block]:
+        if not self.use_validation_pipeline:
+            return super()._iter_blocks_to_validate(block_number)
+
+        return self._iter_blocks_pipelined(block_number)
+
+    def _iter_blocks_pipelined(self, block_number: Optional[int]) -> Generator[Block, None, None]:
+        storage = self.block_storage
+
+        # Block chunks are looked up in this thread, since block chunk index is not thread-safe
+        if block_number is None:
+            first_chunk = next(self._get_block_chunk_index().iter_chunks(), None)
+            chunks = [] if first_chunk is None else list(self._iter_block_chunks_from(first_chunk.start))
+        else:
+            chunks = list(self._iter_block_chunks_from(block_number))
+
+        def iter_block_chunk_data():
+            for chunk in chunks:
+                yield storage.load(chunk.file_path), chunk.start
+
+        def iter_decoded_blocks():
+            # Block chunks are read and decompressed in another background thread
+            for data, chunk_start in iter_in_background(
+                iter_block_chunk_data(), BLOCK_CHUNK_DATA_QUEUE_SIZE, 'block-chunk-reading'
+            ):
+                yield from iter_blocks_from_block_chunk_data(data, chunk_start, start=block_number)
+
+        # Decoded blocks are not cached here (see _cache_validated_block())
+        return iter_in_background(iter_decoded_blocks(), VALIDATION_PIPELINE_QUEUE_SIZE, 'block-decoding')
+
+    def _cache_validated_block(self, block: Block):
+        self.blocks_cache[block.message.block_number] = block
 
-            yield from self._iter_blocks_from_file_cached(file_path, direction=1, start=max(start, block_number))
+    def get_validation_checkpoint(self) -> Optional[ValidationCheckpoint]:
+        return self.validation_checkpoint_file.load()
+
+    def set_validation_checkpoint(self, checkpoint: Optional[ValidationCheckpoint]):
+        self.validation_checkpoint_file.save(checkpoint)
 
     def get_block_by_number(self, block_number: int) -> Optional[Block]:
         block = self.blocks_cache.get(block_number)
         if block is not None:
             return block
 
-        try:
-            return next(self.iter_blocks_from(block_number))
-        except StopIteration:
+        head_block_number = self._get_head_block_number()
+        if head_block_number is not None and block_number > head_block_number:
+            return None
+
+        chunk = self._get_block_chunk(block_number)
+        if chunk is None:
             return None
 
+        return self._read_block(chunk, block_number)
+
     def get_block_count(self) -> int:
+        head_block_metadata = self._get_head_block_metadata()
+        if head_block_metadata is not None:
+            return head_block_metadata.block_count
+
+        return self._count_blocks()
+
+    def get_last_block(self) -> Optional[Block]:
+        head_block_number = self._get_head_block_number()
+        if head_block_number is not None:
+            block = self.get_block_by_number(head_block_number)
+            if block is not None:
+                return block
+
+        return super().get_last_block()
+
+    def get_next_block_number(self) -> int:
+        head_block_number = self._get_head_block_number()
+        if head_block_number is not None:
+            return head_block_number + 1
+
+        return super().get_next_block_number()
+
+    def get_next_block_identifier(self) -> str:
+        head_block_metadata = self._get_head_block_metadata()
+        if head_block_metadata is not None and head_block_metadata.message_hash:
+            return head_block_metadata.message_hash
+
+        return super().get_next_block_identifier()
+
+    def _count_blocks(self) -> int:
         count = 0
         for file_path in self._list_block_directory():
             start, end = get_start_end(file_path)
@@ -212,24 +530,117 @@ class FileBlockchain(BlockchainBase):
         assert direction in (1, -1)
         storage = self.block_storage
 
+        chunk_start, _ = get_start_end(file_path)
+        if direction == 1:
+            yield from self._iter_blocks_from_stream(storage.iter_chunks(file_path), chunk_start, start=start)
+        else:
+            yield from self._iter_blocks_from_data(storage.load(file_path), chunk_start, direction, start=start)
+
+    def _read_block(self, chunk: BlockChunk, block_number: int) -> Optional[Block]:
+        # Block chunk offsets are used to seek to the block, so only the block is read and deserialized (sequential
+        # reads stream the block chunk instead)
+        index = block_number - chunk.start
+        offsets = self.block_chunk_offsets.get(chunk.start, min_count=index + 1)
+        if offsets is not None and index < len(offsets):
+            block_start, block_end = get_block_span(offsets, index)
+            with self.block_storage.open_stream(chunk.file_path) as fo:
+                fo.seek(block_start)
+                binary_data = fo.read(block_end - block_start)
+
+            try:
+                block = Block.from_compact_dict(msgpack.unpackb(binary_data))
+            except Exception:
+                block = None
+
+            if block is not None and block.message.block_number == block_number:
+                self.blocks_cache[block_number] = block
+                return block
+
+        # Offsets are missing or outdated (the block chunk was written bypassing persist_block())
+        logger.debug('Could not read block number %s using block chunk offsets', block_number)
+        data = self.block_storage.load(chunk.file_path)
+        return next(self._iter_blocks_from_data(data, chunk.start, direction=1, start=block_number), None)
+
+    def _iter_blocks_from_stream(self, data_chunks, chunk_start, start=None):
+        # Decompressed data is fed to the unpacker as it is read, so the entire block chunk is not held in memory
+        first_index = 0 if start is None else max(start - chunk_start, 0)
         unpacker = msgpack.Unpacker()
-        unpacker.feed(storage.load(file_path))
-        if direction == -1:
-            unpacker = always_reversible(unpacker)
+        offsets = array('Q')
+        for data_chunk in data_chunks:
+            unpacker.feed(data_chunk)
+            while True:
+                index = len(offsets)
+                try:
+                    if index < first_index:
+                        unpacker.skip()
+                        block_compact_dict = None
+                    else:
+                        block_compact_dict = unpacker.unpack()
+                except msgpack.OutOfData:
+                    break
+
+                offsets.append(unpacker.tell())
+                if block_compact_dict is None:
+                    continue
 
-        for block_compact_dict in unpacker:
-            block = Block.from_compact_dict(block_compact_dict)
-            block_number = block.message.block_number
-            # TODO(dmu) HIGH: Implement a better skip
+                block = Block.from_compact_dict(block_compact_dict)
+                block_number = block.message.block_number
+                assert block_number == chunk_start + index
+
+                self.blocks_cache[block_number] = block
+                yield block
+
+        if self.block_chunk_offsets.get(chunk_start) != offsets:
+            # Offsets are missing or outdated (the block chunk was written bypassing persist_block())
+            logger.debug('Saving block chunk offsets for chunk starting at %s', chunk_start)
+            self.block_chunk_offsets.save(chunk_start, offsets)
+
+    def _iter_blocks_from_data(self, data, chunk_start, direction, start=None):
+        assert direction in (1, -1)
+
+        offsets = self._get_block_chunk_offsets(data, chunk_start)
+        if direction == 1:
+            first_index = 0 if start is None else max(start - chunk_start, 0)
+            indexes = range(first_index, len(offsets))
+        else:
+            last_index = len(offsets) - 1
             if start is not None:
-                if direction == 1 and block_number < start:
-                    continue
-                elif direction == -1 and block_number > start:
-                    continue
+                last_index = min(start - chunk_start, last_index)
+
+            indexes = range(last_index, -1, -1)
+
+        # Blocks are decoded lazily one by one, so consumers that stop early do not pay for the rest of the chunk
+        data_view = memoryview(data)
+        for index in indexes:
+            block_start, block_end = get_block_span(offsets, index)
+            block = Block.from_compact_dict(msgpack.unpackb(data_view[block_start:block_end]))
+            block_number = block.message.block_number
+            assert block_number == chunk_start + index
 
             self.blocks_cache[block_number] = block
             yield block
 
+    def _get_block_chunk_offsets(self, data, chunk_start):
+        block_chunk_offsets = self.block_chunk_offsets
+        offsets = block_chunk_offsets.get(chunk_start)
+        if offsets is None or (offsets[-1] if offsets else 0) != len(data):
+            # Offsets are missing or outdated (the block chunk was written bypassing persist_block())
+            logger.debug('Making block chunk offsets for chunk starting at %s', chunk_start)
+            offsets = make_block_chunk_offsets(data)
+            block_chunk_offsets.save(chunk_start, offsets)
+
+        return offsets
+
+    def _get_block_chunk_end_offset(self, file_path, chunk_start, block_count):
+        if block_count == 0:
+            return 0
+
+        offsets = self.block_chunk_offsets.get(chunk_start)
+        if offsets is None or len(offsets) != block_count:
+            offsets = self._get_block_chunk_offsets(self.block_storage.load(file_path), chunk_start)
+
+        return offsets[-1]
+
     def _iter_blocks_from_cache(self, start_block_number, end_block_number, direction):
         assert direction in (1, -1)
 
@@ -244,6 +655,116 @@ class FileBlockchain(BlockchainBase):
 
             yield block
 
+    def _make_account_postings(self) -> AccountPostings:
+        account_postings = AccountPostings(self.account_postings_path)
+        if not account_postings.load():
+            account_postings.clear()
+
+        return account_postings
+
+    def _get_block_chunk_index(self) -> BlockChunkIndex:
+        block_chunk_index = self.block_chunk_index
+        if block_chunk_index.is_loaded:
+            # Block chunks may have been added by another process (blockchain instance)
+            if block_chunk_index.is_outdated() and not block_chunk_index.refresh():
+                self._rebuild_block_chunk_index()
+        elif not block_chunk_index.load():
+            self._rebuild_block_chunk_index()
+
+        return block_chunk_index
+
+    def _rebuild_block_chunk_index(self) -> bool:
+        storage = self.block_storage
+        self._block_chunk_index_listing_version = storage.get_listing_version()
+        chunks = []
+        for file_path in self._list_block_directory():
+            start, end = get_start_end(file_path)
+            if start is None:
+                logger.warning('Unexpected file in block directory: %s', file_path)
+                continue
+
+            chunks.append(BlockChunk(start, end, file_path))
+
+        return self.block_chunk_index.rebuild(chunks)
+
+    def _get_block_chunk(self, block_number: int) -> Optional[BlockChunk]:
+        block_chunk_index = self._get_block_chunk_index()
+        chunk = block_chunk_index.get_chunk(block_number)
+        if chunk is None and self._is_block_chunk_index_outdated(block_number):
+            # The index may be outdated if block chunks were added bypassing persist_block(), so we rebuild it
+            logger.debug('Block number %s is not found in block chunk index', block_number)
+            if self._rebuild_block_chunk_index():
+                chunk = block_chunk_index.get_chunk(block_number)
+
+        return chunk
+
+    def _is_block_chunk_index_outdated(self, block_number: int) -> bool:
+        # Head block metadata is not validated here, since it is validated with block chunk index lookup
+        head_block_metadata = self.head_block_metadata
+        head_block_number = head_block_metadata.block_number
+        if head_block_metadata.is_loaded and head_block_number is not None:
+            return block_number <= head_block_number
+
+        # Without head block metadata the index is considered outdated if block directory listing has changed
+        listing_version = self.block_storage.get_listing_version()
+        return listing_version is None or listing_version != self._block_chunk_index_listing_version
+
+    def _iter_block_chunks_from(self, block_number: int) -> Generator[BlockChunk, None, None]:
+        # Head block number is used to stop without looking up (and rebuilding the index for) the next chunk
+        head_block_number = self._get_head_block_number()
+        if head_block_number is not None and block_number > head_block_number:
+            return
+
+        chunk = self._get_block_chunk(block_number)
+        while chunk is not None:
+            yield chunk
+            if head_block_number is not None and chunk.end >= head_block_number:
+                break
+
+            chunk = self._get_block_chunk(chunk.end + 1)
+
+    def _get_head_block_metadata(self) -> Optional[HeadBlockMetadata]:
+        head_block_metadata = self.head_block_metadata
+        if not head_block_metadata.is_loaded or head_block_metadata.is_outdated():
+            if not head_block_metadata.load():
+                return None
+
+            block_number = head_block_metadata.block_number
+            assert block_number is not None
+            if self._get_block_chunk(block_number) is None:
+                # Blocks were removed bypassing persist_block()
+                logger.warning('Head block metadata is inconsistent with block chunks')
+                head_block_metadata.clear()
+                return None
+
+        self._catch_up_head_block_metadata(head_block_metadata)
+        return head_block_metadata
+
+    def _catch_up_head_block_metadata(self, head_block_metadata: HeadBlockMetadata):
+        # Head block metadata file is not rewritten on every added block (see persist_blocks()), also blocks may
+        # have been added by another process (blockchain instance), so the metadata is caught up with the block
+        # chunk index (it is up to date)
+        block_number = head_block_metadata.block_number
+        assert block_number is not None
+        last_chunk = next(self._get_block_chunk_index().iter_chunks(-1), None)
+        if last_chunk is None or last_chunk.end <= block_number:
+            return
+
+        logger.debug('Catching up head block metadata from block number %s', block_number)
+        last_block = self.blocks_cache.get(last_chunk.end) or self._read_block(last_chunk, last_chunk.end)
+        assert last_block is not None
+        # The file is left to the process that adds blocks
+        head_block_metadata.update(
+            last_chunk.end,
+            last_block.message_hash,
+            head_block_metadata.block_count + last_chunk.end - block_number,
+            persist=False,
+        )
+
+    def _get_head_block_number(self) -> Optional[int]:
+        head_block_metadata = self._get_head_block_metadata()
+        return None if head_block_metadata is None else head_block_metadata.block_number
+
     def _list_block_directory(self, direction=1):
         storage = self.block_storage
         yield from storage.list_directory(sort_direction=direction)
@@ -0,0 +1,116 @@
+import logging
+from typing import Optional
+
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models.account_balance import BlockAccountBalance
+from thenewboston_node.business_logic.models.account_root_file import AccountRootFileView
+from thenewboston_node.business_logic.models.block import Block
+
+logger = logging.getLogger(__name__)
+
+
+class PendingBlocks:
+    """
+    Consecutive blocks that are validated, but not added to the blockchain yet. Implements the part of blockchain
+    interface used for block validation, so every block is validated against the in-memory state that includes
+    the preceding pending blocks.
+    """
+
+    def __init__(self, blockchain):
+        self.blockchain = blockchain
+        self.first_block_number = blockchain.get_next_block_number()
+        self.blocks: list[Block] = []
+        self._updated_balances: dict[str, BlockAccountBalance] = {}
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def validate_block(self, block: Block):
+        if block.message.block_number != self.get_next_block_number():
+            raise ValidationError('Block number must be equal to next block number (== head block number + 1)')
+
+        block.validate(self)
+
+    def add(self, block: Block):
+        assert block.message.block_number == self.get_next_block_number()
+        self.blocks.append(block)
+
+        updated_balances = self._updated_balances
+        for account, block_balance in block.message.updated_balances.items():
+            balance = updated_balances.get(account)
+            if balance is None:
+                updated_balances[account] = BlockAccountBalance(value=block_balance.value, lock=block_balance.lock)
+            else:
+                balance.value = block_balance.value
+                lock = block_balance.lock
+                if lock:
+                    balance.lock = lock
+
+    def get_next_block_number(self) -> int:
+        return self.first_block_number + len(self.blocks)
+
+    def get_next_block_identifier(self) -> str:
+        if self.blocks:
+            return self.blocks[-1].message_hash  # type: ignore
+
+        return self.blockchain.get_next_block_identifier()
+
+    def get_block_by_number(self, block_number: int) -> Optional[Block]:
+        index = block_number - self.first_block_number
+        if 0 <= index < len(self.blocks):
+            return self.blocks[index]
+
+        return self.blockchain.get_block_by_number(block_number)
+
+    def get_expected_block_identifier(self, block_number: int) -> Optional[str]:
+        index = block_number - 1 - self.first_block_number
+        if 0 <= index < len(self.blocks):
+            return self.blocks[index].message_hash
+
+        return self.blockchain.get_expected_block_identifier(block_number)
+
+    def get_closest_account_root_file(self,
+                                      excludes_block_number: Optional[int] = None) -> Optional[AccountRootFileView]:
+        # Account root files are not made while blocks are pending
+        return self.blockchain.get_closest_account_root_file(excludes_block_number)
+
+    def get_balance_value(self, account: str, before_block_number: Optional[int] = None) -> Optional[int]:
+        balance = self._get_updated_balance(account, before_block_number)
+        if balance is not None:
+            return balance.value
+
+        return self.blockchain.get_balance_value(
+            account, min(self.first_block_number, self._get_before(before_block_number))
+        )
+
+    def get_balance_lock(self, account: str, before_block_number: Optional[int] = None) -> str:
+        balance = self._get_updated_balance(account, before_block_number, with_lock=True)
+        if balance is not None and balance.lock:
+            return balance.lock
+
+        return self.blockchain.get_balance_lock(
+            account, min(self.first_block_number, self._get_before(before_block_number))
+        )
+
+    def _get_before(self, before_block_number: Optional[int]) -> int:
+        next_block_number = self.get_next_block_number()
+        if before_block_number is None:
+            return next_block_number
+
+        return min(before_block_number, next_block_number)
+
+    def _get_updated_balance(self,
+                             account: str,
+                             before_block_number: Optional[int],
+                             with_lock=False) -> Optional[BlockAccountBalance]:
+        before = self._get_before(before_block_number)
+        if before == self.get_next_block_number():
+            return self._updated_balances.get(account)
+
+        # Balance between pending blocks is looked up in the pending blocks preceding `before`
+        for block in reversed(self.blocks[:max(before - self.first_block_number, 0)]):
+            balance = block.message.updated_balances.get(account)
+            if balance is not None and (balance.lock or not with_lock):
+                return balance
+
+        return None
@@ -0,0 +1,75 @@
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Generator, Iterable
+
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models.block import Block
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 64
+
+
+def validate_signatures(blocks: list[Block]) -> list[bool]:
+    """
+    Validate signatures of `blocks`. Return whether signatures are valid in the order of blocks. Message hashes of
+    blocks with valid signatures are calculated (and cached) along the way for later message hash validation.
+    """
+    results = []
+    for block in blocks:
+        try:
+            block.validate_signatures()
+        except ValidationError:
+            results.append(False)
+            continue
+
+        results.append(True)
+        try:
+            block.message.get_hash()
+        except Exception:
+            # Let the block message hash validation report the problem
+            logger.debug('Could not calculate block message hash', exc_info=True)
+
+    return results
+
+
+def iter_signature_validated_blocks(blocks: Iterable[Block],
+                                    workers: int,
+                                    batch_size: int = DEFAULT_BATCH_SIZE) -> Generator[tuple[Block, bool], None, None]:
+    """
+    Validate signatures of `blocks` in a thread pool (PyNaCl releases GIL while verifying signatures) and yield
+    (block, are signatures valid) pairs in the original order of blocks. Errors are not raised here: the caller is
+    expected to validate signatures of the blocks with invalid signatures along with other block validations, so
+    the errors are reported exactly as (and in the same order as) if the blocks were validated serially.
+    """
+    assert workers > 0
+    assert batch_size > 0
+
+    blocks_iter = iter(blocks)
+    pending: deque[tuple[list[Block], Future]] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='signature-validation') as executor:
+
+        def submit_batch() -> bool:
+            batch = list(islice(blocks_iter, batch_size))
+            if not batch:
+                return False
+
+            pending.append((batch, executor.submit(validate_signatures, batch)))
+            return True
+
+        try:
+            # Keep workers busy while the caller is validating the blocks already yielded
+            for _ in range(workers * 2):
+                if not submit_batch():
+                    break
+
+            while pending:
+                batch, future = pending.popleft()
+                results = future.result()
+                submit_batch()
+                yield from zip(batch, results)
+        finally:
+            for _, future in pending:
+                future.cancel()
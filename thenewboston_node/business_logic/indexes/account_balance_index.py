@@ -0,0 +1,162 @@
+import logging
+from datetime import datetime
+from typing import Generator, Optional
+
+from thenewboston_node.business_logic.models.account_balance import AccountBalance, BlockAccountBalance
+from thenewboston_node.business_logic.models.account_root_file import AccountRootFile, AnyAccountRootFile
+from thenewboston_node.business_logic.models.block import Block
+
+logger = logging.getLogger(__name__)
+
+
+class AccountBalanceIndex:
+    """
+    In-memory account balances before `next_block_number` block is applied: account root file balances overlaid
+    with balances updated by the blocks that follow the account root file.
+    """
+
+    def __init__(self, account_root_file: AnyAccountRootFile):
+        self.account_root_file = account_root_file
+        self.next_block_number = account_root_file.get_next_block_number()
+        self.updated_balances: dict[str, BlockAccountBalance] = {}
+        self.updated_block_numbers: dict[str, int] = {}  # numbers of blocks that updated balances last time
+
+        # Attributes of the last applied block (for making account root file)
+        self.last_block_identifier: Optional[str] = None
+        self.last_block_timestamp: Optional[datetime] = None
+        self.last_block_message_hash: Optional[str] = None
+
+    def apply_block(self, block: Block):
+        message = block.message
+        assert message.block_number == self.next_block_number
+
+        updated_balances = self.updated_balances
+        for account, block_balance in message.updated_balances.items():
+            balance = updated_balances.get(account)
+            if balance is None:
+                updated_balances[account] = BlockAccountBalance(value=block_balance.value, lock=block_balance.lock)
+            else:
+                balance.value = block_balance.value
+                lock = block_balance.lock
+                if lock:
+                    balance.lock = lock
+
+            self.updated_block_numbers[account] = message.block_number
+
+        self.next_block_number += 1
+        self.last_block_identifier = message.block_identifier
+        self.last_block_timestamp = message.timestamp
+        self.last_block_message_hash = block.message_hash
+
+    def rebase(self, account_root_file: AnyAccountRootFile):
+        """
+        Use `account_root_file` as a new base. The account root file must not include blocks that have not been
+        applied yet (balances updated by blocks included in the account root file are dropped).
+        """
+        next_block_number = account_root_file.get_next_block_number()
+        assert next_block_number <= self.next_block_number
+        logger.debug('Rebasing account balance index on next block number %s', next_block_number)
+        self.account_root_file = account_root_file
+        if next_block_number == self.next_block_number:
+            self.updated_balances = {}
+            self.updated_block_numbers = {}
+            self.last_block_identifier = None
+            self.last_block_timestamp = None
+            self.last_block_message_hash = None
+        else:
+            updated_block_numbers = {
+                account: block_number
+                for account, block_number in self.updated_block_numbers.items()
+                if block_number >= next_block_number
+            }
+            self.updated_balances = {account: self.updated_balances[account] for account in updated_block_numbers}
+            self.updated_block_numbers = updated_block_numbers
+
+    def copy(self) -> 'AccountBalanceIndex':
+        """
+        Return a copy of the index which is not affected by blocks applied to the original index.
+        """
+        index_copy = AccountBalanceIndex(self.account_root_file)
+        index_copy.next_block_number = self.next_block_number
+        index_copy.updated_balances = {
+            account: BlockAccountBalance(value=balance.value, lock=balance.lock)
+            for account, balance in self.updated_balances.items()
+        }
+        index_copy.updated_block_numbers = self.updated_block_numbers.copy()
+        index_copy.last_block_identifier = self.last_block_identifier
+        index_copy.last_block_timestamp = self.last_block_timestamp
+        index_copy.last_block_message_hash = self.last_block_message_hash
+        return index_copy
+
+    def make_account_root_file(self) -> AccountRootFile:
+        """
+        Make account root file that includes all applied blocks by merging updated balances into the base account
+        root file (blocks are not traversed).
+        """
+        base_account_root_file = self.account_root_file
+        accounts = {
+            account: AccountBalance(value=balance.value, lock=balance.lock)
+            for account, balance in base_account_root_file.accounts.items()
+        }
+        for account, balance in self.updated_balances.items():
+            base_balance = accounts.get(account)
+            if base_balance is None:
+                accounts[account] = AccountBalance(value=balance.value, lock=balance.lock or account)
+            else:
+                base_balance.value = balance.value
+                lock = balance.lock
+                if lock:
+                    base_balance.lock = lock
+
+        if self.next_block_number == base_account_root_file.get_next_block_number():
+            return AccountRootFile(
+                accounts=accounts,
+                last_block_number=base_account_root_file.last_block_number,
+                last_block_identifier=base_account_root_file.last_block_identifier,
+                last_block_timestamp=base_account_root_file.last_block_timestamp,
+                next_block_identifier=base_account_root_file.next_block_identifier,
+            )
+
+        return AccountRootFile(
+            accounts=accounts,
+            last_block_number=self.next_block_number - 1,
+            last_block_identifier=self.last_block_identifier,
+            last_block_timestamp=self.last_block_timestamp,
+            next_block_identifier=self.last_block_message_hash,
+        )
+
+    def get_account_count(self) -> int:
+        accounts = self.account_root_file.accounts
+        return len(accounts) + sum(1 for account in self.updated_balances if account not in accounts)
+
+    def iter_account_balances(self) -> Generator[tuple[str, AccountBalance], None, None]:
+        """
+        Yield (account, balance) pairs in the order of make_account_root_file() accounts, but without copying
+        balances that have not been updated.
+        """
+        accounts = self.account_root_file.accounts
+        updated_balances = self.updated_balances
+        for account, base_balance in accounts.items():
+            balance = updated_balances.get(account)
+            if balance is None:
+                yield account, base_balance
+            else:
+                yield account, AccountBalance(value=balance.value, lock=balance.lock or base_balance.lock)
+
+        for account, balance in updated_balances.items():
+            if account not in accounts:
+                yield account, AccountBalance(value=balance.value, lock=balance.lock or account)
+
+    def get_balance_value(self, account: str) -> Optional[int]:
+        balance = self.updated_balances.get(account)
+        if balance is not None:
+            return balance.value
+
+        return self.account_root_file.get_balance_value(account)
+
+    def get_balance_lock(self, account: str) -> str:
+        balance = self.updated_balances.get(account)
+        if balance is not None and balance.lock:
+            return balance.lock
+
+        return self.account_root_file.get_balance_lock(account)
@@ -0,0 +1,184 @@
+import logging
+import mmap
+import struct
+from collections.abc import Mapping
+from typing import Optional
+
+import msgpack
+
+from thenewboston_node.business_logic.models.account_balance import AccountBalance
+from thenewboston_node.business_logic.models.account_root_file import AccountRootFile
+from thenewboston_node.core.utils.misc import bytes_to_hex, hex_to_bytes
+from thenewboston_node.core.utils.os import write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'TNBACCD3'
+# magic, account root file identifier (last block number or -1, next block identifier or zeros), attributes length,
+# account count
+HEADER = struct.Struct('<8sq32sIQ')
+ENTRY = struct.Struct('<32sQI')  # account number, balance offset, balance length
+ORDER_ENTRY = struct.Struct('<I')  # index of entry in account root file accounts order
+ACCOUNT_NUMBER_LENGTH = 32
+BLOCK_IDENTIFIER_LENGTH = 32
+NO_BLOCK_IDENTIFIER = bytes(BLOCK_IDENTIFIER_LENGTH)
+
+
+def write_account_directory(path, account_root_file: AccountRootFile) -> bool:
+    """
+    Write account root file as an account directory: account root file attributes (except accounts) followed by
+    account numbers sorted for binary search, entry indexes in the original accounts order (for iteration) and
+    individually packed balances. Return False if the account root file cannot be represented as an account
+    directory.
+
+    Account root file last block number and next block identifier are also stored in the header, so the account
+    directory can be checked to be made from a particular account root file without reading the attributes.
+    """
+    next_block_identifier = account_root_file.next_block_identifier
+    try:
+        next_block_identifier_bytes = (
+            NO_BLOCK_IDENTIFIER if next_block_identifier is None else hex_to_bytes(next_block_identifier)
+        )
+    except (TypeError, ValueError):
+        next_block_identifier_bytes = b''
+
+    if len(next_block_identifier_bytes) != BLOCK_IDENTIFIER_LENGTH:
+        logger.warning('Could not make account directory: unexpected next block identifier %s', next_block_identifier)
+        return False
+
+    packer = msgpack.Packer()
+    accounts = []
+    for account, balance in account_root_file.accounts.items():
+        try:
+            account_bytes = hex_to_bytes(account)
+            packed_balance = packer.pack((balance.value, hex_to_bytes(balance.lock)))
+        except (TypeError, ValueError):
+            account_bytes = b''
+
+        if len(account_bytes) != ACCOUNT_NUMBER_LENGTH:
+            logger.warning('Could not make account directory: unexpected account %s balance', account)
+            return False
+
+        accounts.append((account_bytes, packed_balance))
+
+    order = sorted(range(len(accounts)), key=lambda index: accounts[index][0])
+    entry_indexes = [0] * len(accounts)
+    for entry_index, index in enumerate(order):
+        entry_indexes[index] = entry_index
+
+    accounts = [accounts[index] for index in order]
+
+    attributes = AccountRootFile(
+        accounts={},
+        last_block_number=account_root_file.last_block_number,
+        last_block_identifier=account_root_file.last_block_identifier,
+        last_block_timestamp=account_root_file.last_block_timestamp,
+        next_block_identifier=account_root_file.next_block_identifier,
+    ).to_messagepack()
+
+    offset = HEADER.size + len(attributes) + (ENTRY.size + ORDER_ENTRY.size) * len(accounts)
+    entries = []
+    for account_bytes, packed_balance in accounts:
+        entries.append(ENTRY.pack(account_bytes, offset, len(packed_balance)))
+        offset += len(packed_balance)
+
+    write_file_atomically(
+        path, b''.join((
+            HEADER.pack(
+                MAGIC,
+                -1 if account_root_file.last_block_number is None else account_root_file.last_block_number,
+                next_block_identifier_bytes,
+                len(attributes),
+                len(accounts),
+            ),
+            attributes,
+            *entries,
+            *map(ORDER_ENTRY.pack, entry_indexes),
+            *(packed_balance for _, packed_balance in accounts),
+        ))
+    )
+    return True
+
+
+class AccountDirectory(Mapping):
+    """
+    Read-only memory-mapped account directory: only requested account balances are decoded. Accounts are
+    iterated in the order of the original account root file accounts.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as fo:
+            self._mmap = mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, last_block_number, next_block_identifier, attributes_length, count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f'Invalid account directory file: {path}')
+
+        # Identifier of the account root file the account directory is made from
+        self.last_block_number: Optional[int] = None if last_block_number < 0 else last_block_number
+        self.next_block_identifier: Optional[str] = (
+            None if next_block_identifier == NO_BLOCK_IDENTIFIER else bytes_to_hex(next_block_identifier)
+        )
+
+        self._count = count
+        self._entries_start = HEADER.size + attributes_length
+        self._order_start = self._entries_start + ENTRY.size * count
+
+    def get_attributes(self) -> AccountRootFile:
+        """
+        Return account root file with all the attributes set, but accounts.
+        """
+        return AccountRootFile.from_messagepack(self._mmap[HEADER.size:self._entries_start])
+
+    def __getitem__(self, account: str) -> AccountBalance:
+        balance = self.get_balance(account)
+        if balance is None:
+            raise KeyError(account)
+
+        return balance
+
+    def __iter__(self):
+        mmap_ = self._mmap
+        entries_start = self._entries_start
+        for (entry_index,) in ORDER_ENTRY.iter_unpack(
+            mmap_[self._order_start:self._order_start + ORDER_ENTRY.size * self._count]
+        ):
+            position = entries_start + entry_index * ENTRY.size
+            yield bytes_to_hex(mmap_[position:position + ACCOUNT_NUMBER_LENGTH])
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, account):
+        return self._find(account) is not None
+
+    def get_balance(self, account: str) -> Optional[AccountBalance]:
+        position = self._find(account)
+        if position is None:
+            return None
+
+        _, offset, length = ENTRY.unpack_from(self._mmap, position)
+        value, lock = msgpack.unpackb(self._mmap[offset:offset + length])
+        return AccountBalance(value=value, lock=bytes_to_hex(lock))
+
+    def _find(self, account: str) -> Optional[int]:
+        try:
+            account_bytes = hex_to_bytes(account)
+        except (TypeError, ValueError):
+            return None
+
+        mmap_ = self._mmap
+        entries_start = self._entries_start
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = entries_start + middle * ENTRY.size
+            current_account_bytes = mmap_[position:position + ACCOUNT_NUMBER_LENGTH]
+            if current_account_bytes < account_bytes:
+                low = middle + 1
+            elif current_account_bytes > account_bytes:
+                high = middle
+            else:
+                return position
+
+        return None
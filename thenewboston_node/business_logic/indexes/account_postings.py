@@ -0,0 +1,111 @@
+import logging
+import os
+from array import array
+from bisect import bisect_right
+from typing import Optional
+
+import msgpack
+
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.core.utils.misc import bytes_to_hex, hex_to_bytes
+from thenewboston_node.core.utils.os import truncate_incomplete_tail, write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+
+class AccountPostings:
+    """
+    Per account sorted lists of numbers of the blocks that updated the account balance (and balance lock
+    separately). Optionally persisted to `path` as an append-only messagepack log of
+    (block_number, accounts, accounts_with_lock) records.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+
+        self.first_block_number: Optional[int] = None
+        self.next_block_number: Optional[int] = None
+        self._balance_postings: dict[str, array] = {}
+        self._lock_postings: dict[str, array] = {}
+
+    def load(self) -> bool:
+        """
+        Load postings from the file. Return False if the file is missing or corrupted.
+        """
+        assert self.path
+        self._clear()
+        try:
+            with open(self.path, 'r+b') as fo:
+                unpacker = msgpack.Unpacker(fo)
+                size = 0
+                for block_number, accounts, accounts_with_lock in unpacker:
+                    self._add(block_number, map(bytes_to_hex, accounts), map(bytes_to_hex, accounts_with_lock))
+                    size = unpacker.tell()
+
+                truncate_incomplete_tail(fo, size)
+        except FileNotFoundError:
+            logger.debug('Account postings file %s is not found', self.path)
+            self._clear()
+            return False
+        except Exception:
+            logger.warning('Account postings file %s is corrupted', self.path, exc_info=True)
+            self._clear()
+            return False
+
+        return True
+
+    def clear(self):
+        self._clear()
+        if self.path:
+            write_file_atomically(self.path, b'')
+
+    def add_block(self, block: Block):
+        message = block.message
+        block_number = message.block_number
+        accounts = list(message.updated_balances)
+        accounts_with_lock = [account for account, balance in message.updated_balances.items() if balance.lock]
+        self._add(block_number, accounts, accounts_with_lock)
+
+        path = self.path
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'ab') as fo:
+                fo.write(
+                    msgpack.packb((
+                        block_number, [hex_to_bytes(account) for account in accounts],
+                        [hex_to_bytes(account) for account in accounts_with_lock]
+                    ))
+                )
+
+    def get_last_block_number(self, account: str, before_block_number: int, must_have_lock=False) -> Optional[int]:
+        """
+        Return number of the last block (before `before_block_number`) that updated the account balance (or
+        balance lock if `must_have_lock` is True).
+        """
+        postings = (self._lock_postings if must_have_lock else self._balance_postings).get(account)
+        if not postings:
+            return None
+
+        index = bisect_right(postings, before_block_number - 1) - 1
+        return None if index < 0 else postings[index]
+
+    def _add(self, block_number, accounts, accounts_with_lock):
+        next_block_number = self.next_block_number
+        if next_block_number is None:
+            self.first_block_number = block_number
+        elif block_number != next_block_number:
+            raise ValueError(f'Expected block number {next_block_number}, but got {block_number}')
+
+        for account in accounts:
+            self._balance_postings.setdefault(account, array('Q')).append(block_number)
+
+        for account in accounts_with_lock:
+            self._lock_postings.setdefault(account, array('Q')).append(block_number)
+
+        self.next_block_number = block_number + 1
+
+    def _clear(self):
+        self.first_block_number = None
+        self.next_block_number = None
+        self._balance_postings = {}
+        self._lock_postings = {}
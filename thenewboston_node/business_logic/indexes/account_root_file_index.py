@@ -0,0 +1,73 @@
+import logging
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+INITIAL_ACCOUNT_ROOT_FILE_KEY = -1
+
+
+def get_key(last_block_number: Optional[int]) -> int:
+    return INITIAL_ACCOUNT_ROOT_FILE_KEY if last_block_number is None else last_block_number
+
+
+class AccountRootFileIndex:
+    """
+    In-memory sorted index of account root files by their last block number (the initial account root file goes
+    first). It is built from the account root files directory listing, so account root files are not loaded.
+
+    Entries are replaced (not modified in place), so the index can be read while an account root file is being
+    added from another thread.
+    """
+
+    def __init__(self):
+        self.is_loaded = False
+        self._entries: list[tuple[int, str]] = []  # sorted (key, file_path) pairs
+
+    def rebuild(self, items: Iterable[tuple[Optional[int], str]]):
+        """
+        Rebuild the index from (last_block_number, file_path) pairs.
+        """
+        self._entries = sorted((get_key(last_block_number), file_path) for last_block_number, file_path in items)
+        self.is_loaded = True
+
+    def add(self, last_block_number: Optional[int], file_path: str):
+        key = get_key(last_block_number)
+        entries = self._entries.copy()
+        index = bisect_left(entries, (key,))
+        if index < len(entries) and entries[index][0] == key:
+            entries[index] = (key, file_path)
+        else:
+            entries.insert(index, (key, file_path))
+
+        self._entries = entries
+
+    def get_closest_file_path(self, excludes_block_number: Optional[int] = None) -> Optional[str]:
+        """
+        Return file path of the latest account root file that does not include `excludes_block_number`
+        (the last account root file if `excludes_block_number` is None).
+        """
+        entries = self._entries
+        if not entries:
+            return None
+
+        if excludes_block_number is None:
+            return entries[-1][1]
+
+        if excludes_block_number == -1:
+            key, file_path = entries[0]
+            return file_path if key == INITIAL_ACCOUNT_ROOT_FILE_KEY else None
+
+        index = bisect_left(entries, (excludes_block_number,)) - 1
+        return None if index < 0 else entries[index][1]
+
+    def get_first_file_path(self) -> Optional[str]:
+        entries = self._entries
+        return entries[0][1] if entries else None
+
+    def get_last_file_path(self) -> Optional[str]:
+        entries = self._entries
+        return entries[-1][1] if entries else None
+
+    def __len__(self):
+        return len(self._entries)
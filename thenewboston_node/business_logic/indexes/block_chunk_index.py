@@ -0,0 +1,192 @@
+import logging
+import os
+from bisect import bisect_right
+from typing import Generator, Iterable, NamedTuple, Optional
+
+import msgpack
+
+from thenewboston_node.core.utils.os import truncate_incomplete_tail, write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+# Compact the log when it contains this many times more records than there are chunks
+COMPACTION_RATIO = 2
+MIN_RECORDS_TO_COMPACT = 1000
+
+
+class BlockChunk(NamedTuple):
+    start: int
+    end: int
+    file_path: str
+
+
+class BlockChunkIndex:
+    """
+    Persistent block number to block chunk file mapping.
+
+    The index is stored as an append-only messagepack log of (start, end, file_path) records, the latest
+    record for a given chunk start wins. The log is compacted from time to time. If the index file is lost or
+    corrupted the index must be rebuilt with `rebuild()` from the block storage directory listing.
+
+    Records appended (or the log compacted) by another process are picked up with `refresh()`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.is_loaded = False
+
+        self._starts: list[int] = []  # sorted
+        self._chunks: dict[int, BlockChunk] = {}
+        self._record_count = 0
+        # (inode, size) of the log as it was read or written by this instance
+        self._file_version: Optional[tuple[int, int]] = None
+
+    def load(self) -> bool:
+        """
+        Load the index from the file. Return False if the index file is missing or corrupted.
+        """
+        self._clear()
+        try:
+            with open(self.path, 'r+b') as fo:
+                size = self._read_records(fo)
+                truncate_incomplete_tail(fo, size)
+                self._file_version = os.fstat(fo.fileno()).st_ino, size
+        except FileNotFoundError:
+            logger.debug('Block chunk index file %s is not found', self.path)
+            self._clear()
+            return False
+        except Exception:
+            logger.warning('Block chunk index file %s is corrupted', self.path, exc_info=True)
+            self._clear()
+            return False
+
+        self.is_loaded = True
+        return True
+
+    def is_outdated(self) -> bool:
+        """
+        Return True if the log was appended to, compacted or removed since it was read or written by this instance.
+        """
+        try:
+            return self._get_file_version() != self._file_version
+        except FileNotFoundError:
+            return self.is_loaded
+
+    def refresh(self) -> bool:
+        """
+        Bring the index up to date with the log. Only the appended records are read unless the log was compacted.
+        Return False if the index file is missing or corrupted.
+        """
+        file_version = self._file_version
+        if not self.is_loaded or file_version is None:
+            return self.load()
+
+        try:
+            with open(self.path, 'rb') as fo:
+                inode = os.fstat(fo.fileno()).st_ino
+                if inode != file_version[0]:
+                    return self.load()
+
+                fo.seek(file_version[1])
+                # A record being appended by another process is not truncated, it is read on the next refresh
+                size = file_version[1] + self._read_records(fo)
+        except Exception:
+            logger.debug('Could not read block chunk index file %s appended records', self.path, exc_info=True)
+            return self.load()
+
+        self._file_version = inode, size
+        return True
+
+    def rebuild(self, chunks: Iterable[BlockChunk]) -> bool:
+        """
+        Rebuild the index from `chunks`. Return False if the index has not changed (it is not rewritten then).
+        """
+        chunks_by_start = {chunk.start: chunk for chunk in chunks}
+        if self.is_loaded and chunks_by_start == self._chunks:
+            logger.debug('Block chunk index %s is up to date', self.path)
+            return False
+
+        logger.debug('Rebuilding block chunk index %s', self.path)
+        self._clear()
+        for chunk in sorted(chunks_by_start.values()):
+            self._set(chunk)
+
+        self._dump()
+        self.is_loaded = True
+        return True
+
+    def update(self, chunk: BlockChunk):
+        assert self.is_loaded
+        self._set(chunk)
+
+        if self._record_count >= MIN_RECORDS_TO_COMPACT and self._record_count > len(self._chunks) * COMPACTION_RATIO:
+            self._dump()
+        else:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'ab') as fo:
+                fo.write(msgpack.packb(tuple(chunk)))
+                self._file_version = os.fstat(fo.fileno()).st_ino, fo.tell()
+
+    def get_chunk(self, block_number: int) -> Optional[BlockChunk]:
+        starts = self._starts
+        index = bisect_right(starts, block_number) - 1
+        if index < 0:
+            return None
+
+        chunk = self._chunks[starts[index]]
+        if block_number > chunk.end:
+            return None
+
+        return chunk
+
+    def iter_chunks(self, direction=1) -> Generator[BlockChunk, None, None]:
+        assert direction in (1, -1)
+        starts = self._starts if direction == 1 else reversed(self._starts)
+        for start in starts:
+            yield self._chunks[start]
+
+    def _read_records(self, fo) -> int:
+        """
+        Read records from the current position of `fo`. Return the size of complete records read.
+        """
+        unpacker = msgpack.Unpacker(fo)
+        size = 0
+        for record in unpacker:
+            start, end, file_path = record
+            if not (isinstance(start, int) and isinstance(end, int) and isinstance(file_path, str)):
+                raise ValueError(f'Invalid block chunk index record: {record}')
+
+            self._set(BlockChunk(start, end, file_path))
+            size = unpacker.tell()
+
+        return size
+
+    def _set(self, chunk: BlockChunk):
+        start = chunk.start
+        if start not in self._chunks:
+            starts = self._starts
+            if not starts or starts[-1] < start:
+                starts.append(start)  # the most common case: a new chunk is added to the end
+            else:
+                starts.insert(bisect_right(starts, start), start)
+
+        self._chunks[start] = chunk
+        self._record_count += 1
+
+    def _clear(self):
+        self.is_loaded = False
+        self._starts = []
+        self._chunks = {}
+        self._record_count = 0
+        self._file_version = None
+
+    def _dump(self):
+        packer = msgpack.Packer()
+        binary_data = b''.join(packer.pack(tuple(chunk)) for chunk in self.iter_chunks())
+        write_file_atomically(self.path, binary_data)
+        self._record_count = len(self._chunks)
+        self._file_version = self._get_file_version()
+
+    def _get_file_version(self) -> tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_ino, stat.st_size
@@ -0,0 +1,103 @@
+import logging
+import os
+import struct
+import sys
+from array import array
+from typing import Optional, Sequence
+
+import msgpack
+from cachetools import LRUCache
+
+from thenewboston_node.core.utils.os import write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+OFFSET_FORMAT = '<Q'
+OFFSETS_FILENAME_TEMPLATE = '{chunk_start}-block-chunk-offsets.bin'
+ORDER_OF_CHUNK_START = 20
+
+
+def make_block_chunk_offsets(data: bytes) -> array:
+    """
+    Return end byte offsets of messagepack serialized blocks found in block chunk `data`
+    (blocks are skipped, not deserialized).
+    """
+    unpacker = msgpack.Unpacker()
+    unpacker.feed(data)
+
+    offsets = array('Q')
+    while True:
+        try:
+            unpacker.skip()
+        except msgpack.OutOfData:
+            break
+
+        offsets.append(unpacker.tell())
+
+    return offsets
+
+
+def get_block_span(offsets: array, index: int) -> tuple[int, int]:
+    return offsets[index - 1] if index else 0, offsets[index]
+
+
+class BlockChunkOffsets:
+    """
+    Per block chunk tables of block end byte offsets within uncompressed chunk data.
+
+    A table is appended to as blocks are appended to the block chunk and it is kept when the block chunk is
+    finalized (and compressed), so a single block can be decoded without deserializing its neighbours.
+    Tables are addressed by block chunk start block number.
+    """
+
+    def __init__(self, directory, cache_size=128):
+        self.directory = directory
+        self.cache = LRUCache(cache_size)
+
+    def get(self, chunk_start: int, min_count=0) -> Optional[array]:
+        """
+        Return offsets table for chunk starting at `chunk_start`. The table is reread if the cached one contains
+        less than `min_count` offsets (it may have been appended to by another process).
+        """
+        offsets = self.cache.get(chunk_start)
+        if offsets is not None and len(offsets) >= min_count:
+            return offsets
+
+        try:
+            with open(self._get_path(chunk_start), 'rb') as fo:
+                binary_data = fo.read()
+        except FileNotFoundError:
+            return None
+
+        if len(binary_data) % struct.calcsize(OFFSET_FORMAT):
+            logger.warning('Block chunk offsets for chunk starting at %s are corrupted', chunk_start)
+            return None
+
+        offsets = array('Q', binary_data)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+
+        self.cache[chunk_start] = offsets
+        return offsets
+
+    def append(self, chunk_start: int, end_offset: int):
+        self.extend(chunk_start, (end_offset,))
+
+    def extend(self, chunk_start: int, end_offsets: Sequence[int]):
+        path = self._get_path(chunk_start)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, 'ab') as fo:
+            fo.write(b''.join(struct.pack(OFFSET_FORMAT, end_offset) for end_offset in end_offsets))
+
+        offsets = self.cache.get(chunk_start)
+        if offsets is not None:
+            offsets.extend(end_offsets)
+
+    def save(self, chunk_start: int, offsets: array):
+        binary_data = b''.join(struct.pack(OFFSET_FORMAT, offset) for offset in offsets)
+        write_file_atomically(self._get_path(chunk_start), binary_data)
+        self.cache[chunk_start] = offsets
+
+    def _get_path(self, chunk_start: int) -> str:
+        filename = OFFSETS_FILENAME_TEMPLATE.format(chunk_start=str(chunk_start).zfill(ORDER_OF_CHUNK_START))
+        return os.path.join(self.directory, filename)
@@ -0,0 +1,89 @@
+import logging
+import os
+from typing import Optional
+
+import msgpack
+
+from thenewboston_node.core.utils.os import write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+
+class HeadBlockMetadata:
+    """
+    Head block number, head block message hash and block count kept in memory and persisted to a small file
+    (rewritten atomically), so they are not found by listing and reading block chunks.
+
+    The file is reloaded if it was rewritten by another process.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.is_loaded = False
+
+        self.block_number: Optional[int] = None
+        self.message_hash: Optional[str] = None
+        self.block_count = 0
+        self._file_version: Optional[tuple[int, int]] = None
+
+    def load(self) -> bool:
+        """
+        Load metadata from the file. Return False if the file is missing or corrupted.
+        """
+        self.clear()
+        try:
+            file_version = self._get_file_version()
+            with open(self.path, 'rb') as fo:
+                block_number, message_hash, block_count = msgpack.unpackb(fo.read())
+
+            if not (isinstance(block_number, int) and isinstance(block_count, int)):
+                raise ValueError('Invalid head block metadata')
+        except FileNotFoundError:
+            logger.debug('Head block metadata file %s is not found', self.path)
+            return False
+        except Exception:
+            logger.warning('Head block metadata file %s is corrupted', self.path, exc_info=True)
+            return False
+
+        self._set(block_number, message_hash, block_count)
+        self._file_version = file_version
+        return True
+
+    def is_outdated(self) -> bool:
+        """
+        Return True if the file was rewritten (or removed) since it was loaded or saved.
+        """
+        try:
+            return self._get_file_version() != self._file_version
+        except FileNotFoundError:
+            return self.is_loaded
+
+    def update(self, block_number: int, message_hash: Optional[str], block_count: int, persist=True):
+        """
+        Update metadata in memory and rewrite the file unless `persist` is False (then the file remains behind
+        until the next persisted update).
+        """
+        self._set(block_number, message_hash, block_count)
+        if not persist:
+            return
+
+        # Metadata is validated on load, so it is not fsynced (for performance reasons)
+        write_file_atomically(self.path, msgpack.packb((block_number, message_hash, block_count)), fsync=False)
+        self._file_version = self._get_file_version()
+
+    def clear(self):
+        self.is_loaded = False
+        self.block_number = None
+        self.message_hash = None
+        self.block_count = 0
+        self._file_version = None
+
+    def _set(self, block_number: int, message_hash: Optional[str], block_count: int):
+        self.block_number = block_number
+        self.message_hash = message_hash
+        self.block_count = block_count
+        self.is_loaded = True
+
+    def _get_file_version(self) -> tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_ino, stat.st_mtime_ns
@@ -0,0 +1,43 @@
+import logging
+from typing import NamedTuple, Optional
+
+import msgpack
+
+from thenewboston_node.core.utils.os import remove_quite, write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationCheckpoint(NamedTuple):
+    block_number: int  # all blocks up to (and including) this one are validated
+    message_hash: str
+
+
+class ValidationCheckpointFile:
+    """
+    Durable blocks validation checkpoint: the file is rewritten atomically and fsynced.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self) -> Optional[ValidationCheckpoint]:
+        try:
+            with open(self.path, 'rb') as fo:
+                block_number, message_hash = msgpack.unpackb(fo.read())
+
+            if not (isinstance(block_number, int) and isinstance(message_hash, str)):
+                raise ValueError('Invalid validation checkpoint')
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning('Validation checkpoint file %s is corrupted', self.path, exc_info=True)
+            return None
+
+        return ValidationCheckpoint(block_number, message_hash)
+
+    def save(self, checkpoint: Optional[ValidationCheckpoint]):
+        if checkpoint is None:
+            remove_quite(self.path)
+        else:
+            write_file_atomically(self.path, msgpack.packb(tuple(checkpoint)))
@@ -1,23 +1,29 @@
 import logging
 from dataclasses import dataclass
-from typing import Optional
-
-from dataclasses_json import dataclass_json
+from typing import Optional, Type, TypeVar
 
 from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.core.logging import validates
-from thenewboston_node.core.utils.constants import SENTINEL
-from thenewboston_node.core.utils.dataclass import fake_super_methods
+
+from .base import ChangeTrackingMixin
+
+T = TypeVar('T', bound='AccountBalance')
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass_json
 @dataclass
 class AccountBalance:
     value: int
     lock: str
 
+    @classmethod
+    def from_dict(cls: Type[T], dict_) -> T:
+        return cls(value=dict_['value'], lock=dict_['lock'])
+
+    def to_dict(self):
+        return {'value': self.value, 'lock': self.lock}
+
     @validates('account balance')
     def validate(self, validate_lock=True):
         with validates('account balance attributes'):
@@ -37,19 +43,21 @@ class AccountBalance:
                         raise ValidationError('Account balance lock must be set')
 
 
-@fake_super_methods
-@dataclass_json
 @dataclass
-class BlockAccountBalance(AccountBalance):
+class BlockAccountBalance(ChangeTrackingMixin, AccountBalance):
     lock: Optional[str] = None  # type: ignore
 
-    def override_to_dict(self):  # this one turns into to_dict()
-        dict_ = self.super_to_dict()
+    @classmethod
+    def from_dict(cls: Type[T], dict_) -> T:
+        return cls(value=dict_['value'], lock=dict_.get('lock'))
+
+    def to_dict(self):
+        dict_ = {'value': self.value}
 
         # TODO(dmu) LOW: Implement a better way of removing optional fields or allow them in normalized message
-        value = dict_.get('lock', SENTINEL)
-        if value is None:
-            del dict_['lock']
+        lock = self.lock
+        if lock is not None:
+            dict_['lock'] = lock
 
         return dict_
 
@@ -1,7 +1,9 @@
+import copy
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional, Union
 
 from dataclasses_json import config, dataclass_json
 from marshmallow import fields
@@ -163,3 +165,115 @@ class AccountRootFile(MessagpackCompactableMixin):
                 if not isinstance(account, str):
                     raise ValidationError('Account root file account number must be a string')
                 balance.validate()
+
+
+# These account root file attributes and methods are served by a view without loading the entire account root file
+VIEW_ATTRIBUTE_NAMES = frozenset((
+    'last_block_number',
+    'last_block_identifier',
+    'last_block_timestamp',
+    'next_block_identifier',
+    'get_next_block_number',
+    'is_initial',
+))
+
+
+class ReadOnlyAccounts(Mapping):
+    """
+    Read-only mapping over account root file accounts. Returned balances are copies, so changing them does not
+    affect the underlying account root file.
+    """
+
+    def __init__(self, accounts: dict[str, AccountBalance]):
+        self._accounts = accounts
+
+    def __getitem__(self, account: str) -> AccountBalance:
+        balance = self._accounts[account]
+        return AccountBalance(value=balance.value, lock=balance.lock)
+
+    def __iter__(self):
+        return iter(self._accounts)
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def __contains__(self, account):
+        return account in self._accounts
+
+
+class AccountRootFileView:
+    """
+    Read-only view of an account root file shared between readers (to avoid copying the entire account root file
+    on every read). Use `copy()` to get a mutable account root file.
+    """
+
+    __slots__ = ('_account_root_file', '_attributes', '_load', 'accounts')
+
+    def __init__(self, account_root_file: AccountRootFile):
+        self._init(account_root_file, account_root_file, ReadOnlyAccounts(account_root_file.accounts), None)
+
+    @classmethod
+    def make_lazy(cls, attributes: AccountRootFile, accounts: Mapping, load: Callable[[], AccountRootFile]):
+        """
+        Make a view that serves account root file attributes and accounts from the given sources and loads the
+        entire account root file with `load()` only if it is needed (for hashing, serialization, etc).
+        """
+        view = cls.__new__(cls)
+        view._init(None, attributes, accounts, load)
+        return view
+
+    def _init(self, account_root_file, attributes, accounts, load):
+        object.__setattr__(self, '_account_root_file', account_root_file)
+        object.__setattr__(self, '_attributes', attributes)
+        object.__setattr__(self, '_load', load)
+        object.__setattr__(self, 'accounts', accounts)
+
+    def __getattr__(self, name):
+        if name in VIEW_ATTRIBUTE_NAMES:
+            return getattr(self._attributes, name)
+
+        return getattr(self._get_account_root_file(), name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Account root file view is read-only')
+
+    def __delattr__(self, name):
+        raise AttributeError('Account root file view is read-only')
+
+    def __eq__(self, other):
+        if isinstance(other, AccountRootFileView):
+            other = other._get_account_root_file()
+
+        return self._get_account_root_file() == other
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(last_block_number={self._attributes.last_block_number!r})'
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self._get_account_root_file(), memo)
+
+    def copy(self) -> AccountRootFile:
+        return copy.deepcopy(self._get_account_root_file())
+
+    def get_balance(self, account: str) -> Optional[AccountBalance]:
+        return self.accounts.get(account)
+
+    def get_balance_value(self, account: str) -> Optional[int]:
+        balance = self.get_balance(account)
+        return None if balance is None else balance.value
+
+    def get_balance_lock(self, account: str) -> str:
+        balance = self.get_balance(account)
+        return account if balance is None else balance.lock
+
+    def _get_account_root_file(self) -> AccountRootFile:
+        account_root_file = self._account_root_file
+        if account_root_file is None:
+            account_root_file = self._load()
+            object.__setattr__(self, '_account_root_file', account_root_file)
+
+        return account_root_file
+
+
+# Account root files may be served as read-only views by blockchain implementations
+AnyAccountRootFile = Union[AccountRootFile, AccountRootFileView]
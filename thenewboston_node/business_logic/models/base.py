@@ -1,11 +1,12 @@
 import logging
+import weakref
 from typing import Optional
 
 import msgpack
 
 from thenewboston_node.business_logic.exceptions import InvalidMessageSignatureError
 from thenewboston_node.core.logging import validates
-from thenewboston_node.core.utils.collections import map_values, replace_keys
+from thenewboston_node.core.utils.collections import Translator
 from thenewboston_node.core.utils.cryptography import (
     derive_verify_key, generate_signature, hash_normalized_dict, is_signature_valid
 )
@@ -96,15 +97,99 @@ assert UNCOMPACT_KEY_MAP.keys() == set(COMPACT_KEY_MAP.values())
 assert set(COMPACT_VALUE_MAP.keys()) == set(UNCOMPACT_VALUE_MAP.keys())
 assert set(COMPACT_SUBKEY_MAP.keys()) == set(UNCOMPACT_SUBKEY_MAP.keys())
 
-logger = logging.getLogger(__name__)
 
+def make_compactor(compact_keys, compact_values) -> Translator:
+    return Translator(
+        key_map=COMPACT_KEY_MAP if compact_keys else None,
+        value_map=COMPACT_VALUE_MAP if compact_values else None,
+        subkey_map=COMPACT_SUBKEY_MAP if compact_values else None,
+    )
+
+
+def make_uncompactor(compact_keys, compact_values) -> Translator:
+    # Functions are looked up by source keys, so they must be looked up by compact keys if keys are compacted
+    def by_source_key(map_):
+        return {COMPACT_KEY_MAP[key]: func for key, func in map_.items()} if compact_keys else map_
+
+    return Translator(
+        key_map=UNCOMPACT_KEY_MAP if compact_keys else None,
+        value_map=by_source_key(UNCOMPACT_VALUE_MAP) if compact_values else None,
+        subkey_map=by_source_key(UNCOMPACT_SUBKEY_MAP) if compact_values else None,
+    )
 
-class MessageMixin:
+
+COMPACTORS = {(keys, values): make_compactor(keys, values) for keys in (True, False) for values in (True, False)}
+UNCOMPACTORS = {(keys, values): make_uncompactor(keys, values) for keys in (True, False) for values in (True, False)}
+
+logger = logging.getLogger(__name__)
+
+PARENT_ATTRIBUTE = '_parent'
+CACHE_ATTRIBUTES = ('_normalized', '_hash')
+
+
+class ChangeTrackingMixin:
+    """
+    Drop cached values (see `MessageMixin`) of a model and models containing it when the model attribute is set.
+
+    In-place changes of lists and dicts are not tracked: set the attribute again or call `notify_changed()`.
+    """
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            self._adopt(value)
+            self.notify_changed()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop(PARENT_ATTRIBUTE, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name, value in state.items():
+            if name[0] != '_':
+                self._adopt(value)
+
+    def notify_changed(self):
+        model: Optional[ChangeTrackingMixin] = self
+        while model is not None:
+            dict_ = model.__dict__
+            for attribute in CACHE_ATTRIBUTES:
+                dict_.pop(attribute, None)
+
+            parent_ref = dict_.get(PARENT_ATTRIBUTE)
+            model = None if parent_ref is None else parent_ref()
+
+    def _adopt(self, value):
+        if isinstance(value, ChangeTrackingMixin):
+            children = (value,)
+        elif isinstance(value, list):
+            children = value  # type: ignore
+        elif isinstance(value, dict):
+            children = value.values()  # type: ignore
+        else:
+            return
+
+        parent_ref = weakref.ref(self)
+        for child in children:
+            if isinstance(child, ChangeTrackingMixin):
+                object.__setattr__(child, PARENT_ATTRIBUTE, parent_ref)
+
+
+class MessageMixin(ChangeTrackingMixin):
+    """
+    Normalized message and its hash are cached until the message (or a model it contains) is changed.
+    """
 
     def get_hash(self):
-        normalized_message = self.get_normalized()
-        message_hash = hash_normalized_dict(normalized_message)
-        logger.debug('Got %s hash for message: %r', message_hash, normalized_message)
+        message_hash = self.__dict__.get('_hash')
+        if message_hash is None:
+            normalized_message = self.get_normalized()
+            message_hash = hash_normalized_dict(normalized_message)
+            logger.debug('Got %s hash for message: %r', message_hash, normalized_message)
+            object.__setattr__(self, '_hash', message_hash)
+
         return message_hash
 
     def generate_signature(self, signing_key):
@@ -115,10 +200,18 @@ class MessageMixin:
             raise InvalidMessageSignatureError()
 
     def get_normalized(self) -> bytes:
+        normalized_message = self.__dict__.get('_normalized')
+        if normalized_message is None:
+            normalized_message = self.normalize()
+            object.__setattr__(self, '_normalized', normalized_message)
+
+        return normalized_message
+
+    def normalize(self) -> bytes:
         raise NotImplementedError('Must be implemented in a child class')
 
 
-class SignableMixin:
+class SignableMixin(ChangeTrackingMixin):
 
     verify_key_field_name: Optional[str] = None
 
@@ -160,21 +253,16 @@ class CompactableMixin:
 
     @classmethod
     def from_compact_dict(cls, compact_dict, compact_keys=True, compact_values=True):
-        dict_ = compact_dict
-        if compact_keys:
-            dict_ = replace_keys(dict_, UNCOMPACT_KEY_MAP)
-        if compact_values:
-            dict_ = map_values(dict_, UNCOMPACT_VALUE_MAP)
-            dict_ = map_values(dict_, UNCOMPACT_SUBKEY_MAP, subkeys=True)
-        return cls.from_dict(dict_)
+        if compact_keys or compact_values:
+            compact_dict = UNCOMPACTORS[(compact_keys, compact_values)].translate(compact_dict)
+
+        return cls.from_dict(compact_dict)
 
     def to_compact_dict(self, compact_keys=True, compact_values=True):
         dict_ = self.to_dict()
-        if compact_values:
-            dict_ = map_values(dict_, COMPACT_VALUE_MAP)
-            dict_ = map_values(dict_, COMPACT_SUBKEY_MAP, subkeys=True)
-        if compact_keys:
-            dict_ = replace_keys(dict_, COMPACT_KEY_MAP)
+        if compact_keys or compact_values:
+            dict_ = COMPACTORS[(compact_keys, compact_values)].translate(dict_)
+
         return dict_
 
 
@@ -3,15 +3,12 @@ import warnings
 from dataclasses import dataclass
 from typing import Optional, Type, TypeVar
 
-from dataclasses_json import dataclass_json
-
 from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.business_logic.models.node import PrimaryValidator, RegularNode
 from thenewboston_node.business_logic.network.base import NetworkBase
 from thenewboston_node.business_logic.node import get_signing_key
 from thenewboston_node.core.logging import timeit_method, validates
 from thenewboston_node.core.utils.cryptography import derive_verify_key
-from thenewboston_node.core.utils.dataclass import fake_super_methods
 
 from .base import MessagpackCompactableMixin, SignableMixin
 from .block_message import BlockMessage
@@ -22,8 +19,6 @@ T = TypeVar('T', bound='Block')
 logger = logging.getLogger(__name__)
 
 
-@fake_super_methods
-@dataclass_json
 @dataclass
 class Block(SignableMixin, MessagpackCompactableMixin):
     verify_key_field_name = 'node_identifier'
@@ -71,11 +66,22 @@ class Block(SignableMixin, MessagpackCompactableMixin):
         )
         return cls.from_transfer_request(blockchain, transfer_request)
 
-    def override_to_dict(self):  # this one turns into to_dict()
-        dict_ = self.super_to_dict()
-        # TODO(dmu) LOW: Implement a better way of removing optional fields or allow them in normalized message
-        dict_['message'] = self.message.to_dict()
-        return dict_
+    @classmethod
+    def from_dict(cls: Type[T], dict_) -> T:
+        return cls(
+            node_identifier=dict_['node_identifier'],
+            message=BlockMessage.from_dict(dict_['message']),
+            message_hash=dict_.get('message_hash'),
+            message_signature=dict_.get('message_signature'),
+        )
+
+    def to_dict(self):
+        return {
+            'node_identifier': self.node_identifier,
+            'message': self.message.to_dict(),
+            'message_hash': self.message_hash,
+            'message_signature': self.message_signature,
+        }
 
     def hash_message(self) -> None:
         message_hash = self.message.get_hash()
@@ -86,27 +92,49 @@ class Block(SignableMixin, MessagpackCompactableMixin):
         self.message_hash = message_hash
 
     @validates('block')
-    def validate(self, blockchain):
+    def validate(self, blockchain, validate_signatures=True):
+        """
+        Validate block. Signatures validation can be turned off if signatures were validated separately and found
+        valid (see `validate_signatures()`).
+        """
         with validates(f'block number {self.message.block_number} (identifier: {self.message.block_identifier})'):
             self.validate_node_identifier()
-            self.validate_message(blockchain)
+            self.validate_message(blockchain, validate_signatures=validate_signatures)
 
-            with validates('block signature'):
-                self.validate_signature()
+            if validate_signatures:
+                with validates('block signature'):
+                    self.validate_signature()
 
             self.validate_message_hash()
 
+    @validates('block signatures')
+    def validate_signatures(self):
+        """
+        Validate block and transfer request signatures. These validations do not depend on blockchain state, so
+        they can be run for many blocks in parallel.
+        """
+        with validates(f'block number {self.message.block_number} (identifier: {self.message.block_identifier})'):
+            transfer_request = self.message.transfer_request
+            if transfer_request is None:
+                raise ValidationError('Block message transfer request must present')
+
+            with validates('transfer request signature'):
+                transfer_request.validate_signature()
+
+            with validates('block signature'):
+                self.validate_signature()
+
     @validates('block node identifier')
     def validate_node_identifier(self):
         if not self.node_identifier:
             raise ValidationError('Block node identifier must be set')
 
     @validates('block message on block level')
-    def validate_message(self, blockchain):
+    def validate_message(self, blockchain, validate_signatures=True):
         if not self.message:
             raise ValidationError('Block message must be not empty')
 
-        self.message.validate(blockchain)
+        self.message.validate(blockchain, validate_signatures=validate_signatures)
 
     @validates('block message hash')
     def validate_message_hash(self):
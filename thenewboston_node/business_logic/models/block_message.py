@@ -1,16 +1,12 @@
 import copy
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Callable, Optional
 
-from dataclasses_json import config, dataclass_json
-from marshmallow import fields
-
 from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.core.logging import validates
 from thenewboston_node.core.utils.cryptography import normalize_dict
-from thenewboston_node.core.utils.dataclass import fake_super_methods
 
 from .account_balance import BlockAccountBalance
 from .base import MessageMixin
@@ -52,30 +48,37 @@ def calculate_updated_balances(get_balance_value: Callable[[str], Optional[int]]
     return updated_balances
 
 
-@fake_super_methods
-@dataclass_json
 @dataclass
 class BlockMessage(MessageMixin):
     transfer_request: TransferRequest
     # We need timestamp, block_number and block_identifier to be signed and hashed therefore
     # they are include in BlockMessage, not in Block
-    timestamp: datetime = field(  # naive datetime in UTC
-        metadata=config(
-            encoder=datetime.isoformat,
-            decoder=datetime.fromisoformat,
-            mm_field=fields.DateTime(format='iso')
-        )
-    )
+    timestamp: datetime  # naive datetime in UTC
     block_number: int
     block_identifier: str
     updated_balances: dict[str, BlockAccountBalance]
 
-    def override_to_dict(self):  # this one turns into to_dict()
-        dict_ = self.super_to_dict()
-        # TODO(dmu) LOW: Implement a better way of removing optional fields or allow them in normalized message
-        dict_['transfer_request'] = self.transfer_request.to_dict()
-        dict_['updated_balances'] = {key: value.to_dict() for key, value in self.updated_balances.items()}
-        return dict_
+    @classmethod
+    def from_dict(cls, dict_):
+        return cls(
+            transfer_request=TransferRequest.from_dict(dict_['transfer_request']),
+            timestamp=datetime.fromisoformat(dict_['timestamp']),
+            block_number=dict_['block_number'],
+            block_identifier=dict_['block_identifier'],
+            updated_balances={
+                account: BlockAccountBalance.from_dict(balance)
+                for account, balance in dict_['updated_balances'].items()
+            },
+        )
+
+    def to_dict(self):
+        return {
+            'transfer_request': self.transfer_request.to_dict(),
+            'timestamp': self.timestamp.isoformat(),
+            'block_number': self.block_number,
+            'block_identifier': self.block_identifier,
+            'updated_balances': {account: balance.to_dict() for account, balance in self.updated_balances.items()},
+        }
 
     @classmethod
     def from_transfer_request(cls, blockchain, transfer_request: TransferRequest):
@@ -96,8 +99,8 @@ class BlockMessage(MessageMixin):
             updated_balances=calculate_updated_balances(blockchain.get_balance_value, transfer_request),
         )
 
-    def get_normalized(self) -> bytes:
-        return normalize_dict(self.to_dict())  # type: ignore
+    def normalize(self) -> bytes:
+        return normalize_dict(self.to_dict())
 
     def get_balance(self, account: str) -> Optional[BlockAccountBalance]:
         return (self.updated_balances or {}).get(account)
@@ -111,8 +114,8 @@ class BlockMessage(MessageMixin):
         return self.transfer_request.get_recipient_amount(recipient)
 
     @validates('block message')
-    def validate(self, blockchain):
-        self.validate_transfer_request(blockchain)
+    def validate(self, blockchain, validate_signatures=True):
+        self.validate_transfer_request(blockchain, validate_signatures=validate_signatures)
         self.validate_block_number()
 
         assert self.block_number is not None
@@ -122,12 +125,12 @@ class BlockMessage(MessageMixin):
         self.validate_updated_balances(blockchain)
 
     @validates('transfer request on block message level')
-    def validate_transfer_request(self, blockchain):
+    def validate_transfer_request(self, blockchain, validate_signatures=True):
         transfer_request = self.transfer_request
         if transfer_request is None:
             raise ValidationError('Block message transfer request must present')
 
-        transfer_request.validate(blockchain, self.block_number)
+        transfer_request.validate(blockchain, self.block_number, validate_signatures=validate_signatures)
 
     @validates('block message timestamp')
     def validate_timestamp(self, blockchain):
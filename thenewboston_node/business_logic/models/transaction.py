@@ -1,36 +1,37 @@
 from dataclasses import dataclass
-from typing import Optional
-
-from dataclasses_json import dataclass_json
+from typing import Optional, Type, TypeVar
 
 from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.business_logic.models import constants
 from thenewboston_node.core.logging import validates
-from thenewboston_node.core.utils.constants import SENTINEL
-from thenewboston_node.core.utils.dataclass import fake_super_methods
 
+from .base import ChangeTrackingMixin
 
-# TODO(dmu) LOW: Implement a better way of removing optional fields or allow them in normalized message
-def remove_key_if_optional(dict_, key, optional_values=(None,)):
-    value = dict_.get(key, SENTINEL)
-    if value in optional_values:
-        del dict_[key]
+T = TypeVar('T', bound='Transaction')
 
 
-@fake_super_methods
-@dataclass_json
 @dataclass
-class Transaction:
+class Transaction(ChangeTrackingMixin):
     recipient: str
     amount: int
     fee: Optional[bool] = None  # None value won't be serialized
     memo: Optional[str] = None
 
-    def override_to_dict(self):  # this one turns into to_dict()
-        dict_ = self.super_to_dict()
+    @classmethod
+    def from_dict(cls: Type[T], dict_) -> T:
+        return cls(recipient=dict_['recipient'], amount=dict_['amount'], fee=dict_.get('fee'), memo=dict_.get('memo'))
+
+    def to_dict(self):
+        dict_ = {'recipient': self.recipient, 'amount': self.amount}
+
+        # TODO(dmu) LOW: Implement a better way of removing optional fields or allow them in normalized message
+        fee = self.fee
+        if fee not in (None, False):
+            dict_['fee'] = fee
 
-        remove_key_if_optional(dict_, key='fee', optional_values=(None, False))
-        remove_key_if_optional(dict_, key='memo', optional_values=(None,))
+        memo = self.memo
+        if memo is not None:
+            dict_['memo'] = memo
 
         return dict_
 
@@ -3,13 +3,10 @@ import logging
 from dataclasses import dataclass
 from typing import Optional, Type, TypeVar
 
-from dataclasses_json import dataclass_json
-
 from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.business_logic.models.node import PrimaryValidator, RegularNode
 from thenewboston_node.core.logging import timeit_method, validates
 from thenewboston_node.core.utils.cryptography import derive_verify_key
-from thenewboston_node.core.utils.dataclass import fake_super_methods
 
 from .base import SignableMixin
 from .transfer_request_message import TransferRequestMessage
@@ -19,8 +16,6 @@ T = TypeVar('T', bound='TransferRequest')
 logger = logging.getLogger(__name__)
 
 
-@fake_super_methods
-@dataclass_json
 @dataclass
 class TransferRequest(SignableMixin):
     verify_key_field_name = 'sender'
@@ -52,11 +47,20 @@ class TransferRequest(SignableMixin):
         )
         return cls.from_transfer_request_message(message, signing_key)
 
-    def override_to_dict(self):  # this one turns into to_dict()
-        dict_ = self.super_to_dict()
-        # TODO(dmu) LOW: Implement a better way of removing optional fields or allow them in normalized message
-        dict_['message'] = self.message.to_dict()
-        return dict_
+    @classmethod
+    def from_dict(cls: Type[T], dict_) -> T:
+        return cls(
+            sender=dict_['sender'],
+            message=TransferRequestMessage.from_dict(dict_['message']),
+            message_signature=dict_.get('message_signature'),
+        )
+
+    def to_dict(self):
+        return {
+            'sender': self.sender,
+            'message': self.message.to_dict(),
+            'message_signature': self.message_signature,
+        }
 
     def get_sent_amount(self):
         assert self.message
@@ -67,10 +71,11 @@ class TransferRequest(SignableMixin):
         return self.message.get_amount(recipient)
 
     @validates('transfer request')
-    def validate(self, blockchain, block_number: Optional[int] = None):
+    def validate(self, blockchain, block_number: Optional[int] = None, validate_signatures=True):
         self.validate_sender()
         self.validate_message()
-        self.validate_signature()
+        if validate_signatures:
+            self.validate_signature()
         self.validate_amount(blockchain, block_number)
         self.validate_balance_lock(blockchain, block_number)
 
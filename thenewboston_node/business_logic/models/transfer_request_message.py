@@ -2,13 +2,10 @@ import copy
 from dataclasses import dataclass
 from typing import Type, TypeVar
 
-from dataclasses_json import dataclass_json
-
 from thenewboston_node.business_logic.exceptions import ValidationError
 from thenewboston_node.business_logic.models.node import PrimaryValidator, RegularNode
 from thenewboston_node.core.logging import validates
 from thenewboston_node.core.utils.cryptography import normalize_dict
-from thenewboston_node.core.utils.dataclass import fake_super_methods
 
 from .base import MessageMixin
 from .transaction import Transaction
@@ -16,8 +13,6 @@ from .transaction import Transaction
 T = TypeVar('T', bound='TransferRequestMessage')
 
 
-@fake_super_methods
-@dataclass_json
 @dataclass
 class TransferRequestMessage(MessageMixin):
     balance_lock: str
@@ -48,14 +43,15 @@ class TransferRequestMessage(MessageMixin):
     def get_amount(self, recipient):
         return sum(tx.amount for tx in self.txs if tx.recipient == recipient)
 
-    def override_to_dict(self):  # this one turns into to_dict()
-        dict_ = self.super_to_dict()
-        # TODO(dmu) LOW: Implement a better way of removing optional fields or allow them in normalized message
-        dict_['txs'] = [tx.to_dict() for tx in self.txs]
-        return dict_
+    @classmethod
+    def from_dict(cls: Type[T], dict_) -> T:
+        return cls(balance_lock=dict_['balance_lock'], txs=[Transaction.from_dict(tx) for tx in dict_['txs']])
+
+    def to_dict(self):
+        return {'balance_lock': self.balance_lock, 'txs': [tx.to_dict() for tx in self.txs]}
 
-    def get_normalized(self) -> bytes:
-        message_dict = self.to_dict()  # type: ignore
+    def normalize(self) -> bytes:
+        message_dict = self.to_dict()
 
         for tx in message_dict['txs']:
             # This should fire when we add new fields to Transaction and forget to amend the sorting key
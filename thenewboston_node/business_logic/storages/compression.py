@@ -0,0 +1,274 @@
+import bz2
+import gzip
+import logging
+import lzma
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_FUNCTIONS = {
+    'gz': lambda data: gzip.compress(data, compresslevel=9),
+    'bz2': lambda data: bz2.compress(data, compresslevel=9),
+    'xz': lzma.compress
+}
+
+DECOMPRESSION_FUNCTIONS = {
+    'gz': gzip.decompress,
+    'bz2': bz2.decompress,
+    'xz': lzma.decompress,
+}
+
+# Functions opening compressed files as binary streams of decompressed data
+OPEN_FUNCTIONS = {
+    'gz': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+# Faster modern codecs are supported if the corresponding optional packages are installed
+if zstandard is not None:
+    COMPRESSION_FUNCTIONS['zst'] = lambda data: zstandard.ZstdCompressor(level=19).compress(data)
+    DECOMPRESSION_FUNCTIONS['zst'] = lambda data: zstandard.ZstdDecompressor().decompress(data)
+    OPEN_FUNCTIONS['zst'] = lambda path: zstandard.open(path, 'rb')
+
+if lz4 is not None:
+    COMPRESSION_FUNCTIONS['lz4'] = lambda data: lz4.frame.compress(data, compression_level=16)
+    DECOMPRESSION_FUNCTIONS['lz4'] = lz4.frame.decompress
+    OPEN_FUNCTIONS['lz4'] = lz4.frame.open
+
+DEFAULT_COMPRESSORS = ('gz', 'bz2', 'xz')
+
+FILE_CLASS_REMOVE_RE = re.compile(r'\d+')
+
+# Compressors that have not been run yet are timed on this much data to estimate baseline compression time
+TIMING_SAMPLE_SIZE = 64 * 1024
+
+
+def get_file_class(file_path) -> str:
+    """
+    Return file class used for learning the best compressor: the file name without digits (for instance,
+    all block chunks belong to '-block-chunk.msgpack' class).
+    """
+    return FILE_CLASS_REMOVE_RE.sub('', os.path.basename(str(file_path)))
+
+
+@dataclass
+class CompressionStats:
+    file_count: int = 0
+    original_bytes: int = 0
+    compressed_bytes: int = 0
+    milliseconds: float = 0
+    # Time it would have taken to compress with every baseline compressor (and choose the smallest result)
+    baseline_milliseconds: float = 0
+
+    @property
+    def saved_bytes(self):
+        return self.original_bytes - self.compressed_bytes
+
+    @property
+    def saved_milliseconds(self):
+        return self.baseline_milliseconds - self.milliseconds
+
+    def add(self, original_size, compressed_size, milliseconds, baseline_milliseconds):
+        self.file_count += 1
+        self.original_bytes += original_size
+        self.compressed_bytes += compressed_size
+        self.milliseconds += milliseconds
+        self.baseline_milliseconds += baseline_milliseconds
+
+
+class CompressionPolicy:
+    """
+    Compression policy chooses a compressor for a file. It reports statistics: bytes saved by compression and
+    milliseconds saved compared to the baseline of compressing with every one of `baseline_compressors` and choosing
+    the smallest result (see `BestCompressionPolicy`).
+
+    Baseline compressors that are not run on a file are accounted for by their average speed (a compressor that
+    has not been run yet is timed on a sample of the data).
+    """
+
+    def __init__(self, baseline_compressors: Sequence[str] = DEFAULT_COMPRESSORS):
+        self.baseline_compressors = tuple(baseline_compressors)
+        self.stats = CompressionStats()
+        self.compressor_timings: dict[str, tuple[int, float]] = {}  # compressor -> (bytes, milliseconds) in total
+
+        # Compressors run on the entire data of the file being compressed -> milliseconds
+        self._file_compressor_milliseconds: dict[str, float] = {}
+        self._file_size = 0
+
+    def compress(self, file_path, data: bytes) -> tuple[Optional[str], bytes]:
+        """
+        Return (compressor, compressed data) or (None, data) if data should be stored uncompressed.
+        """
+        self._file_compressor_milliseconds = {}
+        self._file_size = len(data)
+
+        start = time.perf_counter()
+        compressor, compressed_data = self._compress(file_path, data)
+        if compressor is None or len(compressed_data) >= len(data):
+            compressor, compressed_data = None, data
+
+        # Baseline is estimated before the time is taken, since it may take compressing a sample
+        baseline_milliseconds = self._get_baseline_milliseconds(data)
+        self.stats.add(len(data), len(compressed_data), (time.perf_counter() - start) * 1000, baseline_milliseconds)
+        return compressor, compressed_data
+
+    def _compress(self, file_path, data: bytes) -> tuple[Optional[str], bytes]:
+        raise NotImplementedError('Must be implemented in a child class')
+
+    def _compress_with(self, compressor: str, data: bytes) -> bytes:
+        start = time.perf_counter()
+        compressed_data = COMPRESSION_FUNCTIONS[compressor](data)  # type: ignore
+        milliseconds = (time.perf_counter() - start) * 1000
+
+        total_bytes, total_milliseconds = self.compressor_timings.get(compressor, (0, 0))
+        self.compressor_timings[compressor] = total_bytes + len(data), total_milliseconds + milliseconds
+        if len(data) == self._file_size:
+            self._file_compressor_milliseconds[compressor] = milliseconds
+
+        return compressed_data
+
+    def _compress_best(self, compressors: Sequence[str], data: bytes) -> tuple[Optional[str], bytes]:
+        best_compressor = None
+        best_data = data
+        for compressor in compressors:
+            compressed_data = self._compress_with(compressor, data)
+            logger.debug(
+                'Data compressed with %s size: %s bytes (%.2f ratio)', compressor, len(compressed_data),
+                len(compressed_data) / max(len(data), 1)
+            )
+            # TODO(dmu) LOW: For compressed_size == best[0] choose fastest compression
+            if len(compressed_data) < len(best_data):
+                best_compressor = compressor
+                best_data = compressed_data
+
+        return best_compressor, best_data
+
+    def _get_baseline_milliseconds(self, data: bytes) -> float:
+        baseline_milliseconds = 0.0
+        for compressor in self.baseline_compressors:
+            milliseconds = self._file_compressor_milliseconds.get(compressor)
+            if milliseconds is None:
+                if compressor not in self.compressor_timings:
+                    self._compress_with(compressor, data[:TIMING_SAMPLE_SIZE])
+
+                total_bytes, total_milliseconds = self.compressor_timings[compressor]
+                milliseconds = total_milliseconds * len(data) / total_bytes if total_bytes else 0
+
+            baseline_milliseconds += milliseconds
+
+        return baseline_milliseconds
+
+
+class BestCompressionPolicy(CompressionPolicy):
+    """
+    Compress with every compressor and choose the smallest result (best ratio, but the slowest).
+    """
+
+    def __init__(self, compressors: Sequence[str] = DEFAULT_COMPRESSORS):
+        super().__init__(baseline_compressors=compressors)
+        self.compressors = tuple(compressors)
+
+    def _compress(self, file_path, data):
+        return self._compress_best(self.compressors, data)
+
+
+class FixedCompressionPolicy(CompressionPolicy):
+    """
+    Always compress with the same compressor.
+    """
+
+    def __init__(self, compressor: str, baseline_compressors: Sequence[str] = DEFAULT_COMPRESSORS):
+        super().__init__(baseline_compressors=baseline_compressors)
+        self.compressor = compressor
+
+    def _compress(self, file_path, data):
+        compressor = self.compressor
+        return compressor, self._compress_with(compressor, data)
+
+
+class SamplingCompressionPolicy(CompressionPolicy):
+    """
+    Choose compressor by compressing a sample (the beginning of the data) with every compressor, then compress
+    the entire data with the chosen compressor only.
+    """
+
+    def __init__(self, compressors: Sequence[str] = DEFAULT_COMPRESSORS, sample_size=64 * 1024):
+        super().__init__(baseline_compressors=compressors)
+        self.compressors = tuple(compressors)
+        self.sample_size = sample_size
+
+    def _compress(self, file_path, data):
+        if len(data) <= self.sample_size:
+            return self._compress_best(self.compressors, data)
+
+        compressor, _ = self._compress_best(self.compressors, data[:self.sample_size])
+        if compressor is None:
+            return None, data
+
+        return compressor, self._compress_with(compressor, data)
+
+
+class LearningCompressionPolicy(CompressionPolicy):
+    """
+    Learn the best compressor per file class (block chunks, account root files, etc): the first `learn_count`
+    files of a class are compressed with every compressor, then the compressor that won most of the times is used.
+    Learning is repeated every `relearn_period` files.
+    """
+
+    def __init__(
+        self,
+        compressors: Sequence[str] = DEFAULT_COMPRESSORS,
+        learn_count=3,
+        relearn_period=1000,
+        get_file_class: Callable[..., str] = get_file_class,
+    ):
+        super().__init__(baseline_compressors=compressors)
+        self.compressors = tuple(compressors)
+        self.learn_count = learn_count
+        self.relearn_period = relearn_period
+        self.get_file_class = get_file_class
+
+        self.file_counts: dict[str, int] = {}
+        self.win_counts: dict[str, dict[Optional[str], int]] = {}
+
+    def get_learned_compressor(self, file_class) -> Optional[str]:
+        win_counts = self.win_counts.get(file_class)
+        if not win_counts:
+            return None
+
+        return max(win_counts, key=lambda compressor: win_counts[compressor])
+
+    def _compress(self, file_path, data):
+        file_class = self.get_file_class(file_path)
+        file_count = self.file_counts.get(file_class, 0)
+        self.file_counts[file_class] = file_count + 1
+
+        if file_count % self.relearn_period < self.learn_count:
+            if file_count % self.relearn_period == 0:
+                self.win_counts[file_class] = {}
+
+            compressor, compressed_data = self._compress_best(self.compressors, data)
+            win_counts = self.win_counts[file_class]
+            win_counts[compressor] = win_counts.get(compressor, 0) + 1
+            return compressor, compressed_data
+
+        compressor = self.get_learned_compressor(file_class)
+        if compressor is None:
+            return None, data
+
+        return compressor, self._compress_with(compressor, data)
@@ -1,29 +1,32 @@
-import bz2
-import gzip
 import logging
-import lzma
 import os
 import stat
+import threading
+import time
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Generator, Optional, Sequence, Union
+
+from cachetools import LRUCache
 
 from thenewboston_node.business_logic import exceptions
 from thenewboston_node.core.logging import timeit_method
+from thenewboston_node.core.utils.os import fsync_file
 
-# TODO(dmu) LOW: Support more / better compression methods
-COMPRESSION_FUNCTIONS = {
-    'gz': lambda data: gzip.compress(data, compresslevel=9),
-    'bz2': lambda data: bz2.compress(data, compresslevel=9),
-    'xz': lzma.compress
-}
-
-DECOMPRESSION_FUNCTIONS = {
-    'gz': gzip.decompress,
-    'bz2': bz2.decompress,
-    'xz': lzma.decompress,
-}
+from .compression import (  # noqa: F401
+    COMPRESSION_FUNCTIONS, DECOMPRESSION_FUNCTIONS, DEFAULT_COMPRESSORS, OPEN_FUNCTIONS, BestCompressionPolicy,
+    CompressionPolicy
+)
 
 STAT_WRITE_PERMS_ALL = stat.S_IWGRP | stat.S_IWUSR | stat.S_IWOTH
+DEFAULT_READ_CHUNK_SIZE = 64 * 1024
+
+# Durability policies: when data appended to a file is fsynced
+FSYNC_ON_APPEND = 'append'
+FSYNC_PERIODICALLY = 'period'
+FSYNC_ON_FINALIZE = 'finalize'
+FSYNC_POLICIES = (FSYNC_ON_APPEND, FSYNC_PERIODICALLY, FSYNC_ON_FINALIZE, None)
+
+MAX_APPEND_WRITERS = 8
 
 logger = logging.getLogger(__name__)
 
@@ -60,41 +63,129 @@ def exist_compressed_file(file_path):
     return False
 
 
+class AppendWriter:
+    """
+    File kept open for appending. Data is written unbuffered (so it is visible to readers at once) and it is
+    fsynced according to the durability policy.
+    """
+
+    def __init__(self, file_path: Path, fsync_policy: Optional[str] = FSYNC_ON_FINALIZE, fsync_period_ms=1000):
+        self.file_path = file_path
+        self.fsync_policy = fsync_policy
+        self.fsync_period_ms = fsync_period_ms
+
+        self.is_dirty = False
+        self._file = open(file_path, 'ab', buffering=0)
+        self._last_fsync_time = time.monotonic()
+
+    def write(self, binary_data: bytes):
+        self._file.write(binary_data)
+        self.is_dirty = True
+
+        fsync_policy = self.fsync_policy
+        if fsync_policy == FSYNC_ON_APPEND or (
+            fsync_policy == FSYNC_PERIODICALLY and
+            (time.monotonic() - self._last_fsync_time) * 1000 >= self.fsync_period_ms
+        ):
+            self.fsync()
+
+    def fsync(self):
+        os.fsync(self._file.fileno())
+        self.is_dirty = False
+        self._last_fsync_time = time.monotonic()
+
+    def close(self, fsync=True):
+        if fsync and self.is_dirty and self.fsync_policy is not None:
+            self.fsync()
+
+        self._file.close()
+
+
 class FileSystemStorage:
     """
     Compressing / decompressing storage for capacity optimization
     """
 
-    def __init__(self, base_path: Union[str, Path], compressors=tuple(COMPRESSION_FUNCTIONS)):
+    def __init__(
+        self,
+        base_path: Union[str, Path],
+        compressors: Sequence[str] = DEFAULT_COMPRESSORS,
+        compression_policy: Optional[CompressionPolicy] = None,
+        compressors_cache_size=1024,
+        fsync_policy: Optional[str] = FSYNC_ON_FINALIZE,
+        fsync_period_ms=1000,
+    ):
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f'fsync_policy must be one of {FSYNC_POLICIES}')
+
         self.base_path = Path(base_path).resolve()
         self.compressors = compressors
+        # Compression policy defaults to choosing the best of `compressors` (compression is off if they are empty)
+        self.compression_policy = (
+            BestCompressionPolicy(compressors) if compression_policy is None and compressors else compression_policy
+        )
+        # Absolute file path to compressor (None for uncompressed files) mapping, so files are not looked for
+        # with every compression extension on each read
+        self.compressors_cache = LRUCache(compressors_cache_size)
+        # Files may be read in background threads (see FileBlockchain validation pipeline), so cache access
+        # is serialized (LRUCache is not thread-safe even for reading)
+        self._compressors_cache_lock = threading.Lock()
+
+        self.fsync_policy = fsync_policy
+        self.fsync_period_ms = fsync_period_ms
+        # Files being appended to are kept open (keyed by relative file path as it was passed)
+        self.append_writers: dict[str, AppendWriter] = {}
 
     @timeit_method()
     def save(self, file_path: Union[str, Path], binary_data: bytes, is_final=False):
         self._persist(file_path, binary_data, 'wb', is_final=is_final)
 
     def load(self, file_path: Union[str, Path]) -> bytes:
-        file_path = self._get_absolute_path(file_path)
-        for decompressor, func in DECOMPRESSION_FUNCTIONS.items():
-            path = str(file_path) + '.' + decompressor
-            try:
-                with open(path, mode='rb') as fo:
-                    data = fo.read()
-            except OSError:
-                continue
+        with self._open_stream(self._get_absolute_path(file_path)) as fo:
+            return fo.read()
 
-            return func(data)  # type: ignore
+    def open_stream(self, file_path: Union[str, Path]) -> BinaryIO:
+        """
+        Open file for reading (decompressed) data as a binary stream.
+        """
+        return self._open_stream(self._get_absolute_path(file_path))
 
-        with open(file_path, mode='rb') as fo:
-            return fo.read()
+    def iter_chunks(self,
+                    file_path: Union[str, Path],
+                    chunk_size=DEFAULT_READ_CHUNK_SIZE) -> Generator[bytes, None, None]:
+        """
+        Yield (decompressed) file data by chunks of up to `chunk_size` bytes.
+        """
+        yield from self._iter_chunks(self._get_absolute_path(file_path), chunk_size)
 
     def append(self, file_path: Union[str, Path], binary_data: bytes, is_final=False):
-        self._persist(file_path, binary_data, 'ab', is_final=is_final)
+        key = str(file_path)
+        writer = self.append_writers.get(key)
+        if writer is None:
+            absolute_file_path = self._get_absolute_path(file_path)
+            ensure_directory_exists_for_file_path(str(absolute_file_path))
+            if self._is_finalized(absolute_file_path):
+                raise exceptions.FinalizedFileWriteError(f'Could not write to finalized file: {absolute_file_path}')
+
+            writer = self._open_append_writer(key, absolute_file_path)
+
+        writer.write(binary_data)
+        if is_final:
+            self._finalize(writer.file_path)
 
     def finalize(self, file_path: Union[str, Path]):
         file_path = self._get_absolute_path(file_path)
         self._finalize(file_path)
 
+    def close(self):
+        """
+        Close files kept open for appending (fsyncing them unless fsync policy is None).
+        """
+        for writer in self.append_writers.values():
+            writer.close()
+
+        self.append_writers = {}
+
     def list_directory(self, prefix=None, sort_direction=1):
         # TODO(dmu) HIGH: Implement it to list only current directory to be consitent with other methods
         #                     that are intended to operate on a give directory without nesting
@@ -103,8 +194,11 @@ class FileSystemStorage:
     def move(self, source: Union[str, Path], destination: Union[str, Path]):
         source = self._get_absolute_path(source)
         destination = self._get_absolute_path(destination)
+        self._close_append_writers(destination)
         ensure_directory_exists_for_file_path(destination)
         os.rename(source, destination)
+        self._move_append_writers(source, destination)
+        self._forget_compressors(source, destination)
 
     def is_finalized(self, file_path: Union[str, Path]):
         file_path = self._get_absolute_path(file_path)
@@ -123,44 +217,112 @@ class FileSystemStorage:
 
         return abs_path
 
+    def _open_append_writer(self, key: str, file_path: Path) -> AppendWriter:
+        append_writers = self.append_writers
+        if len(append_writers) >= MAX_APPEND_WRITERS:
+            append_writers.pop(next(iter(append_writers))).close()
+
+        writer = AppendWriter(file_path, fsync_policy=self.fsync_policy, fsync_period_ms=self.fsync_period_ms)
+        append_writers[key] = writer
+        return writer
+
+    def _close_append_writers(self, *file_paths: Path, fsync=True):
+        append_writers = self.append_writers
+        if not append_writers:
+            return
+
+        for key, writer in list(append_writers.items()):
+            if writer.file_path in file_paths:
+                del append_writers[key]
+                writer.close(fsync=fsync)
+
+    def _move_append_writers(self, source: Path, destination: Path):
+        # Renamed file remains open, so it is appended to without reopening
+        append_writers = self.append_writers
+        for key, writer in list(append_writers.items()):
+            if writer.file_path == source:
+                del append_writers[key]
+                writer.file_path = destination
+                append_writers[str(destination.relative_to(self.base_path))] = writer
+
+    def _open_stream(self, file_path: Path) -> BinaryIO:
+        compressor = self._get_compressor(file_path)
+        try:
+            return self._open_compressed(file_path, compressor)
+        except FileNotFoundError:
+            # The file was finalized, moved or removed bypassing this storage instance, so the cache is outdated
+            logger.debug('Cached compressor of %s is outdated', file_path)
+            self._forget_compressors(file_path)
+            return self._open_compressed(file_path, self._get_compressor(file_path))
+
+    def _iter_chunks(self, file_path: Path, chunk_size) -> Generator[bytes, None, None]:
+        with self._open_stream(file_path) as fo:
+            while True:
+                chunk = fo.read(chunk_size)
+                if not chunk:
+                    break
+
+                yield chunk
+
+    @staticmethod
+    def _open_compressed(file_path: Path, compressor: Optional[str]) -> BinaryIO:
+        if compressor is None:
+            return open(file_path, 'rb')
+
+        return OPEN_FUNCTIONS[compressor](str(file_path) + '.' + compressor)  # type: ignore
+
+    def _get_compressor(self, file_path: Path) -> Optional[str]:
+        key = str(file_path)
+        compressors_cache = self.compressors_cache
+        with self._compressors_cache_lock:
+            if key in compressors_cache:
+                return compressors_cache[key]
+
+        for compressor in DECOMPRESSION_FUNCTIONS:
+            if os.path.exists(key + '.' + compressor):
+                break
+        else:
+            compressor = None
+
+        self._set_compressor(file_path, compressor)
+        return compressor
+
+    def _set_compressor(self, file_path: Path, compressor: Optional[str]):
+        with self._compressors_cache_lock:
+            self.compressors_cache[str(file_path)] = compressor
+
+    def _forget_compressors(self, *file_paths: Path):
+        with self._compressors_cache_lock:
+            for file_path in file_paths:
+                self.compressors_cache.pop(str(file_path), None)
+
     @timeit_method()
     def _compress(self, file_path: Path) -> Path:
-        compressors = self.compressors
-        if not compressors:
+        compression_policy = self.compression_policy
+        if compression_policy is None:
             return file_path
 
         with open(file_path, 'rb') as fo:
             original_data = fo.read()
 
         logger.debug('File %s size: %s bytes', file_path, len(original_data))
-        best_filename = file_path
-        best_data = original_data
-
-        for compressor in self.compressors:
-            compress_function = COMPRESSION_FUNCTIONS[compressor]
-            compressed_data = compress_function(original_data)  # type: ignore
-            compressed_size = len(compressed_data)
-            logger.debug(
-                'File %s compressed with %s size: %s bytes (%.2f ratio)', file_path, compressor, compressed_size,
-                compressed_size / len(original_data)
-            )
-            # TODO(dmu) LOW: For compressed_size == best[0] choose fastest compression
-            if compressed_size < len(best_data):
-                best_filename = Path(str(file_path) + '.' + compressor)
-                best_data = compressed_data
-                logger.debug('New best %s: %s size', best_filename, len(best_data))
-
-        if best_filename != file_path:
-            logger.debug('Writing compressed file: %s (%s bytes)', best_filename, len(best_data))
-            self._write_file(best_filename, best_data, mode='wb')
-
-            logger.debug('Removing %s', file_path)
-            os.remove(file_path)
-
-        return best_filename
+        compressor, compressed_data = compression_policy.compress(file_path, original_data)
+        if compressor is None:
+            return file_path
+
+        compressed_filename = Path(str(file_path) + '.' + compressor)
+        logger.debug('Writing compressed file: %s (%s bytes)', compressed_filename, len(compressed_data))
+        self._write_file(compressed_filename, compressed_data, mode='wb')
+
+        logger.debug('Removing %s', file_path)
+        os.remove(file_path)
+        self._set_compressor(file_path, compressor)
+
+        return compressed_filename
 
     def _persist(self, file_path: Union[str, Path], binary_data: bytes, mode, is_final=False):
         file_path = self._get_absolute_path(file_path)
+        self._close_append_writers(file_path)
         ensure_directory_exists_for_file_path(str(file_path))
 
         # TODO(dmu) HIGH: Optimize for 'wb' mode so we do not need to reread the file from
@@ -171,7 +333,12 @@ class FileSystemStorage:
             self._finalize(file_path)
 
     def _finalize(self, file_path: Path):
+        # The final file is fsynced after compression, so there is no need to fsync the original file
+        self._close_append_writers(file_path, fsync=False)
         new_filename = self._compress(file_path)
+        if self.fsync_policy is not None:
+            fsync_file(new_filename)
+
         drop_write_permissions(new_filename)
 
     @staticmethod
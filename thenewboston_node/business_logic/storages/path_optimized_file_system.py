@@ -1,8 +1,10 @@
 import logging
 import os
 import re
+from bisect import insort
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from .file_system import FileSystemStorage, strip_compression_extension
 
@@ -18,27 +20,51 @@ def make_optimized_file_path(path, max_depth):
     return os.path.join(directory, extra_path, filename)
 
 
+def get_mtime_ns(path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 class PathOptimizedFileSystemStorage(FileSystemStorage):
     """
     Storage decorator transparently placing file to
     subdirectories (for file system performance reason)
     """
 
-    def __init__(self, base_path: Union[str, Path], max_depth=8, **kwargs):
+    def __init__(self, base_path: Union[str, Path], max_depth=8, cache_listing=True, **kwargs):
         super().__init__(base_path=base_path, **kwargs)
         self.max_depth = max_depth
 
+        # Directory listings are cached and kept up to date on file creation and moving. Modification times of
+        # the directories walked to make a listing are recorded, so a listing is remade if files were added or
+        # removed (by other storage instances, other processes or bypassing storage) in any of them
+        self.cache_listing = cache_listing
+        self.listing_cache: dict[str, list[str]] = {}  # directory -> sorted file paths
+        self.listing_cache_mtimes: dict[str, dict[str, Optional[int]]] = {}  # directory -> walked directory mtimes
+        self._known_file_paths: set[str] = set()
+
     def save(self, file_path, binary_data: bytes, is_final=False):
-        return super().save(self._get_optimized_path(file_path), binary_data, is_final=is_final)
+        with self._adding_file(file_path, is_replaced=is_final):
+            return super().save(self._get_optimized_path(file_path), binary_data, is_final=is_final)
 
     def load(self, file_path) -> bytes:
         return super().load(self._get_optimized_path(file_path))
 
+    def open_stream(self, file_path):
+        return super().open_stream(self._get_optimized_path(file_path))
+
+    def iter_chunks(self, file_path, *args, **kwargs):
+        return super().iter_chunks(self._get_optimized_path(file_path), *args, **kwargs)
+
     def append(self, file_path, binary_data: bytes, is_final=False):
-        return super().append(self._get_optimized_path(file_path), binary_data, is_final=is_final)
+        with self._adding_file(file_path, is_replaced=is_final):
+            return super().append(self._get_optimized_path(file_path), binary_data, is_final=is_final)
 
     def finalize(self, file_path):
-        return super().finalize(self._get_optimized_path(file_path))
+        with self._adding_file(file_path, is_replaced=True):
+            return super().finalize(self._get_optimized_path(file_path))
 
     def is_finalized(self, file_path):
         return super().is_finalized(self._get_optimized_path(file_path))
@@ -48,6 +74,11 @@ class PathOptimizedFileSystemStorage(FileSystemStorage):
             raise ValueError('sort_direction must be either of the values: 1, -1, None')
 
         directory_path = prefix or '.'
+        if self.cache_listing:
+            file_paths = self._get_cached_listing(directory_path)
+            yield from (reversed(file_paths) if sort_direction == -1 else file_paths)
+            return
+
         generator = self._list_directory_generator(directory_path)
         if sort_direction is None:
             yield from generator
@@ -56,11 +87,130 @@ class PathOptimizedFileSystemStorage(FileSystemStorage):
 
     def move(self, source, destination):
         optimized_destination = self._get_optimized_path(destination)
-        super().move(self._get_optimized_path(source), optimized_destination)
-
-    def _list_directory_generator(self, directory_path):
+        with self._adding_file(destination, removed_file_path=source):
+            super().move(self._get_optimized_path(source), optimized_destination)
+
+    def get_listing_version(self, prefix=None) -> Optional[tuple]:
+        """
+        Return a value that changes whenever files are added to or removed from directory listing (None if listing
+        is not cached, so the changes are not tracked).
+        """
+        if not self.cache_listing:
+            return None
+
+        key = os.path.normpath(prefix or '.')
+        self._get_cached_listing(key)
+        return tuple(self.listing_cache_mtimes[key].items())
+
+    def invalidate_listing_cache(self):
+        self.listing_cache = {}
+        self.listing_cache_mtimes = {}
+        self._known_file_paths = set()
+
+    def _get_cached_listing(self, directory_path) -> list[str]:
+        key = os.path.normpath(directory_path)
+        file_paths = self.listing_cache.get(key)
+        if file_paths is not None and self._is_cached_listing_valid(key):
+            return file_paths
+
+        directory_mtimes: dict[str, Optional[int]] = {}
+        file_paths = sorted(self._list_directory_generator(directory_path, directory_mtimes))
+        self.listing_cache[key] = file_paths
+        self.listing_cache_mtimes[key] = directory_mtimes
+        self._known_file_paths.update(file_paths)
+        return file_paths
+
+    def _is_cached_listing_valid(self, key) -> bool:
+        directory_mtimes = self.listing_cache_mtimes.get(key)
+        if directory_mtimes is None:
+            return False
+
+        return all(get_mtime_ns(path) == mtime_ns for path, mtime_ns in directory_mtimes.items())
+
+    @contextmanager
+    def _adding_file(self, file_path, removed_file_path=None, is_replaced=False):
+        # File is replaced (with the compressed one) on finalization, so directory is modified
+        file_path = os.path.normpath(file_path)
+        if not self.cache_listing or (
+            removed_file_path is None and not is_replaced and self._is_existing_file(file_path)
+        ):
+            # Writing to an existing file does not change listings
+            yield
+            return
+
+        # Listing is validated before the file is added, so it is not remade because of changes made by the storage
+        key = os.path.dirname(file_path) or '.'
+        is_cache_valid = key in self.listing_cache and self._is_cached_listing_valid(key)
+        yield
+
+        changed_file_paths = [file_path]
+        if removed_file_path is not None:
+            removed_file_path = os.path.normpath(removed_file_path)
+            self._update_cached_listing(removed_file_path, is_removed=True)
+            changed_file_paths.append(removed_file_path)
+
+        self._update_cached_listing(file_path)
+        if not is_cache_valid:
+            self.listing_cache.pop(key, None)
+            self.listing_cache_mtimes.pop(key, None)
+            return
+
+        directory_mtimes = self.listing_cache_mtimes[key]
+        for changed_file_path in changed_file_paths:
+            if (os.path.dirname(changed_file_path) or '.') == key:
+                self._update_directory_mtimes(directory_mtimes, key, changed_file_path)
+
+    def _update_directory_mtimes(self, directory_mtimes: dict[str, Optional[int]], key, file_path):
+        # Directories from the listed one to the one containing the file are updated (they may have been created)
+        directory_path = str(self._get_absolute_path(key))
+        optimized_directory_path = os.path.dirname(self._get_absolute_path(self._get_optimized_path(file_path)))
+        directory_mtimes[directory_path] = get_mtime_ns(directory_path)
+        for name in os.path.relpath(optimized_directory_path, directory_path).split(os.sep):
+            if name != os.curdir:
+                directory_path = os.path.join(directory_path, name)
+                directory_mtimes[directory_path] = get_mtime_ns(directory_path)
+
+    def _is_existing_file(self, file_path) -> bool:
+        known_file_paths = self._known_file_paths
+        if file_path in known_file_paths:
+            return True
+
+        # Listing may have not been cached yet, so we check the file system
+        if os.path.exists(self._get_absolute_path(self._get_optimized_path(file_path))):
+            known_file_paths.add(file_path)
+            return True
+
+        return False
+
+    def _update_cached_listing(self, file_path, is_removed=False):
+        known_file_paths = self._known_file_paths
+        directory_path = os.path.dirname(file_path) or '.'
+        file_paths = self.listing_cache.get(directory_path)
+        if is_removed:
+            known_file_paths.discard(file_path)
+            if file_paths is not None and file_path in file_paths:
+                self.listing_cache[directory_path] = [path for path in file_paths if path != file_path]
+        else:
+            known_file_paths.add(file_path)
+            if file_paths is not None and file_path not in file_paths:
+                # A new list is made, so cached listings that are being iterated are not affected
+                file_paths = file_paths.copy()
+                insort(file_paths, file_path)
+                self.listing_cache[directory_path] = file_paths
+
+    def _list_directory_generator(self, directory_path, directory_mtimes=None):
         directory_path = self._get_absolute_path(directory_path)
-        for dir_path, _, filenames in os.walk(directory_path):
+        if directory_mtimes is None:
+            directory_mtimes = {}
+
+        # Directory modification time is read before the directory is walked, so changes made while it is being
+        # walked are not missed
+        directory_mtimes[str(directory_path)] = get_mtime_ns(directory_path)
+        for dir_path, dir_names, filenames in os.walk(directory_path):
+            for dir_name in dir_names:
+                subdirectory_path = os.path.join(dir_path, dir_name)
+                directory_mtimes[subdirectory_path] = get_mtime_ns(subdirectory_path)
+
             original_filenames = map(strip_compression_extension, filenames)
             unique_filenames = set(original_filenames)  # remove duplicated files after strip
 
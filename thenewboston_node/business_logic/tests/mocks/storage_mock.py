@@ -1,3 +1,6 @@
+import io
+
+
 class StorageMock:
 
     def __init__(self):
@@ -12,6 +15,14 @@ class StorageMock:
     def load(self, file_path) -> bytes:
         return self.files[file_path]
 
+    def open_stream(self, file_path):
+        return io.BytesIO(self.files[file_path])
+
+    def iter_chunks(self, file_path, chunk_size=64 * 1024):
+        data = self.files[file_path]
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset:offset + chunk_size]
+
     def append(self, file_path, binary_data: bytes, is_final=False):
         self.files.setdefault(file_path, b'')
         self.files[file_path] += binary_data
@@ -35,3 +46,6 @@ class StorageMock:
 
     def is_finalized(self, file_path):
         return file_path in self.finalized
+
+    def get_listing_version(self, prefix=None):
+        return None
@@ -1,5 +1,9 @@
 from hashlib import sha3_256
 
+import pytest
+
+from thenewboston_node.business_logic.models.account_root_file import AccountRootFileView
+
 
 def test_normalized_account_root_file(initial_account_root_file):
     assert initial_account_root_file.get_normalized() == (
@@ -20,3 +24,27 @@ def test_get_next_block_identifier(initial_account_root_file):
 
     initial_account_root_file.next_block_identifier = 'next-block-identifier'
     assert initial_account_root_file.get_next_block_identifier() == 'next-block-identifier'
+
+
+def test_account_root_file_view_is_read_only(initial_account_root_file, treasury_account_key_pair):
+    treasury_account = treasury_account_key_pair.public
+    view = AccountRootFileView(initial_account_root_file)
+    assert view == initial_account_root_file
+    assert initial_account_root_file == view
+    assert view.is_initial()
+    assert view.get_normalized() == initial_account_root_file.get_normalized()
+
+    with pytest.raises(AttributeError):
+        view.last_block_number = 10
+
+    with pytest.raises(TypeError):
+        view.accounts[treasury_account] = None
+
+    balance = view.get_balance(treasury_account)
+    balance.value = 0
+    view.accounts[treasury_account].value = 0
+    assert initial_account_root_file.accounts[treasury_account].value != 0
+
+    account_root_file_copy = view.copy()
+    account_root_file_copy.last_block_number = 10
+    assert initial_account_root_file.last_block_number is None
@@ -41,6 +41,7 @@ def test_block_is_appended(file_blockchain_w_memory_storage, user_account, signi
 
     assert blockchain.block_storage.files.keys() == {filename}
     assert blockchain.block_storage.finalized == set()
+    assert blockchain.get_block_count() == 2
 
 
 def test_cannot_add_block_twice(file_blockchain_w_memory_storage, user_account, signing_key):
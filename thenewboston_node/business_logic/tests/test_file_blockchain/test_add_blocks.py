@@ -0,0 +1,134 @@
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.blockchain.pending_blocks import PendingBlocks
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
+
+
+@pytest.fixture
+def source_blockchain(treasury_account_key_pair):
+    blockchain = MemoryBlockchain()
+    generate_blockchain(blockchain, 10, treasury_account_key_pair=treasury_account_key_pair)
+    yield blockchain
+
+
+@pytest.fixture
+def target_blockchain(blockchain_directory, source_blockchain):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=4)
+    blockchain.add_account_root_file(source_blockchain.get_first_account_root_file())
+    yield blockchain
+
+
+def test_can_add_blocks(source_blockchain, target_blockchain):
+    blocks = list(source_blockchain.iter_blocks())
+    storage = target_blockchain.block_storage
+    append_patch = patch.object(storage, 'append', wraps=storage.append)
+    make_account_root_file_patch = patch.object(
+        target_blockchain, 'make_account_root_file', wraps=target_blockchain.make_account_root_file
+    )
+    with append_patch as append_mock, make_account_root_file_patch as make_account_root_file_mock:
+        assert target_blockchain.add_blocks(blocks) == 10
+
+    assert append_mock.call_count == 3  # one append per block chunk
+    make_account_root_file_mock.assert_called_once()
+    assert target_blockchain.get_last_account_root_file().last_block_number == 9
+
+    assert list(target_blockchain.iter_blocks()) == blocks
+    assert target_blockchain.get_block_count() == 10
+    assert target_blockchain.get_next_block_identifier() == blocks[-1].message_hash
+    for account in source_blockchain.get_last_account_root_file().accounts:
+        assert target_blockchain.get_account_balance(account) == source_blockchain.get_account_balance(account)
+
+    target_blockchain.validate()
+
+
+def test_can_add_blocks_in_batches(source_blockchain, target_blockchain):
+    blocks = list(source_blockchain.iter_blocks())
+    with patch.object(target_blockchain, 'persist_blocks', wraps=target_blockchain.persist_blocks) as persist_mock:
+        assert target_blockchain.add_blocks(iter(blocks), batch_size=3) == 10
+
+    assert [len(call.args[0]) for call in persist_mock.call_args_list] == [3, 3, 3, 1]
+    assert list(target_blockchain.iter_blocks()) == blocks
+
+
+def test_blocks_before_invalid_block_are_added(source_blockchain, target_blockchain):
+    blocks = copy.deepcopy(list(source_blockchain.iter_blocks()))
+    blocks[6].message.updated_balances[blocks[6].message.transfer_request.sender].value += 1
+    blocks[6].hash_message()
+
+    with pytest.raises(ValidationError):
+        target_blockchain.add_blocks(blocks)
+
+    assert list(target_blockchain.iter_blocks()) == blocks[:6]
+    assert target_blockchain.get_next_block_number() == 6
+
+
+def test_blocks_are_not_persisted_again_if_persisting_fails(source_blockchain, target_blockchain):
+    blocks = list(source_blockchain.iter_blocks())
+    persist_blocks = target_blockchain.persist_blocks
+
+    def persist_blocks_side_effect(blocks_):
+        if blocks_[0].message.block_number == 3:
+            raise OSError('Disk is full')
+
+        persist_blocks(blocks_)
+
+    with patch.object(target_blockchain, 'persist_blocks', side_effect=persist_blocks_side_effect) as persist_mock:
+        with pytest.raises(OSError, match='Disk is full'):
+            target_blockchain.add_blocks(blocks, batch_size=3)
+
+    assert persist_mock.call_count == 2
+    assert list(target_blockchain.iter_blocks()) == blocks[:3]
+
+
+@pytest.mark.parametrize('exception_class', (OSError, KeyboardInterrupt))
+def test_account_root_file_is_not_made_if_adding_blocks_fails(source_blockchain, target_blockchain, exception_class):
+    blocks = list(source_blockchain.iter_blocks())
+    persist_blocks = target_blockchain.persist_blocks
+
+    def persist_blocks_side_effect(blocks_):
+        if blocks_[0].message.block_number == 3:
+            raise exception_class()
+
+        persist_blocks(blocks_)
+
+    with patch.object(target_blockchain, 'arf_creation_period_in_blocks', 3), \
+            patch.object(target_blockchain, 'persist_blocks', side_effect=persist_blocks_side_effect), \
+            patch.object(target_blockchain, 'make_account_root_file') as make_account_root_file_mock:
+        with pytest.raises(exception_class):
+            target_blockchain.add_blocks(blocks, batch_size=3)
+
+    make_account_root_file_mock.assert_not_called()
+
+
+def test_account_root_file_is_made_if_block_is_invalid(source_blockchain, target_blockchain):
+    blocks = copy.deepcopy(list(source_blockchain.iter_blocks()))
+    blocks[6].message.updated_balances[blocks[6].message.transfer_request.sender].value += 1
+    blocks[6].hash_message()
+
+    with patch.object(target_blockchain, 'arf_creation_period_in_blocks', 3), \
+            patch.object(target_blockchain, 'make_account_root_file') as make_account_root_file_mock:
+        with pytest.raises(ValidationError):
+            target_blockchain.add_blocks(blocks)
+
+    make_account_root_file_mock.assert_called_once()
+
+
+def test_pending_blocks_balances_can_be_got_between_pending_blocks(source_blockchain, target_blockchain):
+    blocks = list(source_blockchain.iter_blocks())
+    pending_blocks = PendingBlocks(target_blockchain)
+    for block in blocks[:5]:
+        pending_blocks.validate_block(block)
+        pending_blocks.add(block)
+
+    for account in source_blockchain.get_last_account_root_file().accounts:
+        for before in range(6):
+            expected_value = source_blockchain.get_balance_value(account, before)
+            assert pending_blocks.get_balance_value(account, before) == expected_value
+            expected_lock = source_blockchain.get_balance_lock(account, before)
+            assert pending_blocks.get_balance_lock(account, before) == expected_lock
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.models.block import Block
+
+
+@pytest.fixture
+def background_file_blockchain(
+    blockchain_directory, initial_account_root_file, forced_mock_network, get_primary_validator_mock,
+    get_preferred_node_mock
+):
+    blockchain = FileBlockchain(
+        base_directory=blockchain_directory, block_chunk_size=2, make_account_root_file_in_background=True
+    )
+    blockchain.add_account_root_file(initial_account_root_file)
+    yield blockchain
+    blockchain.wait_for_account_root_file()
+
+
+def test_account_root_file_is_made_in_background(background_file_blockchain, user_account, signing_key):
+    blockchain = background_file_blockchain
+    with patch.object(blockchain, 'on_account_root_file_created') as created_mock:
+        for amount in range(1, 6):
+            blockchain.add_block(Block.from_main_transaction(blockchain, user_account, amount, signing_key))
+            blockchain.wait_for_account_root_file()
+
+    assert created_mock.call_count == 2
+    assert [call.args[0].last_block_number for call in created_mock.call_args_list] == [1, 3]
+    assert blockchain.get_last_account_root_file().last_block_number == 3
+
+    # Published account root file becomes the balance index base on the next block
+    assert blockchain.balance_index.account_root_file.last_block_number == 3
+    assert blockchain.balance_index.next_block_number == 5
+    assert blockchain.get_balance_value(user_account) == 15
+    assert blockchain.get_last_account_root_file() == blockchain.generate_account_root_file(3)
+
+
+def test_account_root_file_failure_is_reported(background_file_blockchain, user_account, signing_key):
+    blockchain = background_file_blockchain
+    exception = OSError('Disk is full')
+    with patch.object(blockchain, 'persist_account_root_file', side_effect=exception):
+        with patch.object(blockchain, 'on_account_root_file_failed') as failed_mock:
+            for amount in range(1, 3):
+                blockchain.add_block(Block.from_main_transaction(blockchain, user_account, amount, signing_key))
+            blockchain.wait_for_account_root_file()
+
+    failed_mock.assert_called_once_with(exception)
+    assert blockchain.get_last_account_root_file().is_initial()
+    assert blockchain.get_balance_value(user_account) == 3
+
+
+def test_account_root_file_is_persisted_under_lock(background_file_blockchain, user_account, signing_key):
+    blockchain = background_file_blockchain
+    with blockchain._account_root_files_lock:
+        for amount in range(1, 3):
+            blockchain.add_block(Block.from_main_transaction(blockchain, user_account, amount, signing_key))
+
+        future = blockchain.account_root_file_future
+        assert future is not None
+        blockchain.wait_for_account_root_file(timeout=0.2)
+        assert not future.done()
+
+    blockchain.wait_for_account_root_file()
+    assert future.result().last_block_number == 1
+    assert blockchain.get_last_account_root_file().last_block_number == 1
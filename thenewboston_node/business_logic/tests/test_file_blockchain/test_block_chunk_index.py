@@ -0,0 +1,254 @@
+import os
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.indexes.block_chunk_index import BlockChunk, BlockChunkIndex
+from thenewboston_node.business_logic.indexes.block_chunk_offsets import make_block_chunk_offsets
+from thenewboston_node.business_logic.indexes.head_block import HeadBlockMetadata
+from thenewboston_node.business_logic.models.block import Block
+
+
+@pytest.fixture
+def file_blockchain_w_chunks(
+    blockchain_directory, initial_account_root_file, user_account, signing_key, forced_mock_network,
+    get_primary_validator_mock, get_preferred_node_mock
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    blockchain.add_account_root_file(initial_account_root_file)
+    for amount in range(1, 6):
+        blockchain.add_block(Block.from_main_transaction(blockchain, user_account, amount, signing_key))
+
+    yield blockchain
+
+
+def test_block_chunk_index_is_maintained(file_blockchain_w_chunks):
+    assert list(file_blockchain_w_chunks.block_chunk_index.iter_chunks()) == [
+        BlockChunk(0, 1, '00000000000000000000-00000000000000000001-block-chunk.msgpack'),
+        BlockChunk(2, 3, '00000000000000000002-00000000000000000003-block-chunk.msgpack'),
+        BlockChunk(4, 4, '00000000000000000004-00000000000000000004-block-chunk.msgpack'),
+    ]
+
+
+def test_get_block_by_number_does_not_list_directory(blockchain_directory, file_blockchain_w_chunks):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    with patch.object(blockchain, '_list_block_directory') as list_block_directory_mock:
+        for block_number in range(5):
+            assert blockchain.get_block_by_number(block_number).message.block_number == block_number
+
+    list_block_directory_mock.assert_not_called()
+
+
+def test_block_chunk_index_appended_by_other_instance_is_reloaded(
+    blockchain_directory, file_blockchain_w_chunks, user_account, signing_key
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_block_by_number(4).message.block_number == 4
+
+    writer = file_blockchain_w_chunks
+    for amount in range(1, 4):
+        writer.add_block(Block.from_main_transaction(writer, user_account, amount, signing_key))
+        assert list(blockchain._get_block_chunk_index().iter_chunks()) == list(writer.block_chunk_index.iter_chunks())
+
+    with patch.object(blockchain, '_rebuild_block_chunk_index') as rebuild_mock:
+        for block_number in range(8):
+            assert blockchain.get_block_by_number(block_number) == writer.get_block_by_number(block_number)
+
+    rebuild_mock.assert_not_called()
+
+
+def test_block_chunk_index_is_rebuilt_if_lost(blockchain_directory, file_blockchain_w_chunks):
+    os.remove(file_blockchain_w_chunks.block_chunk_index.path)
+
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_block_by_number(3).message.block_number == 3
+    assert blockchain.get_block_by_number(5) is None
+    assert os.path.isfile(blockchain.block_chunk_index.path)
+    assert list(blockchain.block_chunk_index.iter_chunks()
+                ) == list(file_blockchain_w_chunks.block_chunk_index.iter_chunks())
+    assert blockchain.get_block_count() == 5
+
+
+def test_get_block_by_number_decodes_single_block(blockchain_directory, file_blockchain_w_chunks):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    # Head block metadata file is behind the last block, so the head block is decoded to catch it up
+    assert blockchain.get_next_block_number() == 5
+    with patch.object(Block, 'from_compact_dict', wraps=Block.from_compact_dict) as from_compact_dict_mock:
+        assert blockchain.get_block_by_number(3).message.block_number == 3
+
+    from_compact_dict_mock.assert_called_once()
+
+
+def test_get_block_by_number_seeks_to_block(blockchain_directory, file_blockchain_w_chunks):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_next_block_number() == 5
+    blockchain.blocks_cache.clear()
+    with patch.object(blockchain.block_storage, 'load') as load_mock, \
+            patch.object(blockchain.block_storage, 'iter_chunks') as iter_chunks_mock:
+        blocks = [blockchain.get_block_by_number(block_number) for block_number in range(5)]
+
+    load_mock.assert_not_called()
+    iter_chunks_mock.assert_not_called()
+    assert blocks == list(file_blockchain_w_chunks.iter_blocks())
+
+
+def test_get_block_by_number_ignores_outdated_block_chunk_offsets(blockchain_directory, file_blockchain_w_chunks):
+    file_blockchain_w_chunks.block_chunk_offsets.save(2, array('Q', [1, 2]))
+
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_block_by_number(3) == file_blockchain_w_chunks.get_block_by_number(3)
+
+    data = blockchain.block_storage.load('00000000000000000002-00000000000000000003-block-chunk.msgpack')
+    assert blockchain.block_chunk_offsets.get(2) == make_block_chunk_offsets(data)
+
+
+def test_block_chunk_offsets_are_maintained(file_blockchain_w_chunks):
+    blockchain = file_blockchain_w_chunks
+    for chunk in blockchain.block_chunk_index.iter_chunks():
+        data = blockchain.block_storage.load(chunk.file_path)
+        assert blockchain.block_chunk_offsets.get(chunk.start) == make_block_chunk_offsets(data)
+
+
+def test_forward_iteration_streams_block_chunk(blockchain_directory, file_blockchain_w_chunks):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    file_path = '00000000000000000002-00000000000000000003-block-chunk.msgpack'
+    assert blockchain.block_storage.is_finalized(file_path)
+
+    with patch.object(blockchain.block_storage, 'load') as load_mock:
+        blocks = list(blockchain._iter_blocks_from_file(file_path, direction=1))
+
+    load_mock.assert_not_called()
+    assert [block.message.block_number for block in blocks] == [2, 3]
+    assert blocks == [file_blockchain_w_chunks.get_block_by_number(2), file_blockchain_w_chunks.get_block_by_number(3)]
+
+
+def test_reverse_iteration_decodes_only_consumed_blocks(blockchain_directory, file_blockchain_w_chunks):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    with patch.object(Block, 'from_compact_dict', wraps=Block.from_compact_dict) as from_compact_dict_mock:
+        blocks = blockchain._iter_blocks_from_file(
+            '00000000000000000002-00000000000000000003-block-chunk.msgpack', direction=-1
+        )
+        assert next(blocks).message.block_number == 3
+
+    from_compact_dict_mock.assert_called_once()
+
+
+def test_can_iter_blocks_reversed_from_block_number(file_blockchain_w_chunks):
+    blocks = file_blockchain_w_chunks._iter_blocks_from_file(
+        '00000000000000000002-00000000000000000003-block-chunk.msgpack', direction=-1, start=2
+    )
+    assert [block.message.block_number for block in blocks] == [2]
+
+    blocks = file_blockchain_w_chunks.iter_blocks_reversed()
+    assert [block.message.block_number for block in blocks] == [4, 3, 2, 1, 0]
+
+
+def test_account_postings_are_persisted(blockchain_directory, file_blockchain_w_chunks, user_account):
+    expected_balance = file_blockchain_w_chunks.get_balance_value(user_account, 4)
+    assert os.path.isfile(file_blockchain_w_chunks.account_postings_path)
+
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    with patch.object(blockchain, '_catch_up_account_postings') as catch_up_mock:
+        assert blockchain.get_balance_value(user_account, 4) == expected_balance
+
+    catch_up_mock.assert_not_called()
+
+
+def test_head_block_metadata_is_used(blockchain_directory, file_blockchain_w_chunks):
+    last_block = file_blockchain_w_chunks.get_last_block()
+    assert last_block.message.block_number == 4
+
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    with patch.object(blockchain, '_list_block_directory') as list_block_directory_mock:
+        assert blockchain.get_block_count() == 5
+        assert blockchain.get_next_block_number() == 5
+        assert blockchain.get_next_block_identifier() == last_block.message_hash
+        assert blockchain.get_last_block() == last_block
+        assert [block.message.block_number for block in blockchain.iter_blocks_from(3)] == [3, 4]
+        assert blockchain.get_block_by_number(5) is None
+
+    list_block_directory_mock.assert_not_called()
+
+
+def test_head_block_metadata_updated_by_other_instance_is_reloaded(
+    blockchain_directory, file_blockchain_w_chunks, user_account, signing_key
+):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_block_count() == 5
+
+    file_blockchain_w_chunks.add_block(
+        Block.from_main_transaction(file_blockchain_w_chunks, user_account, 10, signing_key)
+    )
+    assert blockchain.get_block_count() == 6
+    assert blockchain.get_last_block().message.block_number == 5
+
+
+def test_blocks_added_by_other_instance_are_seen(
+    blockchain_directory, file_blockchain_w_chunks, user_account, signing_key
+):
+    writer = file_blockchain_w_chunks
+    reader = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert reader.get_balance_value(user_account) == writer.get_balance_value(user_account)
+
+    for amount in range(1, 6):
+        block = Block.from_main_transaction(writer, user_account, amount, signing_key)
+        writer.add_block(block)
+        block_number = block.message.block_number
+
+        assert reader.get_next_block_number() == block_number + 1
+        assert reader.get_block_count() == block_number + 1
+        assert reader.get_next_block_identifier() == block.message_hash
+        assert reader.get_block_by_number(block_number) == block
+        assert reader.get_last_block() == block
+        assert reader.get_balance_value(user_account) == writer.get_balance_value(user_account)
+        assert reader.get_balance_lock(user_account) == writer.get_balance_lock(user_account)
+
+
+def test_head_block_metadata_file_is_written_once_per_block_chunk(
+    blockchain_directory, file_blockchain_w_chunks, user_account, signing_key
+):
+    blockchain = file_blockchain_w_chunks
+    with patch('thenewboston_node.business_logic.indexes.head_block.write_file_atomically') as write_mock:
+        for amount in range(1, 5):
+            blockchain.add_block(Block.from_main_transaction(blockchain, user_account, amount, signing_key))
+            assert blockchain.head_block_metadata.block_number == 4 + amount
+
+    # Blocks 6 and 8 complete block chunks
+    assert write_mock.call_count == 2
+
+
+def test_head_block_metadata_file_behind_is_caught_up(blockchain_directory, file_blockchain_w_chunks):
+    last_block = file_blockchain_w_chunks.get_last_block()
+    assert last_block.message.block_number == 4
+
+    head_block_metadata = HeadBlockMetadata(file_blockchain_w_chunks.head_block_metadata.path)
+    assert head_block_metadata.load()
+    assert head_block_metadata.block_number == 3
+
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_next_block_number() == 5
+    assert blockchain.get_block_count() == 5
+    assert blockchain.get_next_block_identifier() == last_block.message_hash
+
+
+def test_inconsistent_head_block_metadata_is_ignored(blockchain_directory, file_blockchain_w_chunks):
+    file_blockchain_w_chunks.head_block_metadata.update(10, 'a' * 64, 11)
+
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    assert blockchain.get_block_count() == 5
+    assert blockchain.get_next_block_number() == 5
+
+
+def test_block_chunk_index_is_not_rebuilt_if_listing_has_not_changed(blockchain_directory, file_blockchain_w_chunks):
+    os.remove(file_blockchain_w_chunks.head_block_metadata.path)
+
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=2)
+    with patch.object(blockchain, '_list_block_directory', wraps=blockchain._list_block_directory) as list_mock, \
+            patch.object(BlockChunkIndex, '_dump') as dump_mock:
+        assert blockchain.get_block_by_number(5) is None
+        assert blockchain.get_block_by_number(6) is None
+
+    list_mock.assert_called_once()
+    dump_mock.assert_not_called()
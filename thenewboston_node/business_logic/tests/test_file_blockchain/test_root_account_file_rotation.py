@@ -1,7 +1,9 @@
+import os
 from unittest.mock import patch
 
 import pytest
 
+from thenewboston_node.business_logic.indexes.account_directory import write_account_directory
 from thenewboston_node.business_logic.models.block import Block
 
 
@@ -68,3 +70,69 @@ def test_closest_arf_is_last_arf(file_blockchain_w_memory_storage, excludes_bloc
     )
 
     assert not closest_arf.is_initial()
+
+
+def test_closest_arf_is_found_without_loading_other_arfs(file_blockchain_w_memory_storage):
+    blockchain = file_blockchain_w_memory_storage
+    blockchain.account_root_files_cache.clear()
+    blockchain.account_root_file_views_cache.clear()
+    os.remove(blockchain._get_account_directory_path('000000000.-arf.msgpack'))
+    storage = blockchain.account_root_files_storage
+    with patch.object(storage, 'load', wraps=storage.load) as load_mock:
+        with patch.object(storage, 'list_directory') as list_directory_mock:
+            assert blockchain.get_closest_account_root_file(0).is_initial()
+
+    load_mock.assert_called_once_with('000000000.-arf.msgpack')
+    list_directory_mock.assert_not_called()
+
+
+def test_arf_balances_are_read_without_loading_arf(file_blockchain_w_memory_storage, user_account):
+    blockchain = file_blockchain_w_memory_storage
+    expected_account_root_file = blockchain.get_last_account_root_file().copy()
+    blockchain.account_root_files_cache.clear()
+    blockchain.account_root_file_views_cache.clear()
+
+    storage = blockchain.account_root_files_storage
+    with patch.object(storage, 'load', wraps=storage.load) as load_mock:
+        account_root_file = blockchain.get_closest_account_root_file()
+        assert account_root_file.last_block_number == 1
+        assert account_root_file.get_balance(user_account) == expected_account_root_file.get_balance(user_account)
+        assert account_root_file.get_balance_value(user_account) == 30
+        assert account_root_file.get_balance_value('0' * 64) is None
+        assert list(account_root_file.accounts) == list(expected_account_root_file.accounts)  # order is kept
+        load_mock.assert_not_called()
+
+        assert account_root_file.get_hash() == expected_account_root_file.get_hash()  # materializes
+        load_mock.assert_called_once_with('0000000001-arf.msgpack')
+
+
+def test_outdated_account_directory_is_not_used(file_blockchain_w_memory_storage, user_account):
+    blockchain = file_blockchain_w_memory_storage
+    file_path = '0000000001-arf.msgpack'
+    stale_account_root_file = blockchain.get_last_account_root_file().copy()
+    stale_account_root_file.accounts[user_account].value += 1
+    stale_account_root_file.next_block_identifier = 'f' * 64
+    write_account_directory(blockchain._get_account_directory_path(file_path), stale_account_root_file)
+    blockchain.account_root_file_views_cache.clear()
+
+    assert blockchain.get_last_account_root_file().get_balance_value(user_account) == 30
+
+    # Account directory is rewritten
+    blockchain.account_root_file_views_cache.clear()
+    account_directory = blockchain._get_account_directory(file_path)
+    assert account_directory.next_block_identifier == blockchain.get_last_block().message_hash
+    assert account_directory.get_balance(user_account).value == 30
+
+
+def test_account_directory_is_not_rewritten_after_failure(file_blockchain_w_memory_storage, user_account):
+    blockchain = file_blockchain_w_memory_storage
+    os.remove(blockchain._get_account_directory_path('0000000001-arf.msgpack'))
+    with patch(
+        'thenewboston_node.business_logic.blockchain.file_blockchain.write_account_directory',
+        side_effect=OSError('Disk is full')
+    ) as write_account_directory_mock:
+        for _ in range(3):
+            blockchain.account_root_file_views_cache.clear()
+            assert blockchain.get_last_account_root_file().get_balance_value(user_account) == 30
+
+    write_account_directory_mock.assert_called_once()
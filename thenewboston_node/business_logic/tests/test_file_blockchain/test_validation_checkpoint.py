@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import FileBlockchain
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.indexes.validation_checkpoint import ValidationCheckpoint
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
+
+
+@pytest.fixture
+def file_blockchain(blockchain_directory, treasury_account_key_pair):
+    blockchain = FileBlockchain(base_directory=blockchain_directory, block_chunk_size=4)
+    generate_blockchain(blockchain, 10, treasury_account_key_pair=treasury_account_key_pair)
+    yield blockchain
+
+
+def get_checkpoint(blockchain, block_number):
+    return ValidationCheckpoint(block_number, blockchain.get_block_by_number(block_number).message_hash)
+
+
+def validate_blocks(blockchain, **kwargs):
+    with patch.object(Block, 'validate', autospec=True, side_effect=Block.validate) as validate_mock:
+        blockchain.validate_blocks(**kwargs)
+
+    return [call.args[0].message.block_number for call in validate_mock.call_args_list]
+
+
+def test_validation_checkpoint_is_saved(file_blockchain, blockchain_directory):
+    assert file_blockchain.get_validation_checkpoint() is None
+
+    with patch.object(
+        file_blockchain, 'set_validation_checkpoint', wraps=file_blockchain.set_validation_checkpoint
+    ) as set_mock:
+        file_blockchain.validate_blocks(checkpoint_period_in_blocks=3)
+
+    assert [call.args[0].block_number for call in set_mock.call_args_list] == [2, 5, 8, 9]
+    assert FileBlockchain(base_directory=blockchain_directory
+                          ).get_validation_checkpoint() == get_checkpoint(file_blockchain, 9)
+
+
+def test_can_resume_validation(file_blockchain):
+    assert validate_blocks(file_blockchain, resume=True) == list(range(10))
+    assert validate_blocks(file_blockchain, resume=True) == []
+
+    file_blockchain.set_validation_checkpoint(get_checkpoint(file_blockchain, 6))
+    assert validate_blocks(file_blockchain, resume=True) == [7, 8, 9]
+    assert validate_blocks(file_blockchain) == list(range(10))
+
+
+def test_can_resume_validation_after_failure(file_blockchain):
+    original_validate_block = file_blockchain.validate_block
+
+    def validate_block(*, block, **kwargs):
+        if block.message.block_number == 7:
+            raise ValidationError('Failure')
+
+        original_validate_block(block=block, **kwargs)
+
+    with patch.object(file_blockchain, 'validate_block', new=validate_block), pytest.raises(ValidationError):
+        file_blockchain.validate_blocks(checkpoint_period_in_blocks=3)
+
+    assert file_blockchain.get_validation_checkpoint() == get_checkpoint(file_blockchain, 5)
+    assert validate_blocks(file_blockchain, resume=True) == [6, 7, 8, 9]
+
+
+def test_mismatching_validation_checkpoint_is_ignored(file_blockchain):
+    file_blockchain.set_validation_checkpoint(ValidationCheckpoint(6, 'f' * 64))
+    assert validate_blocks(file_blockchain, resume=True) == list(range(10))
+    assert file_blockchain.get_validation_checkpoint() == get_checkpoint(file_blockchain, 9)
+
+
+def test_validation_seeks_to_offset(file_blockchain):
+    assert validate_blocks(file_blockchain, offset=7) == [7, 8, 9]
+    assert validate_blocks(file_blockchain, offset=5, limit=2) == [5, 6]
+
+    # Checkpoint is not saved unless all preceding blocks are validated
+    assert file_blockchain.get_validation_checkpoint() is None
@@ -0,0 +1,149 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+from cachetools import LRUCache
+
+from thenewboston_node.business_logic.blockchain.file_blockchain import (
+    FileBlockchain, iter_blocks_from_block_chunk_data
+)
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
+
+
+@pytest.fixture
+def memory_blockchain(treasury_account_key_pair):
+    blockchain = MemoryBlockchain()
+    generate_blockchain(blockchain, 10, treasury_account_key_pair=treasury_account_key_pair)
+    yield blockchain
+
+
+def make_file_blockchain(memory_blockchain, base_directory, **kwargs):
+    blockchain = FileBlockchain(base_directory=str(base_directory), block_chunk_size=4, **kwargs)
+    blockchain.add_account_root_file(memory_blockchain.get_first_account_root_file())
+    for block in memory_blockchain.iter_blocks():
+        blockchain.add_block(block, validate=False)
+
+    return blockchain
+
+
+def validate_blocks(blockchain, **kwargs):
+    thread_names = set()
+
+    def validate(block, *args, **kwargs):
+        thread_names.add(threading.current_thread().name)
+        return original_validate(block, *args, **kwargs)
+
+    original_validate = Block.validate
+    with patch.object(Block, 'validate', autospec=True, side_effect=validate) as validate_mock:
+        blockchain.validate_blocks(**kwargs)
+
+    assert thread_names == {threading.main_thread().name}
+    return [call.args[0].message.block_number for call in validate_mock.call_args_list]
+
+
+def test_pipelined_validation(memory_blockchain, tmp_path):
+    blockchain = make_file_blockchain(memory_blockchain, tmp_path, use_validation_pipeline=True)
+
+    with patch(
+        'thenewboston_node.business_logic.blockchain.file_blockchain.iter_blocks_from_block_chunk_data',
+        wraps=iter_blocks_from_block_chunk_data
+    ) as decode_mock:
+        assert validate_blocks(blockchain) == list(range(10))
+        assert decode_mock.call_count == 3
+
+        decode_mock.reset_mock()
+        assert validate_blocks(blockchain, offset=5) == [5, 6, 7, 8, 9]
+        assert decode_mock.call_count == 2
+
+        assert validate_blocks(blockchain, offset=3, limit=2) == [3, 4]
+
+    blockchain.validate(resume=True)
+
+
+@pytest.mark.parametrize('offset', (0, 2))
+@pytest.mark.parametrize('tamper', ('balance_value', 'block_identifier', 'block_signature'))
+def test_pipelined_validation_reports_same_error(memory_blockchain, tmp_path, offset, tamper):
+    block = list(memory_blockchain.iter_blocks())[6]
+    if tamper == 'balance_value':
+        # Block signature becomes invalid too, but serial validation validates balances first
+        block.message.updated_balances[block.message.transfer_request.sender].value += 1
+    elif tamper == 'block_identifier':
+        block.message.block_identifier = '0' * 64
+    else:
+        block.message_signature = memory_blockchain.get_block_by_number(5).message_signature
+
+    errors = []
+    for kwargs in ({}, {'signature_validation_workers': 2}, {'use_validation_pipeline': True}):
+        blockchain = make_file_blockchain(memory_blockchain, tmp_path / str(len(errors)), **kwargs)
+        with pytest.raises(ValidationError) as exc_info:
+            blockchain.validate_blocks(offset=offset)
+
+        errors.append(str(exc_info.value))
+        assert blockchain.get_validation_checkpoint() is None
+
+    assert errors[1] == errors[0]
+    assert errors[2] == errors[0]
+
+
+def test_pipelined_validation_does_not_list_block_directory(memory_blockchain, tmp_path):
+    make_file_blockchain(memory_blockchain, tmp_path, use_validation_pipeline=True)
+
+    blockchain = FileBlockchain(base_directory=str(tmp_path), block_chunk_size=4, use_validation_pipeline=True)
+    with patch.object(blockchain, '_list_block_directory') as list_block_directory_mock:
+        blocks = list(blockchain._iter_blocks_to_validate(None))
+        assert [block.message.block_number for block in blocks] == list(range(10))
+        blocks = list(blockchain._iter_blocks_to_validate(5))
+        assert [block.message.block_number for block in blocks] == [5, 6, 7, 8, 9]
+
+    list_block_directory_mock.assert_not_called()
+
+
+def test_pipeline_threads_are_stopped(memory_blockchain, tmp_path):
+    blockchain = make_file_blockchain(memory_blockchain, tmp_path, use_validation_pipeline=True)
+    blockchain.validate_blocks(limit=3)
+
+    assert not any(thread.name in ('block-chunk-reading', 'block-decoding') for thread in threading.enumerate())
+
+
+def test_blocks_are_read_while_pipelined_validation_reads_block_chunks(memory_blockchain, tmp_path):
+    make_file_blockchain(memory_blockchain, tmp_path)
+    blockchain = FileBlockchain(
+        base_directory=str(tmp_path),
+        block_chunk_size=4,
+        use_validation_pipeline=True,
+        blocks_storage_kwargs={'compressors_cache_size': 2},
+    )
+    storage = blockchain.block_storage
+
+    class LockCheckingCache(LRUCache):
+
+        def __getitem__(self, key):
+            assert storage._compressors_cache_lock.locked()
+            return super().__getitem__(key)
+
+        def __setitem__(self, key, value):
+            assert storage._compressors_cache_lock.locked()
+            super().__setitem__(key, value)
+
+        def __contains__(self, key):
+            assert storage._compressors_cache_lock.locked()
+            return super().__contains__(key)
+
+    storage.compressors_cache = LockCheckingCache(2)
+
+    def validate(block, *args, **kwargs):
+        # Blocks are read in this thread while block chunks are being read in background
+        blockchain.blocks_cache.clear()
+        for block_number in range(10):
+            assert blockchain.get_block_by_number(block_number).message.block_number == block_number
+
+        return original_validate(block, *args, **kwargs)
+
+    original_validate = Block.validate
+    with patch.object(Block, 'validate', autospec=True, side_effect=validate) as validate_mock:
+        blockchain.validate_blocks()
+
+    assert validate_mock.call_count == 10
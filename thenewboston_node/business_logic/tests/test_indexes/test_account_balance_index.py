@@ -0,0 +1,140 @@
+from thenewboston_node.business_logic.indexes.account_balance_index import AccountBalanceIndex
+from thenewboston_node.business_logic.models.account_balance import AccountBalance, BlockAccountBalance
+from thenewboston_node.business_logic.models.account_root_file import AccountRootFile
+from thenewboston_node.business_logic.tests.factories import BlockFactory, BlockMessageFactory
+
+
+def make_block(block_number, updated_balances):
+    return BlockFactory(message=BlockMessageFactory(block_number=block_number, updated_balances=updated_balances))
+
+
+def test_account_balance_index():
+    account_root_file = AccountRootFile(
+        accounts={'treasury': AccountBalance(value=1000, lock='treasury')},
+        last_block_number=9,
+    )
+    index = AccountBalanceIndex(account_root_file)
+    assert index.next_block_number == 10
+    assert index.get_balance_value('treasury') == 1000
+    assert index.get_balance_lock('treasury') == 'treasury'
+    assert index.get_balance_value('user') is None
+    assert index.get_balance_lock('user') == 'user'
+
+    index.apply_block(
+        make_block(
+            10, {
+                'treasury': BlockAccountBalance(value=900, lock='lock1'),
+                'user': BlockAccountBalance(value=100),
+            }
+        )
+    )
+    assert index.next_block_number == 11
+    assert index.get_balance_value('treasury') == 900
+    assert index.get_balance_lock('treasury') == 'lock1'
+    assert index.get_balance_value('user') == 100
+    assert index.get_balance_lock('user') == 'user'
+
+    index.apply_block(
+        make_block(
+            11, {
+                'treasury': BlockAccountBalance(value=950),
+                'user': BlockAccountBalance(value=50, lock='lock2'),
+            }
+        )
+    )
+    assert index.get_balance_value('treasury') == 950
+    assert index.get_balance_lock('treasury') == 'lock1'
+    assert index.get_balance_value('user') == 50
+    assert index.get_balance_lock('user') == 'lock2'
+
+    new_account_root_file = AccountRootFile(
+        accounts={
+            'treasury': AccountBalance(value=950, lock='lock1'),
+            'user': AccountBalance(value=50, lock='lock2'),
+        },
+        last_block_number=11,
+    )
+    index.rebase(new_account_root_file)
+    assert index.updated_balances == {}
+    assert index.get_balance_value('user') == 50
+    assert index.get_balance_lock('user') == 'lock2'
+
+
+def test_can_make_account_root_file():
+    account_root_file = AccountRootFile(
+        accounts={
+            'treasury': AccountBalance(value=1000, lock='treasury'),
+            'user': AccountBalance(value=10, lock='user'),
+        },
+        last_block_number=9,
+    )
+    index = AccountBalanceIndex(account_root_file)
+    assert index.make_account_root_file() == account_root_file
+
+    block = make_block(
+        10, {
+            'treasury': BlockAccountBalance(value=900, lock='lock1'),
+            'new-user': BlockAccountBalance(value=100),
+        }
+    )
+    index.apply_block(block)
+    new_account_root_file = index.make_account_root_file()
+    assert new_account_root_file == AccountRootFile(
+        accounts={
+            'treasury': AccountBalance(value=900, lock='lock1'),
+            'user': AccountBalance(value=10, lock='user'),
+            'new-user': AccountBalance(value=100, lock='new-user'),
+        },
+        last_block_number=10,
+        last_block_identifier=block.message.block_identifier,
+        last_block_timestamp=block.message.timestamp,
+        next_block_identifier=block.message_hash,
+    )
+
+    new_account_root_file.accounts['user'].value = 0
+    assert account_root_file.accounts['user'].value == 10
+
+
+def test_can_rebase_on_account_root_file_behind_index():
+    index = AccountBalanceIndex(AccountRootFile(accounts={'treasury': AccountBalance(value=1000, lock='treasury')}))
+    index.apply_block(make_block(0, {'treasury': BlockAccountBalance(value=900, lock='lock1')}))
+    snapshot = index.copy()
+    index.apply_block(make_block(1, {'user': BlockAccountBalance(value=100)}))
+
+    account_root_file = snapshot.make_account_root_file()
+    assert account_root_file.last_block_number == 0
+    assert 'user' not in account_root_file.accounts
+
+    index.rebase(account_root_file)
+    assert index.account_root_file is account_root_file
+    assert index.next_block_number == 2
+    assert index.updated_balances == {'user': BlockAccountBalance(value=100)}
+    assert index.get_balance_value('treasury') == 900
+    assert index.get_balance_lock('treasury') == 'lock1'
+    assert index.get_balance_value('user') == 100
+
+
+def test_iter_account_balances():
+    account_root_file = AccountRootFile(
+        accounts={
+            'treasury': AccountBalance(value=1000, lock='treasury'),
+            'user1': AccountBalance(value=10, lock='user1'),
+        },
+        last_block_number=9,
+    )
+    index = AccountBalanceIndex(account_root_file)
+    index.apply_block(
+        make_block(
+            10, {
+                'treasury': BlockAccountBalance(value=900, lock='lock1'),
+                'user2': BlockAccountBalance(value=100),
+            }
+        )
+    )
+
+    assert index.get_account_count() == 3
+    assert list(index.iter_account_balances()) == list(index.make_account_root_file().accounts.items()) == [
+        ('treasury', AccountBalance(value=900, lock='lock1')),
+        ('user1', AccountBalance(value=10, lock='user1')),
+        ('user2', AccountBalance(value=100, lock='user2')),
+    ]
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from thenewboston_node.business_logic.indexes.account_directory import AccountDirectory, write_account_directory
+from thenewboston_node.business_logic.models.account_balance import AccountBalance
+from thenewboston_node.business_logic.models.account_root_file import AccountRootFile
+
+
+def test_can_read_account_directory(blockchain_path):
+    accounts = {
+        account * 64: AccountBalance(value=value, lock=lock * 64)
+        for account, value, lock in (('c', 30, 'd'), ('a', 10, 'a'), ('b', 20, 'e'))
+    }
+    account_root_file = AccountRootFile(
+        accounts=accounts,
+        last_block_number=9,
+        last_block_identifier='f' * 64,
+        last_block_timestamp=datetime(2021, 1, 1),
+        next_block_identifier='e' * 64,
+    )
+    path = str(blockchain_path / 'account-directory.bin')
+    assert write_account_directory(path, account_root_file)
+
+    account_directory = AccountDirectory(path)
+    assert account_directory.last_block_number == 9
+    assert account_directory.next_block_identifier == 'e' * 64
+    assert len(account_directory) == 3
+    assert list(account_directory) == ['c' * 64, 'a' * 64, 'b' * 64]  # original order is kept
+    assert list(account_directory.items()) == list(accounts.items())
+    assert account_directory.get_balance('b' * 64) == AccountBalance(value=20, lock='e' * 64)
+    assert account_directory.get_balance('0' * 64) is None
+    assert account_directory.get_balance('not-hex') is None
+    assert 'c' * 64 in account_directory
+
+    attributes = account_directory.get_attributes()
+    assert attributes.accounts == {}
+    assert attributes.last_block_number == 9
+    assert attributes.last_block_timestamp == datetime(2021, 1, 1)
+    assert attributes.next_block_identifier == 'e' * 64
+
+
+def test_account_directory_requires_hex_account_numbers(blockchain_path):
+    account_root_file = AccountRootFile(accounts={'treasury': AccountBalance(value=10, lock='treasury')})
+    assert not write_account_directory(str(blockchain_path / 'account-directory.bin'), account_root_file)
+
+
+def test_account_directory_identifies_initial_account_root_file(blockchain_path):
+    account_root_file = AccountRootFile(accounts={'a' * 64: AccountBalance(value=10, lock='a' * 64)})
+    path = str(blockchain_path / 'account-directory.bin')
+    assert write_account_directory(path, account_root_file)
+
+    account_directory = AccountDirectory(path)
+    assert account_directory.last_block_number is None
+    assert account_directory.next_block_identifier is None
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from thenewboston_node.business_logic.indexes.account_postings import AccountPostings
+from thenewboston_node.business_logic.models.account_balance import BlockAccountBalance
+from thenewboston_node.business_logic.tests.factories import BlockFactory, BlockMessageFactory
+
+TREASURY = 'a' * 64
+USER = 'b' * 64
+
+
+def make_block(block_number, updated_balances):
+    return BlockFactory(message=BlockMessageFactory(block_number=block_number, updated_balances=updated_balances))
+
+
+def add_blocks(account_postings):
+    account_postings.add_block(
+        make_block(
+            10, {
+                TREASURY: BlockAccountBalance(value=900, lock='lock1'),
+                USER: BlockAccountBalance(value=100),
+            }
+        )
+    )
+    account_postings.add_block(make_block(11, {TREASURY: BlockAccountBalance(value=800, lock='lock2')}))
+    account_postings.add_block(make_block(12, {USER: BlockAccountBalance(value=200)}))
+
+
+def assert_postings(account_postings):
+    assert account_postings.first_block_number == 10
+    assert account_postings.next_block_number == 13
+
+    get_last_block_number = account_postings.get_last_block_number
+    assert get_last_block_number(TREASURY, 10) is None
+    assert get_last_block_number(TREASURY, 11) == 10
+    assert get_last_block_number(TREASURY, 13) == 11
+    assert get_last_block_number(USER, 12) == 10
+    assert get_last_block_number(USER, 13) == 12
+    assert get_last_block_number(USER, 13, must_have_lock=True) is None
+    assert get_last_block_number(TREASURY, 13, must_have_lock=True) == 11
+    assert get_last_block_number('c' * 64, 13) is None
+
+
+def test_account_postings():
+    account_postings = AccountPostings()
+    add_blocks(account_postings)
+    assert_postings(account_postings)
+
+    with pytest.raises(ValueError, match='Expected block number 13, but got 14'):
+        account_postings.add_block(make_block(14, {}))
+
+
+def test_account_postings_are_persisted(blockchain_directory):
+    path = os.path.join(blockchain_directory, 'account-postings.msgpack')
+    account_postings = AccountPostings(path)
+    assert not account_postings.load()
+
+    add_blocks(account_postings)
+
+    loaded_account_postings = AccountPostings(path)
+    assert loaded_account_postings.load()
+    assert_postings(loaded_account_postings)
+
+
+def test_account_postings_incomplete_record_is_dropped(blockchain_directory):
+    path = os.path.join(blockchain_directory, 'account-postings.msgpack')
+    add_blocks(AccountPostings(path))
+    size = os.path.getsize(path)
+    with open(path, 'ab') as fo:
+        fo.write(b'\x93\x0d')  # partially written record
+
+    account_postings = AccountPostings(path)
+    assert account_postings.load()
+    assert_postings(account_postings)
+    assert os.path.getsize(path) == size
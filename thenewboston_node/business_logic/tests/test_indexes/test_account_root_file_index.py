@@ -0,0 +1,30 @@
+from thenewboston_node.business_logic.indexes.account_root_file_index import AccountRootFileIndex
+
+
+def test_can_get_closest_file_path():
+    index = AccountRootFileIndex()
+    index.rebuild([(9, '9'), (None, 'initial'), (4, '4')])
+
+    assert index.get_closest_file_path() == '9'
+    assert index.get_closest_file_path(-1) == 'initial'
+    assert index.get_closest_file_path(0) == 'initial'
+    assert index.get_closest_file_path(4) == 'initial'
+    assert index.get_closest_file_path(5) == '4'
+    assert index.get_closest_file_path(9) == '4'
+    assert index.get_closest_file_path(10) == '9'
+    assert index.get_first_file_path() == 'initial'
+    assert index.get_last_file_path() == '9'
+
+    index.add(14, '14')
+    assert index.get_closest_file_path() == '14'
+    assert index.get_closest_file_path(14) == '9'
+    assert len(index) == 4
+
+
+def test_partial_blockchain_index():
+    index = AccountRootFileIndex()
+    index.rebuild([(4, '4')])
+
+    assert index.get_closest_file_path(-1) is None
+    assert index.get_closest_file_path(4) is None
+    assert index.get_closest_file_path(5) == '4'
@@ -0,0 +1,61 @@
+import os.path
+
+from thenewboston_node.business_logic.indexes import block_chunk_index
+from thenewboston_node.business_logic.indexes.block_chunk_index import BlockChunk, BlockChunkIndex
+
+
+def test_can_get_chunk(blockchain_path):
+    index = BlockChunkIndex(str(blockchain_path / 'index.msgpack'))
+    index.rebuild([BlockChunk(0, 9, '0-9'), BlockChunk(10, 19, '10-19'), BlockChunk(20, 21, '20-21')])
+
+    assert index.get_chunk(0) == BlockChunk(0, 9, '0-9')
+    assert index.get_chunk(9) == BlockChunk(0, 9, '0-9')
+    assert index.get_chunk(15) == BlockChunk(10, 19, '10-19')
+    assert index.get_chunk(21) == BlockChunk(20, 21, '20-21')
+    assert index.get_chunk(22) is None
+    assert index.get_chunk(-1) is None
+
+
+def test_can_load_updated_index(blockchain_path):
+    path = str(blockchain_path / 'index.msgpack')
+    index = BlockChunkIndex(path)
+    index.rebuild([])
+    index.update(BlockChunk(0, 0, '0-0'))
+    index.update(BlockChunk(0, 1, '0-1'))
+    index.update(BlockChunk(2, 2, '2-2'))
+
+    loaded_index = BlockChunkIndex(path)
+    assert loaded_index.load()
+    assert list(loaded_index.iter_chunks()) == [BlockChunk(0, 1, '0-1'), BlockChunk(2, 2, '2-2')]
+    assert list(loaded_index.iter_chunks(-1)) == [BlockChunk(2, 2, '2-2'), BlockChunk(0, 1, '0-1')]
+
+
+def test_cannot_load_missing_or_corrupted_index(blockchain_path):
+    path = str(blockchain_path / 'index.msgpack')
+    index = BlockChunkIndex(path)
+    assert not index.load()
+    assert not index.is_loaded
+
+    with open(path, 'wb') as fo:
+        fo.write(b'\x93\x00\x01\xc1')
+
+    assert not index.load()
+    assert not index.is_loaded
+    assert index.get_chunk(0) is None
+
+
+def test_index_is_compacted(blockchain_path, monkeypatch):
+    monkeypatch.setattr(block_chunk_index, 'MIN_RECORDS_TO_COMPACT', 4)
+    path = str(blockchain_path / 'index.msgpack')
+    index = BlockChunkIndex(path)
+    index.rebuild([])
+    for end in range(3):
+        index.update(BlockChunk(0, end, f'0-{end}'))
+
+    size_before_compaction = os.path.getsize(path)
+    index.update(BlockChunk(0, 3, '0-3'))
+    assert os.path.getsize(path) < size_before_compaction
+
+    loaded_index = BlockChunkIndex(path)
+    assert loaded_index.load()
+    assert list(loaded_index.iter_chunks()) == [BlockChunk(0, 3, '0-3')]
@@ -0,0 +1,41 @@
+from array import array
+
+import msgpack
+
+from thenewboston_node.business_logic.indexes.block_chunk_offsets import (
+    BlockChunkOffsets, get_block_span, make_block_chunk_offsets
+)
+
+
+def test_make_block_chunk_offsets():
+    items = [{'a': 1}, [1, 2, 3], 'x' * 100]
+    data = b''.join(map(msgpack.packb, items))
+
+    offsets = make_block_chunk_offsets(data)
+    assert list(offsets) == [4, 8, 110]
+    for index, item in enumerate(items):
+        start, end = get_block_span(offsets, index)
+        assert msgpack.unpackb(data[start:end]) == item
+
+
+def test_make_block_chunk_offsets_ignores_incomplete_tail():
+    data = msgpack.packb({'a': 1}) + msgpack.packb('x' * 100)[:10]
+    assert list(make_block_chunk_offsets(data)) == [4]
+
+
+def test_can_append_and_get_offsets(blockchain_path):
+    directory = str(blockchain_path / 'offsets')
+    block_chunk_offsets = BlockChunkOffsets(directory)
+    assert block_chunk_offsets.get(100) is None
+
+    block_chunk_offsets.append(100, 10)
+    block_chunk_offsets.append(100, 25)
+    assert list(block_chunk_offsets.get(100)) == [10, 25]
+
+    block_chunk_offsets.append(100, 31)
+    assert list(block_chunk_offsets.get(100)) == [10, 25, 31]
+    assert list(BlockChunkOffsets(directory).get(100)) == [10, 25, 31]
+
+    block_chunk_offsets.save(100, array('Q', [5]))
+    assert list(BlockChunkOffsets(directory).get(100)) == [5]
+    assert BlockChunkOffsets(directory).get(0) is None
@@ -0,0 +1,31 @@
+from thenewboston_node.business_logic.indexes.head_block import HeadBlockMetadata
+
+
+def test_can_load_updated_metadata(blockchain_path):
+    path = str(blockchain_path / 'head-block.msgpack')
+    metadata = HeadBlockMetadata(path)
+    metadata.update(10, 'a' * 64, 11)
+    assert (metadata.block_number, metadata.message_hash, metadata.block_count) == (10, 'a' * 64, 11)
+    assert not metadata.is_outdated()
+
+    loaded_metadata = HeadBlockMetadata(path)
+    assert loaded_metadata.load()
+    assert (loaded_metadata.block_number, loaded_metadata.message_hash,
+            loaded_metadata.block_count) == (10, 'a' * 64, 11)
+
+    metadata.update(11, 'b' * 64, 12)
+    assert loaded_metadata.is_outdated()
+    assert loaded_metadata.load()
+    assert loaded_metadata.block_number == 11
+
+
+def test_cannot_load_missing_or_corrupted_metadata(blockchain_path):
+    path = blockchain_path / 'head-block.msgpack'
+    metadata = HeadBlockMetadata(str(path))
+    assert not metadata.load()
+    assert not metadata.is_loaded
+
+    path.write_bytes(b'\x93\x00')
+    assert not metadata.load()
+    assert not metadata.is_loaded
+    assert metadata.block_number is None
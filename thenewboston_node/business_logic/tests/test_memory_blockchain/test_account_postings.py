@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.core.utils.cryptography import KeyPair
+
+
+@pytest.mark.usefixtures('forced_mock_network', 'get_primary_validator_mock', 'get_preferred_node_mock')
+def test_historical_balances_are_read_using_account_postings(
+    forced_memory_blockchain: MemoryBlockchain, treasury_account_key_pair: KeyPair, user_account_key_pair: KeyPair
+):
+    blockchain = forced_memory_blockchain
+    blockchain.arf_creation_period_in_blocks = 3
+    accounts = (treasury_account_key_pair.public, user_account_key_pair.public)
+
+    for amount in range(1, 6):
+        block = Block.from_main_transaction(
+            blockchain, user_account_key_pair.public, amount, signing_key=treasury_account_key_pair.private
+        )
+        blockchain.add_block(block)
+
+    def get_balances():
+        return [
+            (blockchain.get_balance_value(account, block_number), blockchain.get_balance_lock(account, block_number))
+            for block_number in range(6)
+            for account in accounts
+        ]
+
+    with patch.object(blockchain, 'get_blocks_until_account_root_file') as get_blocks_mock:
+        balances = get_balances()
+
+    get_blocks_mock.assert_not_called()
+    assert blockchain.account_postings is not None
+    assert blockchain.account_postings.next_block_number == 5
+
+    blockchain.use_account_postings = False
+    blockchain.use_balance_index = False
+    assert balances == get_balances()
@@ -1,6 +1,8 @@
 import copy
+from unittest.mock import patch
 
 from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.models.account_root_file import AccountRootFileView
 
 
 def test_get_latest_account_root_file(forced_memory_blockchain: MemoryBlockchain, initial_account_root_file):
@@ -36,3 +38,12 @@ def test_get_latest_account_root_file(forced_memory_blockchain: MemoryBlockchain
     assert forced_memory_blockchain.get_closest_account_root_file(4) == account_root_file1
     assert forced_memory_blockchain.get_closest_account_root_file(5) == account_root_file1
     assert forced_memory_blockchain.get_closest_account_root_file(6) == account_root_file2
+
+
+def test_closest_account_root_file_is_not_copied(forced_memory_blockchain: MemoryBlockchain):
+    with patch('copy.deepcopy') as deepcopy_mock:
+        closest_account_root_file = forced_memory_blockchain.get_closest_account_root_file()
+
+    deepcopy_mock.assert_not_called()
+    assert isinstance(closest_account_root_file, AccountRootFileView)
+    assert closest_account_root_file._account_root_file is forced_memory_blockchain.account_root_files[0]
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.core.utils.cryptography import KeyPair
+
+
+@pytest.mark.usefixtures('forced_mock_network', 'get_primary_validator_mock', 'get_preferred_node_mock')
+def test_head_balances_are_read_from_balance_index(
+    forced_memory_blockchain: MemoryBlockchain, treasury_account_key_pair: KeyPair, user_account_key_pair: KeyPair
+):
+    blockchain = forced_memory_blockchain
+    blockchain.arf_creation_period_in_blocks = 3
+    treasury_account = treasury_account_key_pair.public
+    user_account = user_account_key_pair.public
+
+    for amount in range(1, 6):
+        block = Block.from_main_transaction(
+            blockchain, user_account, amount, signing_key=treasury_account_key_pair.private
+        )
+        blockchain.add_block(block)
+
+    assert blockchain.balance_index is not None
+    assert blockchain.balance_index.next_block_number == 5
+
+    with patch.object(blockchain, 'get_blocks_until_account_root_file') as get_blocks_mock:
+        head_balances = [(blockchain.get_balance_value(account), blockchain.get_balance_lock(account))
+                         for account in (treasury_account, user_account)]
+
+    get_blocks_mock.assert_not_called()
+    assert head_balances[1] == (15, user_account)
+
+    blockchain.use_balance_index = False
+    assert head_balances == [(blockchain.get_balance_value(account), blockchain.get_balance_lock(account))
+                             for account in (treasury_account, user_account)]
+
+
+def test_balance_index_is_made_on_demand(
+    forced_memory_blockchain: MemoryBlockchain, treasury_account_key_pair: KeyPair, user_account_key_pair: KeyPair,
+    primary_validator, preferred_node
+):
+    blockchain = forced_memory_blockchain
+    treasury_account = treasury_account_key_pair.public
+    initial_balance = blockchain.get_balance_value(treasury_account)
+    assert initial_balance is not None
+
+    block = Block.from_main_transaction(
+        blockchain,
+        user_account_key_pair.public,
+        10,
+        signing_key=treasury_account_key_pair.private,
+        primary_validator=primary_validator,
+        node=preferred_node,
+    )
+    blockchain.persist_block(block)  # bypass add_block() to get the index outdated
+
+    assert blockchain.get_balance_value(treasury_account) == initial_balance - 15
+    assert blockchain.balance_index is not None
+    assert blockchain.balance_index.next_block_number == 1
+    assert blockchain.get_balance_value(treasury_account, 0) == initial_balance
+
+
+@pytest.mark.usefixtures('forced_mock_network', 'get_primary_validator_mock', 'get_preferred_node_mock')
+def test_account_root_file_is_generated_from_balance_index(
+    forced_memory_blockchain: MemoryBlockchain, treasury_account_key_pair: KeyPair, user_account_key_pair: KeyPair
+):
+    blockchain = forced_memory_blockchain
+    for amount in range(1, 4):
+        block = Block.from_main_transaction(
+            blockchain, user_account_key_pair.public, amount, signing_key=treasury_account_key_pair.private
+        )
+        blockchain.add_block(block)
+
+    with patch.object(blockchain, 'iter_blocks_from') as iter_blocks_from_mock:
+        account_root_file = blockchain.generate_account_root_file()
+
+    iter_blocks_from_mock.assert_not_called()
+
+    blockchain.use_balance_index = False
+    assert account_root_file == blockchain.generate_account_root_file()
@@ -1,7 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 
 from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
 from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.indexes.account_balance_index import AccountBalanceIndex
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
 
 
 @pytest.mark.usefixtures('forced_mock_network')
@@ -19,6 +23,62 @@ def test_validate_account_root_files_raises(forced_memory_blockchain: MemoryBloc
         blockchain.validate_account_root_files()
 
 
-@pytest.mark.skip('Not implemented yet')
-def test_validate_account_root_file_balances():
-    raise NotImplementedError
+@pytest.fixture
+def blockchain(treasury_account_key_pair):
+    blockchain = MemoryBlockchain(arf_creation_period_in_blocks=3, drop_intermediate_account_root_files=False)
+    generate_blockchain(blockchain, 10, treasury_account_key_pair=treasury_account_key_pair)
+    assert [arf.last_block_number for arf in blockchain.account_root_files] == [None, 2, 5, 8]
+    yield blockchain
+
+
+def test_validate_account_root_file_balances(blockchain):
+    blockchain.validate_account_root_files()
+
+    account_root_file = blockchain.account_root_files[2]
+    account, balance = next(iter(account_root_file.accounts.items()))
+    balance.value += 1
+    with pytest.raises(
+        ValidationError, match=f'Expected {balance.value - 1} balance value, but got {balance.value} balance value'
+    ):
+        blockchain.validate_account_root_files()
+
+    balance.value -= 1
+    balance.lock = blockchain.account_root_files[3].accounts[account].lock[::-1]
+    with pytest.raises(ValidationError, match='balance lock'):
+        blockchain.validate_account_root_files()
+
+    del account_root_file.accounts[account]
+    with pytest.raises(ValidationError, match='accounts, but got'):
+        blockchain.validate_account_root_files()
+
+
+def test_account_root_file_balances_are_validated_in_single_pass(blockchain):
+    with patch.object(AccountBalanceIndex, 'apply_block', autospec=True,
+                      side_effect=AccountBalanceIndex.apply_block) as apply_block_mock, \
+            patch.object(blockchain, 'generate_account_root_file', side_effect=AssertionError('Must not be called')):
+        blockchain.validate_account_root_files()
+
+    assert [call.args[1].message.block_number for call in apply_block_mock.call_args_list] == list(range(9))
+
+
+def get_validation_error(callable_):
+    try:
+        callable_()
+    except ValidationError as ex:
+        return str(ex)
+
+    return None
+
+
+def test_account_root_file_balances_are_validated_if_blocks_are_missing(blockchain):
+    blockchain.blocks = blockchain.blocks[4:]
+    blockchain.account_root_files = blockchain.account_root_files[1:]
+    expected_error = get_validation_error(
+        lambda: blockchain.validate_account_root_file_balances(account_root_file=blockchain.account_root_files[1])
+    )
+
+    # Account root file is generated if blocks to roll balances forward through are missing
+    with patch.object(blockchain, 'generate_account_root_file', wraps=blockchain.generate_account_root_file) as mock:
+        assert get_validation_error(blockchain.validate_account_root_files) == expected_error
+
+    mock.assert_called_once_with(5)
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.blockchain.signatures import iter_signature_validated_blocks
+from thenewboston_node.business_logic.exceptions import ValidationError
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
+
+
+@pytest.fixture
+def blockchain(treasury_account_key_pair):
+    blockchain = MemoryBlockchain(signature_validation_workers=2)
+    generate_blockchain(blockchain, 10, treasury_account_key_pair=treasury_account_key_pair)
+    yield blockchain
+
+
+def test_can_validate_signatures_in_parallel(blockchain):
+    with patch.object(Block, 'validate_signatures', autospec=True, side_effect=Block.validate_signatures) as mock:
+        blockchain.validate_blocks()
+
+    assert mock.call_count == 10
+
+
+def test_blocks_are_yielded_in_order(blockchain):
+    blocks = list(blockchain.iter_blocks())
+    results = list(iter_signature_validated_blocks(blocks, workers=3, batch_size=2))
+    assert results == [(block, True) for block in blocks]
+
+
+def test_invalid_signature_is_reported(blockchain):
+    blocks = list(blockchain.iter_blocks())
+    blocks[5].message_signature = blocks[4].message_signature
+
+    results = [result for _, result in iter_signature_validated_blocks(blocks, workers=2, batch_size=2)]
+    assert results == [True] * 5 + [False] + [True] * 4
+
+    with pytest.raises(ValidationError, match='Message signature is invalid'):
+        blockchain.validate_blocks()
+
+
+def test_invalid_transfer_request_signature_is_detected(blockchain):
+    block = blockchain.get_block_by_number(3)
+    block.message.transfer_request.message_signature = '0' * 128
+
+    with pytest.raises(ValidationError, match='Message signature is invalid'):
+        blockchain.validate_blocks()
+
+
+@pytest.mark.parametrize('tamper', ('balance_value', 'block_signature', 'transfer_request_signature'))
+def test_parallel_validation_reports_same_error_as_serial_validation(blockchain, tamper):
+    block = blockchain.get_block_by_number(3)
+    if tamper == 'balance_value':
+        # Block signature becomes invalid too, but serial validation validates balances first
+        block.message.updated_balances[block.message.transfer_request.sender].value += 1
+    elif tamper == 'block_signature':
+        block.message_signature = blockchain.get_block_by_number(2).message_signature
+    else:
+        block.message.transfer_request.message_signature = '0' * 128
+
+    blockchain.signature_validation_workers = None
+    with pytest.raises(ValidationError) as serial_exc_info:
+        blockchain.validate_blocks()
+
+    blockchain.signature_validation_workers = 2
+    with pytest.raises(ValidationError) as exc_info:
+        blockchain.validate_blocks()
+
+    assert str(exc_info.value) == str(serial_exc_info.value)
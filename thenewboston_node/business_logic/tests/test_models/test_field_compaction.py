@@ -1,8 +1,10 @@
 import pytest
 
 from thenewboston_node.business_logic.models.account_root_file import AccountRootFile
+from thenewboston_node.business_logic.models.base import COMPACT_KEY_MAP, COMPACT_SUBKEY_MAP, COMPACT_VALUE_MAP
 from thenewboston_node.business_logic.models.block import Block
 from thenewboston_node.business_logic.tests import factories
+from thenewboston_node.core.utils.collections import map_values, replace_keys
 
 
 @pytest.mark.parametrize(
@@ -254,3 +256,21 @@ def test_account_root_file_accounts_are_stored_in_bytes():
     compact_dict = account_root_file.to_compact_dict(compact_keys=False)['accounts']
 
     assert set(compact_dict.keys()) == {bytes.fromhex(account)}
+
+
+@pytest.mark.parametrize('compact_keys', (True, False))
+@pytest.mark.parametrize('compact_values', (True, False))
+def test_single_pass_compaction_matches_multiple_passes(compact_keys, compact_values):
+    block = factories.BlockFactory()
+    block_dict = block.to_dict()
+
+    expected_compact_dict = block_dict
+    if compact_values:
+        expected_compact_dict = map_values(expected_compact_dict, COMPACT_VALUE_MAP)
+        expected_compact_dict = map_values(expected_compact_dict, COMPACT_SUBKEY_MAP, subkeys=True)
+    if compact_keys:
+        expected_compact_dict = replace_keys(expected_compact_dict, COMPACT_KEY_MAP)
+
+    compact_dict = block.to_compact_dict(compact_keys=compact_keys, compact_values=compact_values)
+    assert compact_dict == expected_compact_dict
+    assert Block.from_compact_dict(compact_dict, compact_keys=compact_keys, compact_values=compact_values) == block
@@ -0,0 +1,65 @@
+import copy
+import pickle
+from unittest.mock import patch
+
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.models.block_message import BlockMessage
+from thenewboston_node.business_logic.models.transfer_request_message import TransferRequestMessage
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
+from thenewboston_node.core.utils.cryptography import generate_key_pair
+
+
+def make_blockchain(treasury_account_key_pair):
+    blockchain = MemoryBlockchain()
+    generate_blockchain(blockchain, 3, treasury_account_key_pair=treasury_account_key_pair)
+    return blockchain
+
+
+def test_block_validation_normalizes_each_message_once(treasury_account_key_pair):
+    blockchain = make_blockchain(treasury_account_key_pair)
+    block = Block.from_messagepack(blockchain.get_block_by_number(2).to_messagepack())
+    blockchain.blocks[2] = block
+
+    with patch.object(BlockMessage, 'normalize', autospec=True, side_effect=BlockMessage.normalize) as block_mock, \
+            patch.object(TransferRequestMessage, 'normalize', autospec=True,
+                         side_effect=TransferRequestMessage.normalize) as transfer_request_mock:
+        blockchain.validate_blocks(offset=2, limit=1)
+
+    assert block_mock.call_count == 1
+    assert transfer_request_mock.call_count == 1
+
+
+def test_hash_is_updated_on_nested_change(sample_transfer_request):
+    message = sample_transfer_request.message
+    message_hash = message.get_hash()
+    assert message.get_hash() == message_hash
+
+    message.txs[0].amount += 1
+    assert message.get_hash() != message_hash
+
+    message.txs[0].amount -= 1
+    assert message.get_hash() == message_hash
+
+
+def test_signing_changes_containing_message_hash(treasury_account_key_pair):
+    blockchain = make_blockchain(treasury_account_key_pair)
+    block = blockchain.get_block_by_number(1)
+    message_hash = block.message.get_hash()
+    assert message_hash == block.message_hash
+
+    block.message.transfer_request.sign(generate_key_pair().private)
+    assert block.message.get_hash() != message_hash
+
+
+def test_copies_track_changes_independently(treasury_account_key_pair):
+    blockchain = make_blockchain(treasury_account_key_pair)
+    block = blockchain.get_block_by_number(0)
+    message_hash = block.message.get_hash()
+
+    for block_copy in (copy.deepcopy(block), pickle.loads(pickle.dumps(block))):
+        assert block_copy.message.get_hash() == message_hash
+        balance = next(iter(block_copy.message.updated_balances.values()))
+        balance.value += 1
+        assert block_copy.message.get_hash() != message_hash
+        assert block.message.get_hash() == message_hash
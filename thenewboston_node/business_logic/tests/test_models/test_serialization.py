@@ -0,0 +1,64 @@
+import copy
+import timeit
+from datetime import datetime
+
+import pytest
+from dataclasses_json.core import _asdict, _decode_dataclass
+
+from thenewboston_node.business_logic.blockchain.memory_blockchain import MemoryBlockchain
+from thenewboston_node.business_logic.models.block import Block
+from thenewboston_node.business_logic.utils.blockchain import generate_blockchain
+from thenewboston_node.core.utils.pytest import skip_slow
+
+
+def to_dict_reference(block):
+    # This is how blocks were serialized with dataclasses_json (with ISO format timestamp encoder)
+    dict_ = _asdict(block)
+    dict_['message']['timestamp'] = block.message.timestamp.isoformat()
+    for balance in dict_['message']['updated_balances'].values():
+        if balance['lock'] is None:
+            del balance['lock']
+
+    for tx in dict_['message']['transfer_request']['message']['txs']:
+        if tx['fee'] in (None, False):
+            del tx['fee']
+        if tx['memo'] is None:
+            del tx['memo']
+
+    return dict_
+
+
+def from_dict_reference(dict_):
+    dict_ = copy.deepcopy(dict_)
+    dict_['message']['timestamp'] = datetime.fromisoformat(dict_['message']['timestamp'])
+    return _decode_dataclass(Block, dict_, False)
+
+
+@pytest.fixture
+def blocks(treasury_account_key_pair):
+    blockchain = MemoryBlockchain()
+    generate_blockchain(blockchain, 20, treasury_account_key_pair=treasury_account_key_pair)
+    blocks = list(blockchain.iter_blocks())
+    blocks[0].message.transfer_request.message.txs[0].memo = 'Memo'
+    yield blocks
+
+
+def test_serialization_matches_dataclasses_json(blocks):
+    for block in blocks:
+        dict_ = block.to_dict()
+        assert dict_ == to_dict_reference(block)
+        assert list(dict_) == list(to_dict_reference(block))  # messagepack preserves keys order
+
+        assert Block.from_dict(dict_) == from_dict_reference(dict_) == block
+        assert Block.from_messagepack(block.to_messagepack()) == block
+
+
+@skip_slow
+def test_serialization_is_faster_than_dataclasses_json(blocks):
+    dicts = [block.to_dict() for block in blocks]
+
+    def run(callable_, items):
+        return min(timeit.repeat(lambda: [callable_(item) for item in items], number=5, repeat=3))
+
+    assert run(Block.to_dict, blocks) < run(to_dict_reference, blocks)
+    assert run(Block.from_dict, dicts) < run(from_dict_reference, dicts)
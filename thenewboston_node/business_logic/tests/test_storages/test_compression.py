@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import pytest
+
+from thenewboston_node.business_logic.storages import compression
+from thenewboston_node.business_logic.storages.compression import (
+    BestCompressionPolicy, FixedCompressionPolicy, LearningCompressionPolicy, SamplingCompressionPolicy, get_file_class
+)
+from thenewboston_node.business_logic.storages.file_system import FileSystemStorage
+from thenewboston_node.business_logic.tests.test_storages.utils import decompress
+
+
+def test_best_compression_policy(compressible_data, incompressible_data):
+    policy = BestCompressionPolicy(('gz', 'bz2', 'xz'))
+    compressor, compressed_data = policy.compress('file.txt', compressible_data)
+    assert compressor == 'gz'
+    assert len(compressed_data) == 46
+
+    assert policy.compress('file.txt', incompressible_data) == (None, incompressible_data)
+
+    stats = policy.stats
+    assert stats.file_count == 2
+    assert stats.original_bytes == len(compressible_data) + len(incompressible_data)
+    assert stats.saved_bytes == len(compressible_data) - 46
+    assert stats.milliseconds > 0
+    assert stats.baseline_milliseconds > 0
+
+
+def test_fixed_compression_policy(compressible_data):
+    compressor, compressed_data = FixedCompressionPolicy('xz').compress('file.txt', compressible_data)
+    assert compressor == 'xz'
+    assert compression.DECOMPRESSION_FUNCTIONS['xz'](compressed_data) == compressible_data
+
+
+def test_sampling_compression_policy(compressible_data):
+    policy = SamplingCompressionPolicy(('gz', 'bz2'), sample_size=1000)
+    with patch.object(policy, '_compress_best', wraps=policy._compress_best) as compress_best_mock:
+        compressor, compressed_data = policy.compress('file.txt', compressible_data)
+
+    compress_best_mock.assert_called_once_with(('gz', 'bz2'), compressible_data[:1000])
+    assert compressor == 'gz'
+    assert compression.DECOMPRESSION_FUNCTIONS['gz'](compressed_data) == compressible_data
+
+
+def test_learning_compression_policy(compressible_data):
+    policy = LearningCompressionPolicy(('gz', 'bz2', 'xz'), learn_count=2, relearn_period=4)
+    with patch.object(policy, '_compress_best', wraps=policy._compress_best) as compress_best_mock:
+        for block_number in range(5):
+            compressor, _ = policy.compress(f'{block_number}-{block_number}-block-chunk.msgpack', compressible_data)
+            assert compressor == 'gz'
+
+        assert policy.compress('0000000001-arf.msgpack', compressible_data)[0] == 'gz'
+
+    # 2 files learning + 1 relearning for block chunks and 1 for account root files
+    assert compress_best_mock.call_count == 4
+    assert policy.get_learned_compressor(get_file_class('10-20-block-chunk.msgpack')) == 'gz'
+
+
+def test_compression_policy_reports_time_saved_against_baseline():
+    policy = FixedCompressionPolicy('gz', baseline_compressors=('gz', 'bz2', 'xz'))
+    timings = {'gz': 100, 'bz2': 200, 'xz': 300}
+
+    def compress_with(compressor, data):
+        total_bytes, total_milliseconds = policy.compressor_timings.get(compressor, (0, 0))
+        policy.compressor_timings[compressor] = total_bytes + len(data), total_milliseconds + timings[compressor]
+        if len(data) == policy._file_size:
+            policy._file_compressor_milliseconds[compressor] = timings[compressor]
+
+        return compression.COMPRESSION_FUNCTIONS[compressor](data)
+
+    data = b'A' * (2 * compression.TIMING_SAMPLE_SIZE)  # bz2 and xz times are extrapolated from a sample
+    with patch.object(policy, '_compress_with', side_effect=compress_with) as compress_with_mock:
+        for _ in range(2):
+            assert policy.compress('file.txt', data)[0] == 'gz'
+
+    # bz2 and xz are timed on a sample once
+    assert [call.args[0] for call in compress_with_mock.call_args_list] == ['gz', 'bz2', 'xz', 'gz']
+    stats = policy.stats
+    assert stats.baseline_milliseconds == 2 * (100 + 200 * 2 + 300 * 2)
+    assert stats.saved_milliseconds == stats.baseline_milliseconds - stats.milliseconds
+    assert stats.saved_milliseconds > 0
+
+
+@pytest.mark.parametrize('compression_policy', (FixedCompressionPolicy('bz2'), SamplingCompressionPolicy(('bz2',))))
+def test_storage_uses_compression_policy(blockchain_path, compressible_data, compression_policy):
+    fss = FileSystemStorage(blockchain_path, compression_policy=compression_policy)
+    fss.save('file.txt', compressible_data, is_final=True)
+
+    assert decompress(blockchain_path / 'file.txt.bz2', 'bz2') == compressible_data
+    assert fss.load('file.txt') == compressible_data
+    assert compression_policy.stats.file_count == 1
@@ -1,9 +1,12 @@
 import os.path
+from unittest.mock import patch
 
 import pytest
 
 from thenewboston_node.business_logic import exceptions
-from thenewboston_node.business_logic.storages.file_system import FileSystemStorage
+from thenewboston_node.business_logic.storages.file_system import (
+    FSYNC_ON_APPEND, FSYNC_ON_FINALIZE, FSYNC_PERIODICALLY, FileSystemStorage
+)
 from thenewboston_node.business_logic.tests.test_storages.utils import compress, decompress
 
 
@@ -144,3 +147,117 @@ def test_cannot_use_absolute_path(blockchain_path, compressible_data):
 
     with pytest.raises(ValueError):
         fss.save(file_path, compressible_data)
+
+
+@pytest.mark.parametrize('compression', ('gz', 'bz2', 'xz'))
+def test_can_stream_compressed_file(blockchain_path, compression, compressible_data):
+    fss = FileSystemStorage(blockchain_path)
+    compress(blockchain_path / f'file.txt.{compression}', compression, compressible_data)
+
+    with fss.open_stream('file.txt') as fo:
+        assert fo.read(10) == compressible_data[:10]
+
+    chunks = list(fss.iter_chunks('file.txt', chunk_size=3000))
+    assert list(map(len, chunks)) == [3000, 3000, 3000, 1000]
+    assert b''.join(chunks) == compressible_data
+
+
+def test_compressor_is_cached(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path, compressors=('bz2',))
+    fss.save('file.txt', compressible_data, is_final=True)
+    assert fss.compressors_cache[str(blockchain_path / 'file.txt')] == 'bz2'
+
+    with patch('os.path.exists') as exists_mock:
+        assert fss.load('file.txt') == compressible_data
+
+    exists_mock.assert_not_called()
+
+
+def test_outdated_cached_compressor_is_ignored(blockchain_path, compressible_data):
+    fss = FileSystemStorage(blockchain_path)
+    fss.save('file.txt', b'raw data')
+    assert fss.load('file.txt') == b'raw data'
+
+    # File is finalized bypassing the storage
+    os.remove(blockchain_path / 'file.txt')
+    compress(blockchain_path / 'file.txt.xz', 'xz', compressible_data)
+
+    assert fss.load('file.txt') == compressible_data
+    assert fss.compressors_cache[str(blockchain_path / 'file.txt')] == 'xz'
+
+
+def test_append_keeps_file_open(blockchain_path):
+    fss = FileSystemStorage(blockchain_path)
+    fss.append('file.txt', b'AAA')
+    with patch.object(fss, '_is_finalized') as is_finalized_mock:
+        fss.append('file.txt', b'BBB')
+
+    is_finalized_mock.assert_not_called()
+    assert fss.load('file.txt') == b'AAABBB'
+
+    fss.finalize('file.txt')
+    assert not fss.append_writers
+    with pytest.raises(exceptions.FinalizedFileWriteError):
+        fss.append('file.txt', b'CCC')
+
+
+def test_moved_file_is_kept_open(blockchain_path):
+    fss = FileSystemStorage(blockchain_path)
+    fss.append('file1.txt', b'AAA')
+    writer = fss.append_writers['file1.txt']
+    with patch('os.fsync') as fsync_mock:
+        fss.move('file1.txt', 'file2.txt')
+
+    fsync_mock.assert_not_called()
+    assert fss.append_writers == {'file2.txt': writer}
+
+    fss.append('file2.txt', b'BBB')
+    assert fss.load('file2.txt') == b'AAABBB'
+    assert not os.path.exists(blockchain_path / 'file1.txt')
+
+
+@pytest.mark.parametrize(
+    'kwargs, append_fsync_count', (
+        ({
+            'fsync_policy': FSYNC_ON_APPEND
+        }, 3),
+        ({
+            'fsync_policy': FSYNC_PERIODICALLY,
+            'fsync_period_ms': 0
+        }, 3),
+        ({
+            'fsync_policy': FSYNC_PERIODICALLY,
+            'fsync_period_ms': 60000
+        }, 0),
+        ({
+            'fsync_policy': FSYNC_ON_FINALIZE
+        }, 0),
+        ({
+            'fsync_policy': None
+        }, 0),
+    )
+)
+def test_fsync_policy(blockchain_path, kwargs, append_fsync_count):
+    fss = FileSystemStorage(blockchain_path, **kwargs)
+    with patch('os.fsync') as fsync_mock:
+        for _ in range(3):
+            fss.append('file.txt', b'AAA')
+
+        assert fsync_mock.call_count == append_fsync_count
+        fss.finalize('file.txt')
+        assert fsync_mock.call_count == append_fsync_count + (kwargs['fsync_policy'] is not None)
+
+
+def test_close_fsyncs_appended_data(blockchain_path):
+    fss = FileSystemStorage(blockchain_path)
+    fss.append('file.txt', b'AAA')
+    with patch('os.fsync') as fsync_mock:
+        fss.close()
+
+    fsync_mock.assert_called_once()
+    assert not fss.append_writers
+
+
+def test_invalid_fsync_policy(blockchain_path):
+    with pytest.raises(ValueError, match='fsync_policy must be one of'):
+        FileSystemStorage(blockchain_path, fsync_policy='never')
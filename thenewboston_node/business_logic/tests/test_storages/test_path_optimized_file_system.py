@@ -272,3 +272,74 @@ def test_move(blockchain_path):
     assert os.path.isfile(str(blockchain_path / 'f/i/l/e/2/file2.txt'))
     assert not os.path.isfile(str(blockchain_path / 'f/i/l/e/1/file1.txt'))
     assert storage.load(destination) == b'AAA'
+
+
+def test_listing_is_cached(blockchain_path):
+    storage = PathOptimizedFileSystemStorage(blockchain_path)
+    storage.save('b.txt', b'B')
+    assert list(storage.list_directory()) == ['b.txt']
+
+    with patch('os.walk') as os_walk_mock:
+        storage.save('c.txt', b'C')
+        storage.append('a.txt', b'A')
+        storage.append('a.txt', b'A')
+        storage.move('c.txt', 'd.txt')
+        storage.finalize('d.txt')
+        storage.save('e.txt', b'E', is_final=True)
+        assert list(storage.list_directory()) == ['a.txt', 'b.txt', 'd.txt', 'e.txt']
+        assert list(storage.list_directory(sort_direction=-1)) == ['e.txt', 'd.txt', 'b.txt', 'a.txt']
+
+    os_walk_mock.assert_not_called()
+
+
+def test_listing_cache_is_invalidated_by_other_storage(blockchain_path):
+    storage = PathOptimizedFileSystemStorage(blockchain_path)
+    storage.save('a.txt', b'A')
+    assert list(storage.list_directory()) == ['a.txt']
+
+    PathOptimizedFileSystemStorage(blockchain_path).save('b.txt', b'B')
+    assert list(storage.list_directory()) == ['a.txt', 'b.txt']
+
+
+def test_listing_cache_is_invalidated_by_file_added_to_nested_directory(blockchain_path):
+    storage = PathOptimizedFileSystemStorage(blockchain_path, max_depth=2)
+    storage.save('abc.txt', b'A')
+    assert list(storage.list_directory()) == ['abc.txt']
+
+    mkdir_and_touch(blockchain_path / 'a/b/abd.txt')  # only the nested directory is modified
+    assert list(storage.list_directory()) == ['abc.txt', 'abd.txt']
+
+    os.remove(blockchain_path / 'a/b/abc.txt')
+    assert list(storage.list_directory()) == ['abd.txt']
+
+
+def test_listing_version_changes_on_listing_change(blockchain_path):
+    storage = PathOptimizedFileSystemStorage(blockchain_path, max_depth=2)
+    storage.save('abc.txt', b'A')
+    version = storage.get_listing_version()
+    storage.append('abc.txt', b'A')
+    assert storage.get_listing_version() == version
+
+    mkdir_and_touch(blockchain_path / 'a/b/abd.txt')
+    assert storage.get_listing_version() != version
+
+
+def test_listing_cache_can_be_invalidated(blockchain_path):
+    storage = PathOptimizedFileSystemStorage(blockchain_path)
+    storage.save('a.txt', b'A')
+    assert list(storage.list_directory()) == ['a.txt']
+
+    storage.invalidate_listing_cache()
+    with patch('os.walk', wraps=os.walk) as os_walk_mock:
+        assert list(storage.list_directory()) == ['a.txt']
+
+    os_walk_mock.assert_called_once()
+
+
+def test_listing_is_not_cached_if_disabled(blockchain_path):
+    storage = PathOptimizedFileSystemStorage(blockchain_path, cache_listing=False)
+    storage.save('a.txt', b'A')
+    assert list(storage.list_directory()) == ['a.txt']
+
+    mkdir_and_touch(blockchain_path / 'a/b/ab.txt')
+    assert list(storage.list_directory()) == ['a.txt', 'ab.txt']
@@ -1,8 +1,11 @@
 import functools
+import inspect
 import logging
 from itertools import chain
-from time import time
+from time import perf_counter
+from typing import Optional
 
+from .metrics import registry as metrics_registry
 from .utils.misc import Default, upper_first
 
 module_logger = logging.getLogger(__name__)
@@ -34,6 +37,76 @@ def timeit_method(logger=module_logger, level=logging.DEBUG, is_class_method=Fal
     return timeit(logger=logger, level=level, is_method=True, is_class_method=is_class_method)
 
 
+class CallTimer:
+    """
+    Feed call metrics of `callable_` and log its calls (see `timeit()`).
+    """
+
+    def __init__(
+        self,
+        callable_,
+        *,
+        logger,
+        level,
+        verbose=False,
+        verbose_args=False,
+        verbose_return_value=False,
+        is_method=False,
+        is_class_method=False,
+    ):
+        self.callable = callable_
+        self.logger = logger
+        self.level = level
+        self.verbose = verbose
+        self.verbose_args = verbose_args
+        self.verbose_return_value = verbose_return_value
+        self.is_method = is_method
+        self.is_class_method = is_class_method
+        self.metrics_name = f'{callable_.__module__}.{callable_.__qualname__}'
+
+    def get_call_spec(self, args, kwargs):
+        callable_name = self.callable.__name__
+        if self.is_method:
+            obj = args[0]
+            if self.is_class_method:
+                callable_name = f'{obj.__name__}.{callable_name}'
+            else:
+                callable_name = f'{obj.__class__.__name__}.{callable_name}'
+
+        if self.verbose or self.verbose_args:
+            args_ = args[1:] if self.is_method else args
+            args_repr = ', '.join(chain(map(repr, args_), (f'{key}={value!r}' for key, value in kwargs.items())))
+        else:
+            args_repr = '...'
+
+        return f'{callable_name}({args_repr})'
+
+    def log_call(self, args, kwargs) -> Optional[str]:
+        """
+        Log the call and return its description (or None if logging is disabled).
+        """
+        if not self.logger.isEnabledFor(self.level):
+            return None
+
+        call_spec = self.get_call_spec(args, kwargs)
+        self.logger.log(self.level, 'Calling %s', call_spec)
+        return call_spec
+
+    def observe_exception(self, args, kwargs, start):
+        duration = perf_counter() - start
+        metrics_registry.observe(self.metrics_name, duration, is_error=True)
+        self.logger.exception('Exception in %s after %.3fms', self.get_call_spec(args, kwargs), duration * 1000)
+
+    def observe_return(self, call_spec, start, rv):
+        duration = perf_counter() - start
+        metrics_registry.observe(self.metrics_name, duration)
+        if call_spec is not None:
+            if self.verbose or self.verbose_return_value:
+                self.logger.log(self.level, 'Returned %r from %s in %.3fms', rv, call_spec, duration * 1000)
+            else:
+                self.logger.log(self.level, 'Returned from %s in %.3fms', call_spec, duration * 1000)
+
+
 def timeit(
     logger=module_logger,
     level=logging.DEBUG,
@@ -43,42 +116,58 @@ def timeit(
     is_method=False,
     is_class_method=False,
 ):
+    """
+    Feed call metrics (see `core.metrics`) and log calls. Call descriptions are only built if `logger` is enabled
+    for `level` (or an exception is raised). Calls of generator functions are timed until the generator is exhausted
+    or closed.
+    """
 
     def decorator(callable_):
+        timer = CallTimer(
+            callable_,
+            logger=logger,
+            level=level,
+            verbose=verbose,
+            verbose_args=verbose_args,
+            verbose_return_value=verbose_return_value,
+            is_method=is_method,
+            is_class_method=is_class_method,
+        )
+
+        if inspect.isgeneratorfunction(callable_):
+
+            @functools.wraps(callable_)
+            def generator_wrapper(*args, **kwargs):
+                # Calling generator function does not run its body, so the entire iteration is timed instead
+                call_spec = timer.log_call(args, kwargs)
+                start = perf_counter()
+                try:
+                    rv = yield from callable_(*args, **kwargs)
+                except Exception:
+                    timer.observe_exception(args, kwargs, start)
+                    raise
+                except GeneratorExit:
+                    # The generator was closed before it was exhausted
+                    timer.observe_return(call_spec, start, None)
+                    raise
+
+                timer.observe_return(call_spec, start, rv)
+                return rv
+
+            return generator_wrapper
 
         @functools.wraps(callable_)
         def wrapper(*args, **kwargs):
-            callable_name = callable_.__name__
-            if is_method:
-                obj = args[0]
-                if is_class_method:
-                    callable_name = f'{obj.__name__}.{callable_name}'
-                else:
-                    callable_name = f'{obj.__class__.__name__}.{callable_name}'
-
-            if verbose or verbose_args:
-                args_ = args[1:] if is_method else args
-                args_repr = ', '.join(chain(map(repr, args_), (f'{key}={value!r}' for key, value in kwargs.items())))
-            else:
-                args_repr = '...'
-
-            call_spec = f'{callable_name}({args_repr})'
-            logger.log(level, 'Calling %s', call_spec)
-            start = time()
+            call_spec = timer.log_call(args, kwargs)
+            start = perf_counter()
             try:
                 rv = callable_(*args, **kwargs)
             except Exception:
-                duration_ms = (time() - start) * 1000
-                logger.exception('Exception in %s after %.3fms', call_spec, duration_ms)
+                timer.observe_exception(args, kwargs, start)
                 raise
-            else:
-                duration_ms = (time() - start) * 1000
-                if verbose or verbose_return_value:
-                    logger.log(level, 'Returned %r from %s in %.3fms', rv, call_spec, duration_ms)
-                else:
-                    logger.log(level, 'Returned from %s in %.3fms', call_spec, duration_ms)
 
-                return rv
+            timer.observe_return(call_spec, start, rv)
+            return rv
 
         return wrapper
 
@@ -86,6 +175,10 @@ def timeit(
 
 
 class validates:
+    """
+    Log validation of a target. Used as a decorator or a context manager. Nothing is formatted or logged if
+    `logger` is not enabled for `level`.
+    """
 
     def __init__(
         self,
@@ -100,6 +193,7 @@ class validates:
         self.target_template = target_template
         self.is_plural_target = is_plural_target
         self.use_format_map = use_format_map
+        self.is_logging_enabled = False
 
     def log_validation_started(self, target):
         self.logger.log(self.level, 'Validating %s', target)
@@ -113,19 +207,30 @@ class validates:
         )
 
     def __enter__(self):  # type: ignore
-        self.log_validation_started(self.target_template)
+        self.is_logging_enabled = is_logging_enabled = self.logger.isEnabledFor(self.level)
+        if is_logging_enabled:
+            self.log_validation_started(self.target_template)
+
         return self
 
     def __exit__(self, *exc_info) -> None:  # type: ignore
+        if not self.is_logging_enabled:
+            return
+
         if any(exc_info):
             self.log_validation_failed(self.target_template, exc_info[1])
         else:
             self.log_validation_passed(self.target_template)
 
     def __call__(self, callable_):
+        logger = self.logger
+        level = self.level
 
         @functools.wraps(callable_)
         def wrapper(*args, **kwargs):
+            if not logger.isEnabledFor(level):
+                return callable_(*args, **kwargs)
+
             if self.use_format_map:
                 target = self.target_template.format_map(Default(**kwargs))
             else:
@@ -0,0 +1,118 @@
+import json
+import threading
+from bisect import bisect_left
+from typing import Optional, Sequence
+
+from .utils.os import write_file_atomically
+
+# Latency histogram upper bounds in seconds (the last implicit bucket is +Inf)
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10)
+
+PROMETHEUS_PREFIX = 'thenewboston_node_call'
+
+
+class CallMetrics:
+    """
+    Number of calls, number of calls that raised an exception and latency histogram of a callable.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.error_count = 0
+        self.duration_sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, duration: float, is_error=False):
+        index = bisect_left(self.buckets, duration)
+        with self.lock:
+            self.bucket_counts[index] += 1
+            self.count += 1
+            self.duration_sum += duration
+            if is_error:
+                self.error_count += 1
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                'count': self.count,
+                'error_count': self.error_count,
+                'duration_sum': self.duration_sum,
+                'buckets': dict(zip(map(str, self.buckets + (float('inf'),)), self.bucket_counts)),
+            }
+
+
+class MetricsRegistry:
+    """
+    In-process registry of call metrics fed by `timeit` decorators. Metrics can be exported as JSON or in
+    Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.metrics: dict[str, CallMetrics] = {}
+        self.lock = threading.Lock()
+
+    def get_call_metrics(self, name: str) -> CallMetrics:
+        call_metrics = self.metrics.get(name)
+        if call_metrics is None:
+            with self.lock:
+                call_metrics = self.metrics.setdefault(name, CallMetrics(self.buckets))
+
+        return call_metrics
+
+    def observe(self, name: str, duration: float, is_error=False):
+        self.get_call_metrics(name).observe(duration, is_error=is_error)
+
+    def reset(self):
+        with self.lock:
+            self.metrics = {}
+
+    def to_dict(self):
+        return {name: call_metrics.to_dict() for name, call_metrics in sorted(self.metrics.items())}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = [
+            f'# TYPE {PROMETHEUS_PREFIX}_duration_seconds histogram',
+            f'# TYPE {PROMETHEUS_PREFIX}_errors_total counter',
+        ]
+        for name, call_metrics in self.to_dict().items():
+            label = 'callable="{}"'.format(name.replace('\\', '\\\\').replace('"', '\\"'))
+            cumulative_count = 0
+            for upper_bound, count in call_metrics['buckets'].items():
+                cumulative_count += count
+                upper_bound = '+Inf' if upper_bound == 'inf' else upper_bound
+                lines.append(
+                    f'{PROMETHEUS_PREFIX}_duration_seconds_bucket{{{label},le="{upper_bound}"}} {cumulative_count}'
+                )
+
+            lines.append(f'{PROMETHEUS_PREFIX}_duration_seconds_sum{{{label}}} {call_metrics["duration_sum"]}')
+            lines.append(f'{PROMETHEUS_PREFIX}_duration_seconds_count{{{label}}} {call_metrics["count"]}')
+            lines.append(f'{PROMETHEUS_PREFIX}_errors_total{{{label}}} {call_metrics["error_count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path, format_: Optional[str] = None):
+        """
+        Dump metrics to a file as JSON or Prometheus text (`format_` is 'json' or 'prometheus'). The format is
+        chosen by the file extension if not specified: .prom and .txt files are dumped as Prometheus text.
+        """
+        path = str(path)
+        if format_ is None:
+            format_ = 'prometheus' if path.endswith(('.prom', '.txt')) else 'json'
+
+        if format_ == 'json':
+            text = self.to_json()
+        elif format_ == 'prometheus':
+            text = self.to_prometheus()
+        else:
+            raise ValueError(f'Unsupported metrics format: {format_}')
+
+        write_file_atomically(path, text.encode('utf-8'), fsync=False)
+
+
+registry = MetricsRegistry()
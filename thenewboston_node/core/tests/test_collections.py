@@ -1,6 +1,6 @@
 import pytest
 
-from thenewboston_node.core.utils.collections import map_values, replace_keys
+from thenewboston_node.core.utils.collections import Translator, map_values, replace_keys
 
 
 def test_replace_keys():
@@ -112,3 +112,27 @@ def test_map_subkeys(source, expected_result):
     result = map_values(source, replace_map, subkeys=True)
 
     assert result == expected_result
+
+
+def test_translator():
+    translator = Translator(
+        key_map={
+            'long_a': 'a',
+            'long_b': 'b'
+        },
+        value_map={'long_b': str.upper},
+        subkey_map={'long_c': str.upper},
+    )
+
+    source = {'long_a': [{'long_b': 'text'}, ('x',)], 'long_b': ['one'], 'long_c': [{'key': {'long_b': 'value'}}]}
+    assert translator.translate(source) == {
+        'a': [{
+            'b': 'TEXT'
+        }, ['x']],
+        'b': ['ONE'],
+        'long_c': [{
+            'KEY': {
+                'b': 'VALUE'
+            }
+        }],
+    }
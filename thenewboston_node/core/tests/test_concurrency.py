@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from thenewboston_node.core.utils.concurrency import iter_in_background
+
+
+def test_iter_in_background():
+    thread_names = set()
+
+    def produce():
+        for item in range(100):
+            thread_names.add(threading.current_thread().name)
+            yield item
+
+    assert list(iter_in_background(produce(), 3, 'test-producer')) == list(range(100))
+    assert thread_names == {'test-producer'}
+
+
+def test_iter_in_background_reraises_exception_after_produced_items():
+
+    def produce():
+        yield 1
+        yield 2
+        raise ValueError('Producer failed')
+
+    items = []
+    with pytest.raises(ValueError, match='Producer failed'):
+        for item in iter_in_background(produce(), 10):
+            items.append(item)
+
+    assert items == [1, 2]
+
+
+def test_iter_in_background_stops_producer_on_close():
+    closed = threading.Event()
+
+    def produce():
+        try:
+            item = 0
+            while True:
+                yield item
+                item += 1
+        finally:
+            closed.set()
+
+    iterator = iter_in_background(produce(), 2)
+    assert next(iterator) == 0
+    assert next(iterator) == 1
+
+    iterator.close()
+    assert closed.is_set()
@@ -0,0 +1,71 @@
+import logging
+import timeit
+from unittest.mock import MagicMock
+
+import pytest
+
+from thenewboston_node.core.logging import validates
+
+
+@pytest.fixture
+def validation_logger():
+    logger = logging.getLogger('thenewboston_node.core.tests.validation')
+    logger.propagate = True
+    yield logger
+    logger.setLevel(logging.NOTSET)
+
+
+def test_validates_logs_if_logging_is_enabled(validation_logger, caplog):
+    validation_logger.setLevel(logging.DEBUG)
+
+    @validates('transaction {}', logger=validation_logger)
+    def validate(transaction_id):
+        with validates('recipient', logger=validation_logger):
+            pass
+
+    with caplog.at_level(logging.DEBUG, logger=validation_logger.name):
+        validate(1)
+
+    assert caplog.messages == [
+        'Validating transaction 1', 'Validating recipient', 'Recipient is valid', 'Transaction 1 is valid'
+    ]
+
+
+def test_validates_does_not_format_target_if_logging_is_disabled(validation_logger, caplog):
+    validation_logger.setLevel(logging.INFO)
+    target_template = MagicMock()
+
+    @validates(target_template, logger=validation_logger)
+    def validate():
+        with validates(target_template, logger=validation_logger):
+            raise ValueError('Invalid')
+
+    with caplog.at_level(logging.DEBUG), pytest.raises(ValueError):
+        validate()
+
+    assert not target_template.mock_calls
+    assert not caplog.messages
+
+
+def test_validates_overhead_if_logging_is_disabled(validation_logger):
+
+    def get_overhead():
+
+        @validates('transaction {}', logger=validation_logger)
+        def validate(transaction_id):
+            pass
+
+        return min(timeit.repeat(lambda: validate(1), number=10000, repeat=3))
+
+    validation_logger.setLevel(logging.DEBUG)
+    validation_logger.propagate = False
+    validation_logger.addHandler(logging.NullHandler())
+    try:
+        enabled_overhead = get_overhead()
+    finally:
+        validation_logger.handlers.clear()
+
+    validation_logger.setLevel(logging.INFO)
+    disabled_overhead = get_overhead()
+
+    assert disabled_overhead * 2 < enabled_overhead
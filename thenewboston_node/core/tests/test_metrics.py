@@ -0,0 +1,136 @@
+import json
+import logging
+import time
+
+import pytest
+
+from thenewboston_node.core.logging import timeit
+from thenewboston_node.core.metrics import MetricsRegistry, registry
+
+
+@timeit(level=logging.INFO)
+def succeed():
+    return 1
+
+
+@timeit(level=logging.INFO)
+def fail():
+    raise ValueError('Failed')
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+def test_timeit_feeds_metrics_registry():
+    assert succeed() == 1
+    assert succeed() == 1
+    with pytest.raises(ValueError):
+        fail()
+
+    metrics = registry.to_dict()
+    succeed_metrics = metrics[f'{__name__}.succeed']
+    assert succeed_metrics['count'] == 2
+    assert succeed_metrics['error_count'] == 0
+    assert sum(succeed_metrics['buckets'].values()) == 2
+
+    fail_metrics = metrics[f'{__name__}.fail']
+    assert fail_metrics['count'] == 1
+    assert fail_metrics['error_count'] == 1
+
+
+def test_timeit_times_generator_iteration():
+
+    @timeit(level=logging.INFO)
+    def generate(items):
+        for item in items:
+            time.sleep(0.01)
+            yield item
+
+    @timeit(level=logging.INFO)
+    def generate_and_fail():
+        yield 1
+        raise ValueError('Failed')
+
+    generator = generate([1, 2, 3])
+    assert registry.to_dict() == {}
+
+    assert list(generator) == [1, 2, 3]
+    generate_metrics = registry.to_dict()[f'{__name__}.{generate.__qualname__}']
+    assert generate_metrics['count'] == 1
+    assert generate_metrics['duration_sum'] >= 0.03
+
+    generator = generate([1, 2, 3])
+    assert next(generator) == 1
+    generator.close()
+    assert registry.to_dict()[f'{__name__}.{generate.__qualname__}']['count'] == 2
+
+    with pytest.raises(ValueError):
+        list(generate_and_fail())
+
+    assert registry.to_dict()[f'{__name__}.{generate_and_fail.__qualname__}']['error_count'] == 1
+
+
+def test_timeit_does_not_build_call_description_if_logging_is_disabled(caplog):
+
+    class Argument:
+
+        def __repr__(self):
+            raise AssertionError('Must not be called')
+
+    @timeit(verbose_args=True, level=logging.DEBUG)
+    def call(argument):
+        pass
+
+    with caplog.at_level(logging.INFO):
+        call(Argument())
+
+    assert registry.to_dict()[call.__module__ + '.' + call.__qualname__]['count'] == 1
+
+
+def test_metrics_export():
+    metrics_registry = MetricsRegistry(buckets=(0.1, 1))
+    metrics_registry.observe('module.function', 0.05)
+    metrics_registry.observe('module.function', 0.5, is_error=True)
+    metrics_registry.observe('module.function', 5)
+
+    assert metrics_registry.to_dict() == {
+        'module.function': {
+            'count': 3,
+            'error_count': 1,
+            'duration_sum': 5.55,
+            'buckets': {
+                '0.1': 1,
+                '1': 1,
+                'inf': 1
+            },
+        }
+    }
+
+    assert metrics_registry.to_prometheus().splitlines() == [
+        '# TYPE thenewboston_node_call_duration_seconds histogram',
+        '# TYPE thenewboston_node_call_errors_total counter',
+        'thenewboston_node_call_duration_seconds_bucket{callable="module.function",le="0.1"} 1',
+        'thenewboston_node_call_duration_seconds_bucket{callable="module.function",le="1"} 2',
+        'thenewboston_node_call_duration_seconds_bucket{callable="module.function",le="+Inf"} 3',
+        'thenewboston_node_call_duration_seconds_sum{callable="module.function"} 5.55',
+        'thenewboston_node_call_duration_seconds_count{callable="module.function"} 3',
+        'thenewboston_node_call_errors_total{callable="module.function"} 1',
+    ]
+
+
+def test_can_dump_metrics(tmp_path):
+    metrics_registry = MetricsRegistry()
+    metrics_registry.observe('module.function', 0.05)
+
+    metrics_registry.dump(tmp_path / 'metrics.json')
+    assert json.loads((tmp_path / 'metrics.json').read_text()) == metrics_registry.to_dict()
+
+    metrics_registry.dump(tmp_path / 'metrics.prom')
+    assert (tmp_path / 'metrics.prom').read_text() == metrics_registry.to_prometheus()
+
+    with pytest.raises(ValueError):
+        metrics_registry.dump(tmp_path / 'metrics', format_='xml')
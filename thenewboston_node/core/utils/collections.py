@@ -1,4 +1,4 @@
-from typing import Callable, Union
+from typing import Callable, Optional, Union
 
 
 def deep_update(base_dict, update_with):
@@ -45,3 +45,41 @@ def map_values(source: Union[dict, list], replace_map: dict[str, Callable], curr
 
 def noop(val):
     return val
+
+
+class Translator:
+    """
+    Translate nested dicts and lists in a single pass (one allocation per dict or list): replace keys according to
+    `key_map`, map values with functions from `value_map` and keys of dicts with functions from `subkey_map`.
+    Functions are looked up by the source key the value (or the dict) is stored under, lists are transparent.
+    """
+
+    def __init__(
+        self,
+        key_map: Optional[dict] = None,
+        value_map: Optional[dict[str, Callable]] = None,
+        subkey_map: Optional[dict[str, Callable]] = None,
+    ):
+        self.key_map = key_map or {}
+        self.value_map = value_map or {}
+        self.subkey_map = subkey_map or {}
+
+    def translate(self, source):
+        return self._translate(source, None)
+
+    def _translate(self, source, current_key):
+        if isinstance(source, dict):
+            translate = self._translate
+            subkey_func = self.subkey_map.get(current_key)
+            if subkey_func is None:
+                key_map = self.key_map
+                return {key_map.get(key, key): translate(value, key) for key, value in source.items()}
+
+            return {subkey_func(key): translate(value, key) for key, value in source.items()}
+
+        if isinstance(source, (list, tuple)):
+            translate = self._translate
+            return [translate(item, current_key) for item in source]
+
+        func = self.value_map.get(current_key)
+        return source if func is None else func(source)
@@ -0,0 +1,87 @@
+import queue
+import threading
+from typing import Generator, Iterable, Optional, TypeVar
+
+T = TypeVar('T')
+
+# How often (in seconds) a background producer blocked on a full queue checks if the consumer has stopped
+PUT_TIMEOUT = 0.1
+
+_END = object()
+
+
+class BackgroundProducer:
+    """
+    Put items of `iterable` to a bounded queue (to be run in a background thread) until the iterable is exhausted
+    or `stop()` is called.
+    """
+
+    def __init__(self, iterable: Iterable, queue_size: int):
+        self.iterable = iterable
+        self.items: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.stopped = threading.Event()
+
+    def run(self):
+        try:
+            for item in self.iterable:
+                if not self._put((item, None)):
+                    return
+        except Exception as ex:
+            self._put((_END, ex))
+        else:
+            self._put((_END, None))
+        finally:
+            close = getattr(self.iterable, 'close', None)
+            if close is not None:
+                close()
+
+    def stop(self):
+        self.stopped.set()
+
+    def iter_items(self) -> Generator:
+        """
+        Yield produced items (to be called by the consumer). An exception raised by the iterable is reraised.
+        """
+        items = self.items
+        while True:
+            item, exception = items.get()
+            if item is _END:
+                if exception is not None:
+                    raise exception
+
+                return
+
+            yield item
+
+    def _put(self, item) -> bool:
+        stopped = self.stopped
+        while not stopped.is_set():
+            try:
+                self.items.put(item, timeout=PUT_TIMEOUT)
+            except queue.Full:
+                continue
+
+            return True
+
+        return False
+
+
+def iter_in_background(iterable: Iterable[T],
+                       queue_size: int,
+                       thread_name: Optional[str] = None) -> Generator[T, None, None]:
+    """
+    Iterate `iterable` in a background thread and yield its items, so they are produced while the consumer is
+    processing the items yielded before. Up to `queue_size` items are produced ahead. An exception raised by
+    `iterable` is reraised to the consumer after all the items produced before the exception are yielded.
+    The background thread is stopped when the returned generator is closed.
+    """
+    assert queue_size > 0
+
+    producer = BackgroundProducer(iterable, queue_size)
+    thread = threading.Thread(target=producer.run, name=thread_name, daemon=True)
+    thread.start()
+    try:
+        yield from producer.iter_items()
+    finally:
+        producer.stop()
+        thread.join()
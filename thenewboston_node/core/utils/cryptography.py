@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from hashlib import sha3_256
 from typing import NamedTuple
 
@@ -21,6 +22,12 @@ def derive_verify_key(signing_key: str):
     return bytes_to_hex(SigningKey(hex_to_bytes(signing_key)).verify_key)
 
 
+@lru_cache(maxsize=1024)
+def get_verify_key(verify_key_bytes: bytes) -> VerifyKey:
+    # Blocks are signed by a few nodes, so verify keys are reused a lot
+    return VerifyKey(verify_key_bytes)
+
+
 def is_signature_valid(verify_key: str, message: bytes, signature: str) -> bool:
     try:
         verify_key_bytes = hex_to_bytes(verify_key)
@@ -29,7 +36,7 @@ def is_signature_valid(verify_key: str, message: bytes, signature: str) -> bool:
         return False
 
     try:
-        VerifyKey(verify_key_bytes).verify(message, signature_bytes)
+        get_verify_key(verify_key_bytes).verify(message, signature_bytes)
     except BadSignatureError:
         return False
 
@@ -13,3 +13,32 @@ def chmod_quite(path, mode):
         os.chmod(path, mode)
     except Exception:
         pass
+
+
+def write_file_atomically(path, binary_data: bytes, fsync=True):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as fo:
+        fo.write(binary_data)
+        if fsync:
+            fo.flush()
+            os.fsync(fo.fileno())
+
+    os.replace(tmp_path, path)
+
+
+def truncate_incomplete_tail(fo, size):
+    # Drop a partially written trailing record (if any) of an append-only file
+    if os.fstat(fo.fileno()).st_size > size:
+        fo.truncate(size)
+
+
+def fsync_file(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)